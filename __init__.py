@@ -0,0 +1,23 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''A library that auto-generates docstrings for Python source-code.
+
+Importing this package is meant to be fast. Styles, blocks and the default
+registry presets are only imported the first time that they are needed.
+
+'''
+
+# IMPORT LOCAL LIBRARIES
+from .config.context import create_context
+from .config.context import Context
+from .config.environment import register_code_style
+from .config.environment import get_all_style_info
+from .defaults.registry import deregister_all
+from .defaults.registry import register
+
+
+register_code_style('epydoc', '.styles.epydoc.EpydocStyle')
+register_code_style('google', '.styles.google.GoogleStyle')
+register_code_style('numpy', '.styles.numpy.NumpyStyle')
+register_code_style('sphinx', '.styles.sphinx.SphinxStyle')
@@ -0,0 +1,432 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''Create docstrings in worker threads, without blocking the caller.
+
+Every request runs in a pool of threads and gives back a :class:`Future`
+right away. Requests can be tagged with a "buffer" (any hashable name, like
+the path of the file being edited). When a buffer sends a newer request, any
+older request of that buffer that is still in-flight is cancelled so that it
+stops competing for the CPU.
+
+To await docstrings from an asyncio event loop, see
+:mod:`auto_docstring.asyncio_builder`.
+
+Example:
+    >>> from auto_docstring import async_builder
+    >>> future = async_builder.create_docstring(code, row=10, buffer='foo.py')
+    >>> docstring = future.result()
+
+'''
+
+# IMPORT STANDARD LIBRARIES
+import multiprocessing
+import threading
+import traceback
+import sys
+
+# IMPORT THIRD-PARTY LIBRARIES
+import six
+
+# IMPORT LOCAL LIBRARIES
+from .config import budget
+from . import docstring_builder
+
+
+_DEFAULT_BUILDER = None
+
+# The item which tells a worker thread to stop
+_STOP = object()
+
+_PENDING = 'pending'
+_RUNNING = 'running'
+_CANCELLED = 'cancelled'
+_FINISHED = 'finished'
+
+
+class Timeout(Exception):
+
+    '''An exception that is raised if a request did not finish in time.'''
+
+    pass
+
+
+class Future(object):
+
+    '''The output of a docstring request that runs in a worker thread.'''
+
+    def __init__(self):
+        '''Start as a request which has not run yet.'''
+        super(Future, self).__init__()
+
+        self._condition = threading.Condition()
+        # Once set, the work stops at its next stage
+        self._event = threading.Event()
+        self._state = _PENDING
+        self._result = None
+        self._exc_info = None
+        self._callbacks = []
+
+    def cancel(self):
+        '''Stop this request.
+
+        A request that has not started yet is cancelled at once. A running
+        request stops at its next stage and is cancelled, then.
+
+        Returns:
+            bool: If the request will not give a docstring. False if it already finished.
+
+        '''
+        with self._condition:
+            if self._state == _FINISHED:
+                return False
+
+            self._event.set()
+
+            if self._state != _PENDING:
+                return True
+
+            self._state = _CANCELLED
+            self._condition.notify_all()
+
+        self._call_callbacks()
+
+        return True
+
+    def cancelled(self):
+        '''bool: If this request was stopped before it could finish.'''
+        return self._state == _CANCELLED
+
+    def done(self):
+        '''bool: If this request finished or was cancelled.'''
+        return self._state in (_CANCELLED, _FINISHED)
+
+    def result(self, timeout=None):
+        '''Wait for this request to finish and get its docstring.
+
+        Args:
+            timeout (:obj:`float`, optional):
+                The number of seconds to wait. If no time is given,
+                wait until the request finishes.
+
+        Raises:
+            :class:`auto_docstring.config.budget.Cancelled`: If the request was cancelled.
+            Timeout: If the request didn't finish in time.
+            Exception: Any error that the request raised.
+
+        Returns:
+            str: The created docstring.
+
+        '''
+        with self._condition:
+            if timeout is None:
+                while not self.done():
+                    self._condition.wait()
+            elif not self.done():
+                self._condition.wait(timeout)
+
+            if not self.done():
+                raise Timeout('The docstring did not finish in "{}" seconds.'.format(timeout))
+
+        if self._state == _CANCELLED:
+            raise budget.Cancelled('This docstring was cancelled.')
+
+        if self._exc_info is not None:
+            six.reraise(*self._exc_info)
+
+        return self._result
+
+    def add_done_callback(self, function):
+        '''Call `function` with this instance once the request is done.
+
+        If the request is already done, `function` is called right away.
+        Otherwise, it is called from the thread that finishes the request.
+
+        Args:
+            function (callable[:class:`Future`]): The function to call.
+
+        '''
+        with self._condition:
+            if not self.done():
+                self._callbacks.append(function)
+                return
+
+        function(self)
+
+    def _set_running(self):
+        '''bool: Mark this request as started, unless it was cancelled.'''
+        with self._condition:
+            if self._state != _PENDING:
+                return False
+
+            self._state = _RUNNING
+
+            return True
+
+    def _set_output(self, result=None, exc_info=None):
+        '''Store the output of the request and wake up everything that waits for it.
+
+        If the request was cancelled while it ran, the output is thrown away.
+
+        Args:
+            result (:obj:`str`, optional): The created docstring.
+            exc_info (:obj:`tuple`, optional): The error that the request raised, if any.
+
+        '''
+        with self._condition:
+            if self._event.is_set():
+                self._state = _CANCELLED
+            else:
+                self._state = _FINISHED
+                self._result = result
+                self._exc_info = exc_info
+
+            self._condition.notify_all()
+
+        self._call_callbacks()
+
+    def _call_callbacks(self):
+        '''Call every function that was given to :meth:`add_done_callback`.'''
+        with self._condition:
+            callbacks, self._callbacks = self._callbacks, []
+
+        for function in callbacks:
+            try:
+                function(self)
+            except Exception:  # pylint: disable=broad-except
+                # One broken callback shouldn't stop the others or the worker thread
+                traceback.print_exc()
+
+
+class AsyncDocstringBuilder(object):
+
+    '''Run docstring requests in worker threads and cancel superseded requests.'''
+
+    def __init__(self, max_workers=None):
+        '''Prepare the threads that every request will run in.
+
+        Threads are only started once requests need them.
+
+        Args:
+            max_workers (:obj:`int`, optional):
+                The greatest number of requests to run at once.
+                If no number is given, one per CPU is used.
+
+        '''
+        super(AsyncDocstringBuilder, self).__init__()
+
+        self._max_workers = max_workers or multiprocessing.cpu_count()
+        self._queue = six.moves.queue.Queue()
+        self._threads = []
+        self._lock = threading.Lock()
+        self._pending = dict()
+        self._is_shut_down = False
+
+    def cancel(self, buffer):
+        '''Stop the in-flight request of the given `buffer`, if there is one.
+
+        Args:
+            buffer (hashable): The name of the buffer to cancel.
+
+        Returns:
+            bool: If a request was cancelled.
+
+        '''
+        with self._lock:
+            future = self._pending.pop(buffer, None)
+
+        if future is None:
+            return False
+
+        return future.cancel()
+
+    def _work(self):
+        '''Run requests until the builder shuts down.'''
+        while True:
+            item = self._queue.get()
+
+            if item is _STOP:
+                return
+
+            future, buffer, function, args, kwargs = item
+
+            try:
+                self._run(future, function, args, kwargs)
+            finally:
+                self._finish(buffer, future)
+
+    @staticmethod
+    def _run(future, function, args, kwargs):
+        '''Call `function` and store its output in `future`, unless it was cancelled.
+
+        Args:
+            future (:class:`Future`): The request to run.
+            function (callable): The docstring function to run.
+            args (tuple): The positional arguments for `function`.
+            kwargs (dict): The keyword arguments for `function`.
+
+        '''
+        if not future._set_running():  # pylint: disable=protected-access
+            return
+
+        with budget.limit(event=future._event):  # pylint: disable=protected-access
+            try:
+                output = function(*args, **kwargs)
+            except budget.Cancelled:
+                output = None
+            except Exception:  # pylint: disable=broad-except
+                future._set_output(exc_info=sys.exc_info())  # pylint: disable=protected-access
+                return
+
+        future._set_output(output)  # pylint: disable=protected-access
+
+    def _finish(self, buffer, future):
+        '''Forget the given request, unless a newer one replaced it already.'''
+        if buffer is None:
+            return
+
+        with self._lock:
+            if self._pending.get(buffer) is future:
+                del self._pending[buffer]
+
+    def _submit(self, function, buffer, *args, **kwargs):
+        '''Run `function` in a worker thread.
+
+        Args:
+            function (callable): The docstring function to run.
+            buffer (hashable or NoneType): The name of the buffer of this request.
+            *args (tuple): The positional arguments for `function`.
+            **kwargs (dict): The keyword arguments for `function`.
+
+        Raises:
+            RuntimeError: If :meth:`shutdown` was already called.
+
+        Returns:
+            :class:`Future`: The request. It is cancelled if a newer request for
+                the same `buffer` is made while it runs or if :meth:`cancel` is called.
+
+        '''
+        future = Future()
+        previous = None
+
+        with self._lock:
+            if self._is_shut_down:
+                raise RuntimeError('No docstrings can be created after shutdown.')
+
+            if buffer is not None:
+                previous = self._pending.get(buffer)
+                self._pending[buffer] = future
+
+            self._queue.put((future, buffer, function, args, kwargs))
+
+            if len(self._threads) < self._max_workers:
+                thread = threading.Thread(target=self._work)
+                thread.daemon = True
+                thread.start()
+                self._threads.append(thread)
+
+        if previous is not None:
+            previous.cancel()
+
+        return future
+
+    def create_docstring(self, code, row, style='', wrap=False, buffer=None, **kwargs):
+        '''Create a docstring, using :func:`auto_docstring.docstring_builder.create_docstring`.
+
+        Args:
+            code (str): The Python source code to create a docstring for.
+            row (int): The 0-based row of the function to create a docstring for.
+            style (:obj:`str`, optional): The name of the docstring style to create.
+            wrap (:obj:`bool`, optional): If True, add `"""` around the docstring.
+            buffer (:obj:`hashable`, optional):
+                The name of the buffer that `code` comes from. If given, a
+                newer request for the same buffer cancels this one.
+            **kwargs (dict): Any other option, like "session" or "deadline".
+
+        Returns:
+            :class:`Future`: The request. Its result is the auto-generated docstring.
+
+        '''
+        return self._submit(
+            docstring_builder.create_docstring, buffer, code, row, style=style, wrap=wrap, **kwargs)
+
+    def create_ultisnips_docstring(self, code, row, style='', wrap=False, buffer=None, **kwargs):
+        '''Create a docstring, using :func:`auto_docstring.docstring_builder.create_ultisnips_docstring`.
+
+        Args:
+            code (str): The Python source code to create a docstring for.
+            row (int): The 0-based row of the function to create a docstring for.
+            style (:obj:`str`, optional): The name of the docstring style to create.
+            wrap (:obj:`bool`, optional): If True, add `"""` around the docstring.
+            buffer (:obj:`hashable`, optional):
+                The name of the buffer that `code` comes from. If given, a
+                newer request for the same buffer cancels this one.
+            **kwargs (dict): Any other option, like "session" or "deadline".
+
+        Returns:
+            :class:`Future`: The request. Its result is the auto-generated, UltiSnips docstring.
+
+        '''
+        return self._submit(
+            docstring_builder.create_ultisnips_docstring,
+            buffer,
+            code,
+            row,
+            style=style,
+            wrap=wrap,
+            **kwargs
+        )
+
+    def shutdown(self, wait=True):
+        '''Cancel every in-flight request and stop the worker threads.
+
+        Args:
+            wait (:obj:`bool`, optional):
+                If True, wait for any running work to finish. Default is True.
+
+        '''
+        with self._lock:
+            self._is_shut_down = True
+            futures = list(self._pending.values())
+            self._pending.clear()
+            threads = list(self._threads)
+
+        for future in futures:
+            future.cancel()
+
+        for _ in threads:
+            self._queue.put(_STOP)
+
+        if wait:
+            for thread in threads:
+                thread.join()
+
+
+def get_default_builder():
+    '''AsyncDocstringBuilder: The builder used by this module's functions.'''
+    global _DEFAULT_BUILDER  # pylint: disable=global-statement
+
+    if _DEFAULT_BUILDER is None:
+        _DEFAULT_BUILDER = AsyncDocstringBuilder()
+
+    return _DEFAULT_BUILDER
+
+
+def create_docstring(code, row, style='', wrap=False, buffer=None, **kwargs):
+    '''Create a docstring in a worker thread.
+
+    See :meth:`AsyncDocstringBuilder.create_docstring` for details.
+
+    '''
+    return get_default_builder().create_docstring(
+        code, row, style=style, wrap=wrap, buffer=buffer, **kwargs)
+
+
+def create_ultisnips_docstring(code, row, style='', wrap=False, buffer=None, **kwargs):
+    '''Create an UltiSnips docstring in a worker thread.
+
+    See :meth:`AsyncDocstringBuilder.create_ultisnips_docstring` for details.
+
+    '''
+    return get_default_builder().create_ultisnips_docstring(
+        code, row, style=style, wrap=wrap, buffer=buffer, **kwargs)
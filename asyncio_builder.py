@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''Await docstrings from an asyncio event loop without blocking it.
+
+Each request runs in the worker threads of :mod:`auto_docstring.async_builder`
+and gives back an :class:`asyncio.Future`. Cancelling the asyncio future also
+stops the work in its thread.
+
+Note:
+    This module requires Python 3.5+. Use :mod:`auto_docstring.async_builder`
+    directly on older versions.
+
+Example:
+    >>> from auto_docstring import asyncio_builder
+    >>> docstring = await asyncio_builder.create_docstring(code, row=10, buffer='foo.py')
+
+'''
+
+# IMPORT STANDARD LIBRARIES
+import sys
+
+if sys.version_info < (3, 5):
+    raise ImportError('auto_docstring.asyncio_builder requires Python 3.5+.')
+
+import asyncio  # pylint: disable=wrong-import-position
+
+# IMPORT LOCAL LIBRARIES
+from . import async_builder  # pylint: disable=wrong-import-position
+
+
+def wrap_future(future, loop=None):
+    '''Get an asyncio future which finishes once the given `future` is done.
+
+    Args:
+        future (:class:`auto_docstring.async_builder.Future`): The request to wait for.
+        loop (:class:`asyncio.AbstractEventLoop`, optional):
+            The loop that will await the request. If no loop is given,
+            the current event loop is used.
+
+    Returns:
+        :class:`asyncio.Future`:
+            The future to await. If it's cancelled, `future` is cancelled, too.
+
+    '''
+    if loop is None:
+        loop = asyncio.get_event_loop()
+
+    output = loop.create_future()
+
+    def _copy(done):
+        '''Send the output of the finished request back to the loop.'''
+        if output.done():
+            return
+
+        if done.cancelled():
+            output.cancel()
+            return
+
+        try:
+            output.set_result(done.result())
+        except Exception as error:  # pylint: disable=broad-except
+            output.set_exception(error)
+
+    def _copy_threadsafe(done):
+        '''Schedule :func:`_copy` from the thread that finished the request.'''
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(_copy, done)
+
+    def _cancel(awaited):
+        '''Stop the request once the caller stops waiting for it.'''
+        if awaited.cancelled():
+            future.cancel()
+
+    output.add_done_callback(_cancel)
+    future.add_done_callback(_copy_threadsafe)
+
+    return output
+
+
+def create_docstring(code, row, style='', wrap=False, buffer=None, loop=None, **kwargs):
+    '''Create a docstring without blocking the event loop.
+
+    See :meth:`auto_docstring.async_builder.AsyncDocstringBuilder.create_docstring`
+    for details.
+
+    Returns:
+        :class:`asyncio.Future`: The auto-generated docstring, once it's done.
+
+    '''
+    future = async_builder.create_docstring(
+        code, row, style=style, wrap=wrap, buffer=buffer, **kwargs)
+
+    return wrap_future(future, loop=loop)
+
+
+def create_ultisnips_docstring(code, row, style='', wrap=False, buffer=None, loop=None, **kwargs):
+    '''Create an UltiSnips docstring without blocking the event loop.
+
+    See :meth:`auto_docstring.async_builder.AsyncDocstringBuilder.create_ultisnips_docstring`
+    for details.
+
+    Returns:
+        :class:`asyncio.Future`: The auto-generated, UltiSnips docstring, once it's done.
+
+    '''
+    future = async_builder.create_ultisnips_docstring(
+        code, row, style=style, wrap=wrap, buffer=buffer, **kwargs)
+
+    return wrap_future(future, loop=loop)
@@ -0,0 +1,354 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''A command-line tool that adds docstrings to every function in a project.
+
+Every Python file found in the given paths is parsed and every function
+that has no docstring gets an auto-generated one. Files are spread across
+a pool of processes and the results are printed as soon as each file is done.
+
+Example:
+    >>> python -m auto_docstring.backfill some/package --format diff > docs.patch
+
+Note:
+    The generated docstrings keep their auto_docstring markers, like "{1!f}",
+    so that they can be filled in later.
+
+'''
+
+# IMPORT STANDARD LIBRARIES
+import multiprocessing
+import argparse
+import difflib
+import json
+import sys
+import os
+
+# IMPORT THIRD-PARTY LIBRARIES
+import astroid
+
+# IMPORT LOCAL LIBRARIES
+from .blocks.google import common_type
+from . import docstring_builder
+
+
+_FORMATS = ('json', 'diff')
+
+
+def _get_python_files(paths):
+    '''Find every Python file in the given paths.
+
+    Args:
+        paths (iter[str]): The files and folders to search through.
+
+    Yields:
+        str: The absolute path to each found Python file.
+
+    '''
+    for path in paths:
+        path = os.path.abspath(path)
+
+        if os.path.isfile(path):
+            yield path
+            continue
+
+        for root, folders, files in os.walk(path):
+            folders[:] = sorted(folder for folder in folders if not folder.startswith('.'))
+
+            for name in sorted(files):
+                if name.endswith('.py'):
+                    yield os.path.join(root, name)
+
+
+def _starts_on_its_own_line(node, lines):
+    '''bool: If the given `node` is the first text on its line.'''
+    line = lines[node.fromlineno - 1]
+    return not line[:node.col_offset].strip()
+
+
+def get_missing_docstring_functions(module, lines):
+    '''Find every function in the given `module` that needs a docstring.
+
+    One-line functions, like "def foo(): pass", are skipped because there
+    is nowhere to put their docstring.
+
+    Args:
+        module (`astroid.Module`): The parsed code to search through.
+        lines (list[str]): The lines of code that `module` was parsed from.
+
+    Returns:
+        list[`astroid.FunctionDef`]: The found functions, in the order they were written.
+
+    '''
+    functions = []
+
+    for function in module.nodes_of_class(astroid.FunctionDef):
+        if function.doc is not None or not function.body:
+            continue
+
+        if not _starts_on_its_own_line(function.body[0], lines):
+            continue
+
+        functions.append(function)
+
+    return sorted(functions, key=lambda function: function.body[0].fromlineno)
+
+
+def _indent_docstring(docstring, indent):
+    '''Add `indent` to every non-empty line of the given `docstring`.
+
+    Args:
+        docstring (str): The text to indent.
+        indent (str): The whitespace to add to the beginning of each line.
+
+    Returns:
+        list[str]: The indented lines.
+
+    '''
+    return [indent + line if line.strip() else '' for line in docstring.split('\n')]
+
+
+def process_file(path, style=''):
+    '''Create a docstring for every function in `path` which does not have one.
+
+    Args:
+        path (str): The absolute path to a Python file.
+        style (:obj:`str`, optional):
+            The style to use to create the docstrings. If no style is given,
+            the user's default style is used.
+
+    Returns:
+        dict[str]: The results for this file.
+            "path" (str): The given `path`.
+            "lines" (list[str]): The lines of code in `path`.
+            "functions" (list[dict[str]]): Each function and its docstring.
+                Functions that failed have an "error" key and no "docstring" key.
+                Functions whose return-types could not be inferred ahead of
+                time have a "resolve_error" key.
+            "error" (str): This key only exists if `path` could not be parsed
+                or its functions' return-types could not be resolved.
+
+    '''
+    output = {'path': path, 'lines': [], 'functions': []}
+
+    try:
+        with open(path, 'r') as handler:
+            code = handler.read()
+
+        session = docstring_builder.DocstringSession()
+        module = session.get_module(code)
+
+        # Find the types of functions which call each other once, instead of once per docstring
+        resolve_errors = common_type.resolve_local_return_types(module)
+    except Exception as error:  # pylint: disable=broad-except
+        output['error'] = str(error)
+        return output
+
+    lines = code.split('\n')
+    output['lines'] = lines
+
+    for function in get_missing_docstring_functions(module, lines):
+        first_node = function.body[0]
+        info = {
+            'name': function.name,
+            'row': function.lineno,
+            'insert_row': first_node.fromlineno - 1,
+            'indent': lines[first_node.fromlineno - 1][:first_node.col_offset],
+        }
+
+        if function in resolve_errors:
+            info['resolve_error'] = resolve_errors[function]
+
+        try:
+            info['docstring'] = docstring_builder.create_docstring(
+                code, function.lineno, style=style, wrap=True, session=session)
+        except Exception as error:  # pylint: disable=broad-except
+            info['error'] = str(error)
+
+        output['functions'].append(info)
+
+    return output
+
+
+def _process_file_job(job):
+    '''Run :func:`process_file` with a (path, style) pair from a process pool.'''
+    return process_file(*job)
+
+
+def make_json_lines(result):
+    '''Create one JSON line for every function in the given `result`.
+
+    Args:
+        result (dict[str]): The output of :func:`process_file`.
+
+    Returns:
+        list[str]: The created JSON lines.
+
+    '''
+    if 'error' in result:
+        return [json.dumps({'path': result['path'], 'error': result['error']})]
+
+    output = []
+    for function in result['functions']:
+        line = {'path': result['path'], 'function': function['name'], 'row': function['row']}
+
+        if 'error' in function:
+            line['error'] = function['error']
+        else:
+            line['docstring'] = function['docstring']
+
+        if 'resolve_error' in function:
+            line['resolve_error'] = function['resolve_error']
+
+        output.append(json.dumps(line, sort_keys=True))
+
+    return output
+
+
+def make_diff(result, root=''):
+    '''Create a unified diff which adds every docstring in the given `result`.
+
+    Args:
+        result (dict[str]): The output of :func:`process_file`.
+        root (:obj:`str`, optional):
+            If given, the paths in the diff are written relative to this folder.
+
+    Returns:
+        str: The unified diff. If there are no docstrings, return an empty string.
+
+    '''
+    original = '\n'.join(result['lines']).splitlines(True)
+    modified = list(original)
+
+    # Insert from the bottom of the file up, so that earlier rows stay valid
+    functions = [function for function in result['functions'] if 'docstring' in function]
+    for function in reversed(functions):
+        lines = _indent_docstring(function['docstring'], function['indent'])
+        modified[function['insert_row']:function['insert_row']] = [line + '\n' for line in lines]
+
+    if modified == original:
+        return ''
+
+    path = result['path']
+    if root:
+        path = os.path.relpath(path, root)
+    path = path.replace(os.sep, '/')
+
+    output = []
+    for line in difflib.unified_diff(original, modified, fromfile='a/' + path, tofile='b/' + path):
+        output.append(line)
+
+        if not line.endswith('\n'):
+            output.append('\n\\ No newline at end of file\n')
+
+    return ''.join(output)
+
+
+def backfill(paths, style='', output_format='json', jobs=0, stream=sys.stdout):
+    '''Create docstrings for every function that needs one in the given `paths`.
+
+    Args:
+        paths (iter[str]): The files and folders to search through.
+        style (:obj:`str`, optional):
+            The style to use to create the docstrings. If no style is given,
+            the user's default style is used.
+        output_format (:obj:`str`, optional):
+            "json" - Write one JSON object per-function.
+            "diff" - Write a unified diff which adds the docstrings.
+        jobs (:obj:`int`, optional):
+            The number of processes to use. If 0, one process is used for
+            each CPU. If 1, every file is processed in the current process.
+        stream (:obj:`file`, optional):
+            The object to write results to. Default: `sys.stdout`.
+
+    Raises:
+        ValueError: If the given `output_format` is invalid.
+
+    '''
+    if output_format not in _FORMATS:
+        raise ValueError('Format: "{output_format}" is unsupported. Options were, "{options}".'
+                         ''.format(output_format=output_format, options=_FORMATS))
+
+    root = os.getcwd()
+    files = [(path, style) for path in _get_python_files(paths)]
+
+    if not jobs:
+        jobs = multiprocessing.cpu_count()
+
+    pool = None
+    if jobs == 1 or len(files) < 2:
+        results = (_process_file_job(job) for job in files)
+    else:
+        pool = multiprocessing.Pool(processes=jobs)
+        results = pool.imap(_process_file_job, files, chunksize=1)
+
+    try:
+        for result in results:
+            if output_format == 'json':
+                for line in make_json_lines(result):
+                    stream.write(line + '\n')
+            else:
+                stream.write(make_diff(result, root=root))
+
+            stream.flush()
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+
+def _parse_arguments(args):
+    '''Read the command-line arguments of this module.
+
+    Args:
+        args (list[str]): The command-line arguments to parse.
+
+    Returns:
+        `argparse.Namespace`: The parsed arguments.
+
+    '''
+    parser = argparse.ArgumentParser(
+        description='Add auto-generated docstrings to every function that does not have one.')
+
+    parser.add_argument('paths', nargs='+', help='The Python files or folders to search through.')
+    parser.add_argument('-s', '--style', default='', help='The docstring style to use.')
+    parser.add_argument(
+        '-f',
+        '--format',
+        default='json',
+        choices=_FORMATS,
+        help='Write each docstring as JSON or as a unified diff.',
+    )
+    parser.add_argument(
+        '-j',
+        '--jobs',
+        default=0,
+        type=int,
+        help='The number of processes to use. Default: one per-CPU.',
+    )
+
+    return parser.parse_args(args)
+
+
+def main(args=None):
+    '''Run the command-line tool.
+
+    Args:
+        args (:obj:`list[str]`, optional):
+            The command-line arguments. If nothing is given, `sys.argv` is used.
+
+    '''
+    if args is None:
+        args = sys.argv[1:]
+
+    arguments = _parse_arguments(args)
+    backfill(
+        arguments.paths,
+        style=arguments.style,
+        output_format=arguments.format,
+        jobs=arguments.jobs,
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+# The functions in this file come from docs_to_fix.md.
+# They are only parsed by the benchmarks and are never imported.
+
+import itertools
+import os
+
+import six
+
+
+HIERARCHY_SEP = '/'
+
+
+class Context(object):
+    def get_required_tokens(self):
+        full_mapping_details = self.get_all_mapping_details()
+        required_tokens = []
+
+        for key, info in full_mapping_details.items():
+            if info.get('required', True) and key not in required_tokens:
+                required_tokens.append(key)
+
+        return required_tokens
+
+    def get_child_tokens(self, token):
+        mapping_details = self.get_all_mapping_details()
+
+        try:
+            mapping = mapping_details[token].get('mapping', '')
+        except KeyError:
+            return []
+
+        if mapping:
+            return find_tokens(mapping)
+
+        return []
+
+
+def join_path():
+    return os.path.join('asdfd')
+
+
+def split_into_parts(obj, split, as_type=tuple):
+    obj = check.force_itertype(obj)
+    obj = (part.strip() for obj_ in obj for part in obj_.split(split))
+    return as_type(part for part in obj if part)
+
+
+def split_hierarchy(obj, as_type=tuple):
+    try:
+        if obj[0] == HIERARCHY_SEP:
+            items = itertools.chain(
+                [HIERARCHY_SEP], split_into_parts(obj, split=HIERARCHY_SEP, as_type=list))
+            return tuple(items)
+    except IndexError:
+        pass
+
+    return split_into_parts(obj, split=HIERARCHY_SEP, as_type=as_type)
+
+
+def import_object(name):
+    components = name.split('.')
+    module = __import__(components[0])
+    for comp in components[1:]:
+        module = getattr(module, comp)
+    return module
+
+
+def decode(obj):
+    return conform_decode(six.moves.urllib.parse.parse_qs(obj))
+
+
+def conform_decode(info):
+    return {key: value[0] if len(value) == 1 else value
+            for key, value in six.iteritems(info)}
+
+
+def encode(obj):
+    return six.moves.urllib.parse.urlencode(obj, doseq=True)
+
+
+def make_container_label(container, items_text):
+    if items_text:
+        return '{container}[{items_text}]'.format(
+            container=container, items_text=items_text)
+
+    return container
+
+
+def bar(thing=False):
+    if thing:
+        return ''
+    return 8
+
+
+def foo():
+    return bar()
+
+
+def get_default_indent():
+    return os.getenv('AUTO_DOCSTRING_INDENT', '    ')
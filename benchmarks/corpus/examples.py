@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+# The functions in this file come from tests/google/test_example.py.
+# They are only parsed by the benchmarks and are never imported.
+
+import os
+import re
+import sys
+
+
+def get_max_index(combo, idfun=None):
+    if idfun is None:
+        def _idfun(text):
+            return int(text)
+
+        idfun = _idfun
+
+    highest_value = None
+    index = -1
+    for index in six.moves.range(combo.count()):
+        text = combo.itemText(index)
+        compare_object = idfun(text)
+        if highest_value is None or compare_object > idfun(highest_value):
+            highest_value = text
+            index = index
+
+    return index
+
+
+def dirgrep(obj, keyPhrase='', case=True, stdout=True):
+    flags = 0
+
+    if case:
+        flags = re.IGNORECASE
+
+    output = []
+    for x in dir(obj):
+        if re.search(keyPhrase, x, flags=flags):
+            output.append(x)
+
+    if stdout:
+        for x in output:
+            sys.stdout.write(x)
+    return output
+
+
+def delete_ui_if_exists(*uis):
+    def actual_decorator(func):
+        def wrapped_func(*args):
+            for ui in uis:
+                try:
+                    pm.deleteUI(ui)
+                except RuntimeError:
+                    pass
+
+            return func(*args)
+        return wrapped_func
+    return actual_decorator
+
+
+def which(program):
+    pathExt = ['']
+    extList = None
+
+    if sys.platform == 'win32':
+        extList = [ext.lower() for ext in os.environ['PATHEXT'].split(';')]
+
+    def is_exe(fpath):
+        exe = os.path.isfile(fpath) and os.access(fpath, os.X_OK)
+        if not exe:
+            if extList:
+                for ext in extList:
+                    exePath = '%s%s' % (fpath, ext)
+                    if os.path.isfile(exePath) and os.access(exePath, os.X_OK):
+                        pathExt[0] = ext
+                        return True
+                return False
+        return exe
+
+    fpath, fname = os.path.split(program)
+
+    if fpath:
+        if is_exe(program):
+            return '%s%s' % (program, pathExt[0])
+    else:
+        for path in os.environ['PATH'].split(os.pathsep):
+            path = path.strip('"')
+            exe_file = os.path.join(path, program)
+            if is_exe(exe_file):
+                return '%s%s' % (exe_file, pathExt[0])
+    return ''
+
+
+def get_clean_comma_sep_text(text, sep=', '):
+    text = sep.join(
+        [text_.strip() for text_ in text.split(',') if text_.strip()])
+    text = text.rstrip(',')
+    return text
+
+
+class AnotherClass(object):
+    def some_another_function(self, some_arg, another_arg):
+        pass
+
+
+def raise_messages(arg1, arg2, thing=(('asfd', 'asdfsfd'), )):
+    message = 'asdfsd'
+    if arg2:
+        raise ValueError(message)
+
+    if thing[0]:
+        raise TypeError('{ffff}bar'.format(ffff=9123))
+
+    if thing[1]:
+        raise RuntimeError('{zzzz}'.format(zzzz=9123))
+
+    if arg1:
+        raise NotImplementedError('bar{tttt}'.format(tttt=9123))
+
+    return ['asdfsdf', 'adsfafds']
+
+
+def create_ultisnips_docstring(code, row, style=''):
+    docstring = create_docstring(code, row, style=style)
+    return convert_to_ultisnips(docstring)
+
+
+def convert_to_ultisnips(code):
+    return ultisnips_build.RecursiveParser().parse(code)
+
+
+def add_numbers():
+    bar = 9
+    thing = 10
+    return bar + thing
+
+
+def generate_items(count=10):
+    for index in range(count):
+        yield index
+
+
+def empty_generator():
+    return
+    yield
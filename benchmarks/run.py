@@ -0,0 +1,416 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''Measure how fast docstrings are created, for every style.
+
+Every function in a fixed corpus of modules is given a docstring, using
+:func:`auto_docstring.docstring_builder.create_docstring` and
+:func:`auto_docstring.docstring_builder.create_ultisnips_docstring`.
+The latency of each call is recorded and summarized as percentiles.
+The time that it takes to import auto_docstring in a new Python process
+is measured and summarized the same way.
+
+The results can be saved as a baseline and later runs are compared against
+it, so that slow-downs are caught before a release.
+
+Example:
+    >>> python -m auto_docstring.benchmarks.run --save-baseline
+    >>> # ... make some changes ...
+    >>> python -m auto_docstring.benchmarks.run  # Exits with 1 if something got slower or failed
+
+'''
+
+# IMPORT STANDARD LIBRARIES
+import subprocess
+import argparse
+import timeit
+import json
+import sys
+import os
+
+# IMPORT THIRD-PARTY LIBRARIES
+import astroid
+import six
+
+# IMPORT LOCAL LIBRARIES
+from .. import docstring_builder
+from .. import result_cache
+from . import synthetic
+
+
+_CURRENT_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+_CORPUS_DIRECTORY = os.path.join(_CURRENT_DIRECTORY, 'corpus')
+_DEFAULT_BASELINE = os.path.join(_CURRENT_DIRECTORY, 'baseline.json')
+
+STYLES = ('google', 'numpy', 'sphinx', 'epydoc')
+FUNCTIONS = {
+    'create_docstring': docstring_builder.create_docstring,
+    'create_ultisnips_docstring': docstring_builder.create_ultisnips_docstring,
+}
+
+# The synthetic module sizes, in number of functions or classes
+_SYNTHETIC_SIZES = (100, 1000)
+
+# The statistics that are compared against the baseline
+_COMPARED_STATS = ('p50', 'p90')
+
+_PACKAGE = docstring_builder.__name__.rpartition('.')[0]
+IMPORT_KEY = 'import/{package}'.format(package=_PACKAGE)
+
+# The number of new Python processes to import the package in, per repeat
+_IMPORT_SAMPLES = 10
+
+_IMPORT_SCRIPT = '''\
+import timeit
+import sys
+
+start = timeit.default_timer()
+import {package}
+sys.stdout.write(repr(timeit.default_timer() - start))
+'''
+
+
+def get_corpus():
+    '''Get every module that will be benchmarked.
+
+    Returns:
+        list[tuple[str, str]]: The name and code of each module.
+
+    '''
+    corpus = []
+
+    for name in sorted(os.listdir(_CORPUS_DIRECTORY)):
+        if not name.endswith('.py'):
+            continue
+
+        with open(os.path.join(_CORPUS_DIRECTORY, name), 'r') as handler:
+            corpus.append((name, handler.read()))
+
+    for size in _SYNTHETIC_SIZES:
+        corpus.append(('synthetic_{size}'.format(size=size), synthetic.make_module(size)))
+
+    return corpus
+
+
+def get_rows(code, max_rows=0):
+    '''Find the row of every function in the given `code`.
+
+    Args:
+        code (str):
+            The code to search through.
+        max_rows (:obj:`int`, optional):
+            If given, only this many rows are returned, spread evenly
+            over the code. If 0, every row is returned.
+
+    Returns:
+        list[int]: The found rows.
+
+    '''
+    module = astroid.parse(code)
+    rows = sorted(function.lineno for function in module.nodes_of_class(astroid.FunctionDef))
+
+    if max_rows and len(rows) > max_rows:
+        step = float(len(rows)) / max_rows
+        rows = [rows[int(index * step)] for index in six.moves.range(max_rows)]
+
+    return rows
+
+
+def get_percentile(values, percent):
+    '''Get the value at the given `percent`, using the nearest-rank method.
+
+    Args:
+        values (list[float]): The sorted values to get a percentile of.
+        percent (float): A number between 0 and 100.
+
+    Returns:
+        float: The found value. If there are no values, return 0.
+
+    '''
+    if not values:
+        return 0.0
+
+    index = int(round(percent / 100.0 * (len(values) - 1)))
+    return values[index]
+
+
+def summarize(latencies, errors=0):
+    '''Describe the given latencies with percentiles and throughput.
+
+    Args:
+        latencies (list[float]): The time of each call, in seconds.
+        errors (:obj:`int`, optional): The number of calls that failed.
+
+    Returns:
+        dict[str, float or int]: The summary of the latencies.
+
+    '''
+    latencies = sorted(latencies)
+    total = sum(latencies)
+
+    throughput = 0.0
+    if total:
+        throughput = len(latencies) / total
+
+    return {
+        'calls': len(latencies),
+        'errors': errors,
+        'p50': get_percentile(latencies, 50),
+        'p90': get_percentile(latencies, 90),
+        'p99': get_percentile(latencies, 99),
+        'max': latencies[-1] if latencies else 0.0,
+        'throughput': throughput,
+    }
+
+
+def measure(function, corpus, style, repeat=1):
+    '''Time every call of `function` for every function in the `corpus`.
+
+    Args:
+        function (callable): The docstring function to measure.
+        corpus (list[tuple[str, str, list[int]]]): The name, code and rows of each module.
+        style (str): The docstring style to create.
+        repeat (:obj:`int`, optional): The number of times to run every row.
+
+    Returns:
+        dict[str, float or int]: The summary of every call.
+
+    '''
+    latencies = []
+    errors = 0
+
+    for _ in six.moves.range(repeat):
+        for _, code, rows in corpus:
+            for row in rows:
+                # Measure the full cost of every docstring, not a cache lookup
+                result_cache.get_default_cache().clear()
+                start = timeit.default_timer()
+
+                try:
+                    function(code, row, style=style)
+                except Exception:  # pylint: disable=broad-except
+                    errors += 1
+                    continue
+
+                latencies.append(timeit.default_timer() - start)
+
+    return summarize(latencies, errors=errors)
+
+
+def measure_import(repeat=1):
+    '''Time how long it takes to import the package in a new Python process.
+
+    Only the import is timed, not the start-up of the process.
+
+    Args:
+        repeat (:obj:`int`, optional): The number of processes to import the package in.
+
+    Returns:
+        dict[str, float or int]: The summary of every import.
+
+    '''
+    root = os.path.dirname(os.path.dirname(_CURRENT_DIRECTORY))
+    environment = dict(os.environ)
+    environment['PYTHONPATH'] = os.pathsep.join([root] + sys.path)
+    script = _IMPORT_SCRIPT.format(package=_PACKAGE)
+
+    latencies = []
+    errors = 0
+
+    for _ in six.moves.range(repeat):
+        try:
+            output = subprocess.check_output([sys.executable, '-c', script], env=environment)
+        except subprocess.CalledProcessError:
+            errors += 1
+            continue
+
+        latencies.append(float(output.decode('utf-8')))
+
+    return summarize(latencies, errors=errors)
+
+
+def run(styles=STYLES, repeat=1, max_rows=50):
+    '''Benchmark every docstring function for every one of the given `styles`.
+
+    The import time of the package is benchmarked, too.
+
+    Args:
+        styles (:obj:`iter[str]`, optional): The docstring styles to create.
+        repeat (:obj:`int`, optional): The number of times to run every row.
+        max_rows (:obj:`int`, optional): The most rows to use, per-module.
+
+    Returns:
+        dict[str, dict[str, float or int]]:
+            Each "style/function" pair and the summary of its calls.
+            The summary of the imports is stored under :data:`IMPORT_KEY`.
+
+    '''
+    corpus = [(name, code, get_rows(code, max_rows=max_rows)) for name, code in get_corpus()]
+    results = {IMPORT_KEY: measure_import(repeat=repeat * _IMPORT_SAMPLES)}
+
+    for style in styles:
+        for name, function in sorted(six.iteritems(FUNCTIONS)):
+            key = '{style}/{name}'.format(style=style, name=name)
+            results[key] = measure(function, corpus, style, repeat=repeat)
+
+    return results
+
+
+def compare(results, baseline, tolerance=0.2, throughput_tolerance=0.2):
+    '''Find every result that got slower than its baseline.
+
+    Args:
+        results (dict[str, dict[str, float or int]]): The output of :func:`run`.
+        baseline (dict[str, dict[str, float or int]]): An earlier output of :func:`run`.
+        tolerance (:obj:`float`, optional):
+            How much slower, as a fraction, a latency may be before it counts
+            as a regression. Default: 0.2 (20%).
+        throughput_tolerance (:obj:`float`, optional):
+            How much lower, as a fraction, the throughput may be before it
+            counts as a regression. Default: 0.2 (20%).
+
+    Returns:
+        list[str]: A message for each regression. Any failed call counts as a regression.
+
+    '''
+    regressions = []
+
+    for key, summary in sorted(six.iteritems(results)):
+        # A benchmark whose calls fail has fewer (or no) latencies, which looks faster
+        if summary.get('errors'):
+            regressions.append(
+                '{key}: {errors} calls failed'.format(key=key, errors=summary['errors']))
+
+        try:
+            expected = baseline[key]
+        except KeyError:
+            continue
+
+        for stat in _COMPARED_STATS:
+            limit = expected[stat] * (1 + tolerance)
+
+            if summary[stat] > limit:
+                regressions.append(
+                    '{key} {stat}: {value:.6f}s is slower than the baseline {expected:.6f}s'
+                    ''.format(key=key, stat=stat, value=summary[stat], expected=expected[stat]))
+
+        if summary['throughput'] < expected['throughput'] * (1 - throughput_tolerance):
+            regressions.append(
+                '{key} throughput: {value:.1f} calls/sec is lower than the baseline '
+                '{expected:.1f} calls/sec'.format(
+                    key=key, value=summary['throughput'], expected=expected['throughput']))
+
+    return regressions
+
+
+def make_report(results):
+    '''str: Create a readable table of the given `results`.'''
+    lines = ['{:<40} {:>7} {:>7} {:>10} {:>10} {:>10} {:>10} {:>12}'.format(
+        'benchmark', 'calls', 'errors', 'p50 (ms)', 'p90 (ms)', 'p99 (ms)', 'max (ms)', 'calls/sec')]
+
+    for key, summary in sorted(six.iteritems(results)):
+        lines.append('{:<40} {:>7} {:>7} {:>10.3f} {:>10.3f} {:>10.3f} {:>10.3f} {:>12.1f}'.format(
+            key,
+            summary['calls'],
+            summary['errors'],
+            summary['p50'] * 1000,
+            summary['p90'] * 1000,
+            summary['p99'] * 1000,
+            summary['max'] * 1000,
+            summary['throughput'],
+        ))
+
+    return '\n'.join(lines)
+
+
+def _parse_arguments(args):
+    '''Read the command-line arguments of this module.
+
+    Args:
+        args (list[str]): The command-line arguments to parse.
+
+    Returns:
+        `argparse.Namespace`: The parsed arguments.
+
+    '''
+    parser = argparse.ArgumentParser(description='Measure how fast docstrings are created.')
+    parser.add_argument('--baseline', default=_DEFAULT_BASELINE, help='The baseline JSON file.')
+    parser.add_argument(
+        '--save-baseline',
+        action='store_true',
+        help='Write the results to the baseline file instead of comparing against it.',
+    )
+    parser.add_argument(
+        '--tolerance',
+        default=0.2,
+        type=float,
+        help='How much slower, as a fraction, a latency may be than its baseline.',
+    )
+    parser.add_argument(
+        '--throughput-tolerance',
+        default=0.2,
+        type=float,
+        help='How much lower, as a fraction, a throughput may be than its baseline.',
+    )
+    parser.add_argument('--styles', nargs='+', default=list(STYLES), help='The styles to run.')
+    parser.add_argument('--repeat', default=3, type=int, help='The number of times to run every row.')
+    parser.add_argument('--max-rows', default=50, type=int, help='The most rows to use, per-module.')
+
+    return parser.parse_args(args)
+
+
+def main(args=None):
+    '''Run the benchmarks and compare them against the baseline.
+
+    Args:
+        args (:obj:`list[str]`, optional):
+            The command-line arguments. If nothing is given, `sys.argv` is used.
+
+    Returns:
+        int:
+            1 if any benchmark got slower than its baseline, failed or if
+            there is no baseline to compare against. Otherwise, 0.
+
+    '''
+    if args is None:
+        args = sys.argv[1:]
+
+    arguments = _parse_arguments(args)
+
+    # Fail before spending minutes on benchmarks that can't be compared to anything
+    if not arguments.save_baseline and not os.path.isfile(arguments.baseline):
+        sys.stderr.write('No baseline found at "{path}". Run with --save-baseline to create one.\n'
+                         ''.format(path=arguments.baseline))
+        return 1
+
+    results = run(styles=arguments.styles, repeat=arguments.repeat, max_rows=arguments.max_rows)
+    print(make_report(results))
+
+    if arguments.save_baseline:
+        with open(arguments.baseline, 'w') as handler:
+            json.dump(results, handler, indent=4, sort_keys=True)
+
+        print('Saved baseline to "{path}".'.format(path=arguments.baseline))
+        return 0
+
+    with open(arguments.baseline, 'r') as handler:
+        baseline = json.load(handler)
+
+    regressions = compare(
+        results,
+        baseline,
+        tolerance=arguments.tolerance,
+        throughput_tolerance=arguments.throughput_tolerance,
+    )
+
+    for regression in regressions:
+        print(regression)
+
+    if regressions:
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
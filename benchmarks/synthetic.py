@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''Create large, realistic Python modules for the benchmarks to parse.
+
+The modules are built from a fixed set of function templates, so the same
+arguments always create the same code.
+
+'''
+
+# IMPORT STANDARD LIBRARIES
+import textwrap
+
+
+_HEADER = '''\
+import collections
+import os
+import textwrap
+
+
+'''
+
+_TEMPLATES = (
+    '''\
+    def plain_{index}(first, second):
+        if first:
+            return first
+        return second
+    ''',
+    '''\
+    def defaults_{index}(name, value=8, items=(['a', 1], ('b', )), enabled=True):
+        if enabled:
+            return [name, value]
+        return {{'name': name, 'value': value}}
+    ''',
+    '''\
+    def raises_{index}(value, *args, **kwargs):
+        if not value:
+            raise ValueError('Value "{{value}}" is empty.'.format(value=value))
+        if args:
+            raise TypeError('Got too many args.')
+        return len(args) > 1 or bool(kwargs)
+    ''',
+    '''\
+    def follow_{index}(value):
+        if value:
+            return plain_{plain}(value, None)
+        return defaults_{defaults}(value)
+    ''',
+    '''\
+    def imports_{index}(path, default=None):
+        if path:
+            return os.getenv(path, default)
+        return collections.OrderedDict()
+    ''',
+    '''\
+    def generator_{index}(items, prefix=''):
+        for item in items:
+            yield prefix + str(item)
+    ''',
+    '''\
+    class Object{index}(object):
+        def method(self, value, text=''):
+            output = [text.strip() for _ in range(value)]
+            return output
+
+        @staticmethod
+        def make(value):
+            return textwrap.dedent(value)
+    ''',
+    '''\
+    def nested_{index}(value):
+        def inner(item):
+            return item * 2.0
+
+        if value > 10:
+            return inner(value)
+        return value in [1, 2, 3]
+    ''',
+)
+
+
+def make_module(functions=500):
+    '''Create the code of a Python module with the given number of definitions.
+
+    Args:
+        functions (:obj:`int`, optional):
+            The number of function or class templates to write. Default: 500.
+
+    Returns:
+        str: The created code.
+
+    '''
+    blocks = [_HEADER]
+
+    for index in range(functions):
+        template = _TEMPLATES[index % len(_TEMPLATES)]
+
+        # Templates that call other templates call the ones written just before them
+        first = index - (index % len(_TEMPLATES))
+
+        blocks.append(textwrap.dedent(template).format(
+            index=index, plain=first, defaults=first + 1))
+        blocks.append('\n\n')
+
+    return ''.join(blocks)
@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''Measure how fast large modules are visited.
+
+The visitors in :mod:`auto_docstring.parsing.visit` find the method to call
+for each node with a lookup table. Before that, every node was visited
+with `node.accept(visitor)` and nodes that had no method raised and caught
+an AttributeError. This module times both ways on the same modules so
+that the difference can be seen.
+
+Example:
+    >>> python -m auto_docstring.benchmarks.visitors --sizes 100 1000 5000
+
+'''
+
+# IMPORT STANDARD LIBRARIES
+import argparse
+import timeit
+import sys
+
+# IMPORT THIRD-PARTY LIBRARIES
+import astroid
+import six
+
+# IMPORT LOCAL LIBRARIES
+from ..parsing import visit
+from . import synthetic
+
+
+_DEFAULT_SIZES = (100, 1000)
+
+
+class AcceptVisitor(visit.Visitor):
+
+    '''A Visitor that finds its methods with exceptions, like it used to.'''
+
+    def dispatch(self, node):
+        '''Call the method for `node` or visit its children, if `node` has none.'''
+        try:
+            node.accept(self)
+        except AttributeError:
+            self.visit(node)
+
+    def visit(self, node):
+        '''Visit the given Node's children.'''
+        for child in node.get_children():
+            self.dispatch(child)
+
+
+def measure(visitor_class, module, repeat=5):
+    '''Find the fastest time that `visitor_class` takes to visit `module`.
+
+    Args:
+        visitor_class (type): The visitor to create and run.
+        module (`astroid.Module`): The parsed code to visit.
+        repeat (:obj:`int`, optional): The number of times to visit `module`.
+
+    Returns:
+        float: The fastest visit, in seconds.
+
+    '''
+    times = []
+
+    for _ in six.moves.range(repeat):
+        visitor = visitor_class()
+        start = timeit.default_timer()
+        visitor.dispatch(module)
+        times.append(timeit.default_timer() - start)
+
+    return min(times)
+
+
+def run(sizes=_DEFAULT_SIZES, repeat=5):
+    '''Time both ways of visiting for synthetic modules of every given size.
+
+    Args:
+        sizes (:obj:`iter[int]`, optional): The number of definitions in each module.
+        repeat (:obj:`int`, optional): The number of times to visit each module.
+
+    Returns:
+        dict[int, dict[str, float]]:
+            Each module size and its "accept" time, "dispatch" time and "speedup".
+
+    '''
+    results = dict()
+
+    for size in sizes:
+        module = astroid.parse(synthetic.make_module(size))
+        accept = measure(AcceptVisitor, module, repeat=repeat)
+        dispatch = measure(visit.Visitor, module, repeat=repeat)
+
+        speedup = 0.0
+        if dispatch:
+            speedup = accept / dispatch
+
+        results[size] = {'accept': accept, 'dispatch': dispatch, 'speedup': speedup}
+
+    return results
+
+
+def make_report(results):
+    '''str: Create a readable table of the given `results`.'''
+    lines = ['{:>10} {:>14} {:>14} {:>10}'.format(
+        'size', 'accept (ms)', 'dispatch (ms)', 'speedup')]
+
+    for size, summary in sorted(six.iteritems(results)):
+        lines.append('{:>10} {:>14.3f} {:>14.3f} {:>9.2f}x'.format(
+            size,
+            summary['accept'] * 1000,
+            summary['dispatch'] * 1000,
+            summary['speedup'],
+        ))
+
+    return '\n'.join(lines)
+
+
+def _parse_arguments(args):
+    '''Read the command-line arguments of this module.
+
+    Args:
+        args (list[str]): The command-line arguments to parse.
+
+    Returns:
+        `argparse.Namespace`: The parsed arguments.
+
+    '''
+    parser = argparse.ArgumentParser(description='Measure how fast large modules are visited.')
+    parser.add_argument(
+        '--sizes',
+        nargs='+',
+        default=list(_DEFAULT_SIZES),
+        type=int,
+        help='The number of definitions in each synthetic module.',
+    )
+    parser.add_argument('--repeat', default=5, type=int, help='The number of times to visit.')
+
+    return parser.parse_args(args)
+
+
+def main(args=None):
+    '''Time both ways of visiting and print the results.
+
+    Args:
+        args (:obj:`list[str]`, optional):
+            The command-line arguments. If nothing is given, `sys.argv` is used.
+
+    Returns:
+        int: Always 0.
+
+    '''
+    if args is None:
+        args = sys.argv[1:]
+
+    arguments = _parse_arguments(args)
+    print(make_report(run(sizes=arguments.sizes, repeat=arguments.repeat)))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
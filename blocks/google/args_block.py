@@ -5,6 +5,7 @@
 
 # IMPORT LOCAL LIBRARIES
 from ...config import environment
+from ...config import budget
 from ...config import common
 from . import common_block
 
@@ -17,15 +18,17 @@ class Args(common_block.CommonBlock):
     name = 'args'
 
     @staticmethod
-    def _make_line(arg, value=''):
+    def _make_line(arg, value=None):
         '''Get the docstring representation of the given `arg`.
 
         Args:
             arg (str):
                 The name of the arg.
             value (:obj:`str`, optional):
-                The default value for this arg. If no value is given,
-                an unidentified "!f" marker is added, instead.
+                The type of the default value for this arg. If no value is
+                given, the arg is not optional and an unidentified "!f"
+                marker is added, instead. If the value is empty, the arg is
+                optional but its type could not be found.
 
         Returns:
             str: The output line to create.
@@ -42,6 +45,12 @@ class Args(common_block.CommonBlock):
                 value=value,
                 sep=sep)
 
+        if value is not None:
+            return '{indent}{arg} ({{!f}}, optional):{sep}{{!f}}.'.format(
+                indent=indent,
+                sep=sep,
+                arg=arg)
+
         return '{indent}{arg} ({{!f}}):{sep}{{!f}}.'.format(
             indent=indent,
             sep=sep,
@@ -49,10 +58,10 @@ class Args(common_block.CommonBlock):
 
     @classmethod
     def _build_args(cls, info):
-        args = info.get('args', [])
-        defaults = info.get('defaults', [])
-        vararg = info.get('vararg', '')
-        kwarg = info.get('kwarg', '')
+        args = info.args
+        defaults = info.defaults
+        vararg = info.vararg
+        kwarg = info.kwarg
 
         if not args and not defaults and not vararg:
             return []
@@ -63,8 +72,13 @@ class Args(common_block.CommonBlock):
             lines.append((arg, None))
 
         for arg, value in defaults:
-            obj_types = cls._expand_types(value, include_type=True)
-            value = cls._change_type_to_str(obj_types)
+            try:
+                obj_types = cls._expand_types(value, include_type=True)
+                value = cls._change_type_to_str(obj_types)
+            except budget.DeadlineExceeded:
+                # Leave the type for the user to fill in, instead of blocking
+                value = ''
+
             lines.append((arg, value))
 
         if vararg:
@@ -90,13 +104,15 @@ class Args(common_block.CommonBlock):
 
     # TODO : Use the logic from common_block.MultiTypeBlock, instead
     @classmethod
-    def draw(cls, info):
+    def draw(cls, info, state=None):
         '''Create the docstring lines to represent the given `info`.
 
         Args:
-            info (dict[str, list or str]):
+            info (:class:`auto_docstring.parsing.visit.FunctionInfo`):
                 The args, default-args, `*`, and `**` parameters to process.
-                If nothing is given, this method will return an empty list.
+                If there are none, this method will return an empty list.
+            state (:class:`auto_docstring.blocks.google.common_block.RenderState`, optional):
+                The lines that were drawn before this block. This block doesn't use them.
 
         Returns:
             list[str]: The lines to create.
@@ -22,11 +22,34 @@ import six
 
 # IMPORT LOCAL LIBRARIES
 from ...config import environment
+from ...config import budget
 from ...parsing import visit
 from ...core import check
 from . import common_type
 
 
+class RenderState(object):
+
+    '''The lines that a style has drawn so far, for one docstring.
+
+    Blocks read this to decide how to draw themselves. For example, a
+    "Returns:" block is only given a header if some other block was drawn
+    before it. A new state is made for every docstring that is drawn, so the
+    gathered :class:`auto_docstring.parsing.visit.FunctionInfo` is never changed.
+
+    Attributes:
+        lines (list[str]): Every line that was drawn so far.
+
+    '''
+
+    __slots__ = ('lines', )
+
+    def __init__(self):
+        '''Start with no drawn lines.'''
+        super(RenderState, self).__init__()
+        self.lines = []
+
+
 @six.add_metaclass(abc.ABCMeta)
 class CommonBlock(object):
 
@@ -41,13 +64,15 @@ class CommonBlock(object):
 
     @staticmethod
     @abc.abstractmethod
-    def draw(info):
+    def draw(info, state=None):
         '''Create the docstring lines to represent the given `info`.
 
         Args:
-            info (dict[str]):
+            info (:class:`auto_docstring.parsing.visit.FunctionInfo`):
                 The parsed AST node whose type needs to be found and then
                 converted into a string.
+            state (:class:`RenderState`, optional):
+                The lines that were drawn before this block, if any.
 
         Returns:
             list[str]: The lines to create.
@@ -136,6 +161,10 @@ class CommonBlock(object):
             if item not in items:
                 items.append(item)
 
+        if len(items) > 1 and common_type.RECURSIVE_TYPE in items:
+            # A function that calls itself returns whatever else it returns
+            items.remove(common_type.RECURSIVE_TYPE)
+
         return common_type.make_items_text(items)
 
 
@@ -149,21 +178,17 @@ class MultiTypeBlock(CommonBlock):
 
     @classmethod
     def _process_args(cls, info):
-        expected_object = info.get(cls._info_key)
+        expected_object = list(getattr(info, cls._info_key))
 
         if not expected_object:
             return []
 
-        indent = ''
-
-        # Check if I need this if-statement
-        if info.get('lines'):
-            indent = environment.get_default_indent()
-
-        info['indent'] = indent
-
-        obj_types = cls._expand_types(expected_object)
-        type_info_as_str = cls._change_type_to_str(*obj_types)
+        try:
+            obj_types = cls._expand_types(expected_object)
+            type_info_as_str = cls._change_type_to_str(*obj_types)
+        except budget.DeadlineExceeded:
+            # Leave the type for the user to fill in, instead of blocking
+            type_info_as_str = ''
 
         return [type_info_as_str]
 
@@ -173,7 +198,7 @@ class MultiTypeBlock(CommonBlock):
                 for line in lines]
 
     @classmethod
-    def draw(cls, info):
+    def draw(cls, info, state=None):
         # '''Create the docstring lines to represent the given `info`.
 
         # Note:
@@ -181,9 +206,11 @@ class MultiTypeBlock(CommonBlock):
         #     an empty list.
 
         # Args:
-        #     info (dict[str, list[`astroid.NodeNG`]]):
+        #     info (:class:`auto_docstring.parsing.visit.FunctionInfo`):
         #         The parsed AST node whose type needs to be found and then
         #         converted into a string.
+        #     state (:class:`RenderState`, optional):
+        #         The lines that were drawn before this block, if any.
 
         # Returns:
         #     list[str]: The lines to create.
@@ -195,16 +222,19 @@ class MultiTypeBlock(CommonBlock):
             return []
 
         starting_lines = []
-        all_lines = info.get('lines', [])
+        indent = ''
+        all_lines = []
+
+        if state is not None:
+            all_lines = state.lines
 
         if all_lines:
             starting_lines = cls.get_starting_lines()
-
-        multiline = is_multiline(all_lines)
+            indent = environment.get_default_indent()
 
         docstring_lines = cls._build_indented_docstring_lines(
             lines,
-            info.get('indent', ''),
+            indent,
             multiline=is_multiline(all_lines),
         )
         return starting_lines + docstring_lines
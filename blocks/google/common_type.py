@@ -11,7 +11,9 @@ except ImportError:
 
 import collections
 import importlib
+import threading
 import inspect
+import weakref
 
 # IMPORT THIRD-PARTY LIBRARIES
 import astroid
@@ -19,13 +21,38 @@ import six
 
 # IMPORT LOCAL LIBRARIES
 from ...parsing import assign_search
+from ...parsing import call_graph
 from ...config import environment
+from ...config import budget
 from ...defaults import registry
+from ... import type_cache
 from ...parsing import visit
 from ...core import grouping
 from ...core import check
 
 
+# Each module and the first function (in source-order) that is defined for each
+# name. The functions are weak references because they point back to the module
+#
+_LOCAL_FUNCTIONS = weakref.WeakKeyDictionary()
+# Each function, the settings that its types were found with, its return-type
+# text with the follow depth that it needs and if it calls itself (if the text
+# fits in any depth) and its return-type text for each follow depth (if the
+# depth cut the text short)
+#
+_LOCAL_RETURN_TYPES = weakref.WeakKeyDictionary()
+_FOLLOW = threading.local()
+# Each function and the local functions that it calls in its return values
+_RETURN_CALLEES = weakref.WeakKeyDictionary()
+# Each module and the import path of every name that its imports define
+_IMPORT_PATHS = weakref.WeakKeyDictionary()
+
+# The type of a function call which is already being followed. It's left out
+# if the function also returns other types (see `common_block.CommonBlock`)
+#
+RECURSIVE_TYPE = '<recursive>'
+
+
 class Type(object):
 
     '''A generic object that is meant to print a Type of Python object.'''
@@ -117,6 +144,9 @@ class SpecialType(Type):
               try to get its signature
             - If we cannot get the signature of the local object then, we will
               try to rely on astroid to "infer" the object's type.
+                  - If the object was imported from another module, its
+                    inferred type is read from and stored in
+                    :mod:`auto_docstring.type_cache`, if it is enabled.
                   - If that fails, it may be because astroid could not infer the
                     type of the object because the object was assigned earlier
                     in the module. In which case, try to get the `astroid.Assign`
@@ -127,14 +157,34 @@ class SpecialType(Type):
         Attribute, Name, Call, or Foo object that it doesn't understand, it will
         keep digging until it can find a type.
 
+        Raises:
+            :class:`auto_docstring.config.budget.DeadlineExceeded`:
+                If the time budget of the current docstring has run out.
+
         Returns:
             str: The created type string.
 
         '''
+        budget.check()
+
         found_type = process_types(self.obj)
         if found_type is not None:
             return found_type
 
+        # Inferring an imported object parses its module, which can be slow.
+        # So check if its type was stored by an earlier process, first
+        #
+        imported = None
+
+        if type_cache.is_enabled():
+            imported = _get_imported_object(self.obj)
+
+        if imported is not None:
+            cached_type = type_cache.get(imported[0], imported[1], kind=type_cache.INFERRED)
+
+            if cached_type is not type_cache.MISSING:
+                return cached_type
+
         try:
             inferred_object = list(self.obj.infer())[0]
         except astroid.NameInferenceError:
@@ -153,6 +203,23 @@ class SpecialType(Type):
                 except AttributeError:
                     return
 
+        found_type = self._get_inferred_type(inferred_object)
+
+        if imported is not None:
+            type_cache.add(imported[0], imported[1], found_type, kind=type_cache.INFERRED)
+
+        return found_type
+
+    def _get_inferred_type(self, inferred_object):
+        '''Get the type of an object that astroid found for this instance.
+
+        Args:
+            inferred_object (`astroid.NodeNG`): The inferred value of `self.obj`.
+
+        Returns:
+            str: The found type.
+
+        '''
         try:
             # If this was a Named node like foo = [], try to get a type that way
             return get_type_name(visit.get_container_types()[type(inferred_object)])
@@ -619,6 +686,654 @@ def _get_parents(node):
     return parents
 
 
+def _get_local_functions(module):
+    '''Find every function of `module`, by its name.
+
+    Nested functions and methods are included. If two functions have the
+    same name, only the first one is kept. The index is only built the
+    first time that it's needed for `module`.
+
+    Args:
+        module (`astroid.Module`): The module to search within.
+
+    Returns:
+        dict[str, `weakref.ref`]: Each function name and its definition.
+
+    '''
+    try:
+        return _LOCAL_FUNCTIONS[module]
+    except KeyError:
+        pass
+
+    functions = dict()
+
+    for function in module.nodes_of_class(astroid.FunctionDef):
+        functions.setdefault(function.name, weakref.ref(function))
+
+    _LOCAL_FUNCTIONS[module] = functions
+
+    return functions
+
+
+def _get_settings_key():
+    '''tuple: Get the registered default values and config settings that are in use.'''
+    config = environment.get_config()
+    settings = tuple((name, config.get(name)) for name in config.get_names())
+
+    # Finding types loads the preset default values, which changes the
+    # generation. Load them now so that the key is the same before and after
+    #
+    registry.get_signature()
+
+    return (registry.get_generation(), settings)
+
+
+# TODO : This function is messed up. Double-Check it
+def _get_end_name_of_node(obj):
+    '''Get the tail-name of the given `obj`.
+
+    Args:
+        obj (`astroid.Name` or `astroid.Attribute`):
+            The node to get the name of.
+
+    Returns:
+        str: The found name for the given `obj`.
+
+    '''
+    try:
+        return obj.name
+    except AttributeError:
+        try:
+            # If the attribute path contains an `astroid.Call` object then
+            # we need to get the `func`. Otherwise, `expr` will fail
+            #
+            obj = obj.func
+        except AttributeError:
+            pass
+
+        return _get_end_name_of_node(obj.expr)
+
+
+class _FollowFrame(object):
+
+    '''A function which is being followed to find its return-types.'''
+
+    __slots__ = ('function', 'storable', 'needed', 'recursive')
+
+    def __init__(self, function):
+        '''Start following `function`.
+
+        Args:
+            function (`astroid.FunctionDef`): The function to follow.
+
+        '''
+        super(_FollowFrame, self).__init__()
+        self.function = function
+        # If False, the found types are only correct for this one call
+        self.storable = True
+        # The most functions, including this one, that were followed at
+        # once or None, if the follow depth cut them short
+        #
+        self.needed = 1
+        # If True, `function` was followed again while it was being followed
+        self.recursive = False
+
+    def add(self, needed):
+        '''Remember that a called function needed `needed` functions to be followed.'''
+        if needed is None or self.needed is None:
+            self.needed = None
+        else:
+            self.needed = max(self.needed, needed + 1)
+
+
+def _get_follow_stack():
+    '''list[:class:`_FollowFrame`]: The functions being followed in this thread.'''
+    try:
+        return _FOLLOW.stack
+    except AttributeError:
+        _FOLLOW.stack = []
+
+        return _FOLLOW.stack
+
+
+def _add_to_caller(stack, needed):
+    '''Remember, for the innermost function of `stack`, that it followed a function.'''
+    if stack:
+        stack[-1].add(needed)
+
+
+def _get_seeded_types(function, stack):
+    '''Get the types that `function` has so far, if it's being resolved with its cycle.
+
+    See :func:`_resolve_component`.
+
+    Args:
+        function (`astroid.FunctionDef`): The function to get the return-types of.
+        stack (list[:class:`_FollowFrame`]): The functions being followed.
+
+    Returns:
+        str or NoneType: The types found so far or None, if `function` isn't being resolved.
+
+    '''
+    seeded = getattr(_FOLLOW, 'seeded', None)
+
+    if not seeded or function not in seeded:
+        return None
+
+    # A function that's followed from inside the cycle but isn't part of it
+    # only sees the types found so far. Its own types may still change
+    #
+    for frame in reversed(stack):
+        if frame.function in seeded:
+            break
+
+        frame.storable = False
+
+    # Following the cycle back to `function` takes every member of the cycle
+    _add_to_caller(stack, len(seeded) - 1)
+
+    return seeded[function]
+
+
+def _follow(function, stack):
+    '''Find the return-types of `function`, without re-using its remembered types.
+
+    Args:
+        function (`astroid.FunctionDef`): The function to get the return-types of.
+        stack (list[:class:`_FollowFrame`]): The functions being followed.
+
+    Returns:
+        tuple[str, :class:`_FollowFrame`]: The found types and what following them needed.
+
+    '''
+    from . import common_block
+
+    frame = _FollowFrame(function)
+    stack.append(frame)
+
+    try:
+        full_info = list(visit.get_info(function)['functions'][function].returns)
+        # TODO : Note to self. This is very bad. I should not be calling
+        # MultiTypeBlock here. Pull out these functions
+        #
+        obj_types = common_block.MultiTypeBlock._expand_types(full_info)
+        text = common_block.MultiTypeBlock._change_type_to_str(*obj_types)
+    finally:
+        stack.pop()
+
+    return (text, frame)
+
+
+def _get_local_return_types(function):
+    '''Find the return-types of a function that is defined in the current module.
+
+    Functions are followed up to the depth that the user has set. If
+    `function` is already being followed, :data:`RECURSIVE_TYPE` is returned.
+
+    The found text is re-used until a default value is registered or the
+    config changes. Text that didn't reach the follow depth is re-used at
+    any depth that it still fits in. If the time budget runs out, nothing
+    is stored.
+
+    Args:
+        function (`astroid.FunctionDef`): The function to get the return-types of.
+
+    Returns:
+        str: The return-types of `function`, if any.
+
+    '''
+    stack = _get_follow_stack()
+    seeded_text = _get_seeded_types(function, stack)
+
+    if seeded_text is not None:
+        return seeded_text
+
+    for index, frame in enumerate(stack):
+        if frame.function is function:
+            # Every function followed since then called `function` before it
+            # had its types so their types are only correct for this call
+            #
+            for inner in stack[index + 1:]:
+                inner.storable = False
+
+            frame.recursive = True
+
+            return RECURSIVE_TYPE
+
+    depth = environment.get_type_follow_depth() - len(stack)
+
+    if depth <= 0:
+        _add_to_caller(stack, None)
+        return ''
+
+    key = _get_settings_key()
+    found_key, complete, texts = _LOCAL_RETURN_TYPES.get(function, (None, None, dict()))
+
+    if found_key == key:
+        if complete is not None and complete[0] <= depth:
+            _add_to_caller(stack, complete[0])
+            return complete[2]
+
+        if depth in texts:
+            _add_to_caller(stack, None)
+            return texts[depth]
+
+    text, frame = _follow(function, stack)
+    _add_to_caller(stack, frame.needed)
+
+    if not frame.storable:
+        return text
+
+    if found_key != key:
+        complete = None
+        texts = dict()
+
+    if frame.needed is None:
+        texts[depth] = text
+    else:
+        complete = (frame.needed, frame.recursive, text)
+
+    _LOCAL_RETURN_TYPES[function] = (key, complete, texts)
+
+    return text
+
+
+def get_resolved_return_types(function):
+    '''Get the return-types of `function`, if they were already found.
+
+    Only types which no follow depth cut short are given. Types of a
+    function that was followed while it called itself are only correct
+    for that one follow so they aren't given, either. Functions that
+    call each other get their types from :func:`resolve_return_types`.
+
+    Args:
+        function (`astroid.FunctionDef`): The function to get the return-types of.
+
+    Returns:
+        str or NoneType: The found return-types, if any.
+
+    '''
+    found_key, complete, _ = _LOCAL_RETURN_TYPES.get(function, (None, None, None))
+
+    if complete is None or complete[1] or found_key != _get_settings_key():
+        return None
+
+    return complete[2]
+
+
+def _is_resolved(function, key):
+    '''bool: If `function` has types that :func:`get_resolved_return_types` would give.'''
+    found_key, complete, _ = _LOCAL_RETURN_TYPES.get(function, (None, None, None))
+
+    return found_key == key and complete is not None and not complete[1]
+
+
+def _get_local_callees(function, calls):
+    '''list[`astroid.FunctionDef`]: Find the local functions that `calls` call.'''
+    functions = {
+        name: reference()
+        for name, reference in six.iteritems(_get_local_functions(function.root()))
+    }
+
+    return call_graph.get_callees(calls, functions, _get_end_name_of_node)
+
+
+def _get_return_callees(function):
+    '''Find the local functions that `function` calls in its return values.
+
+    The functions are only searched for the first time that they're needed for `function`.
+
+    Args:
+        function (`astroid.FunctionDef`): The function to check.
+
+    Returns:
+        list[`astroid.FunctionDef`]: The called functions, in the order they were found.
+
+    '''
+    try:
+        references = _RETURN_CALLEES[function]
+    except KeyError:
+        callees = _get_local_callees(function, call_graph.get_return_calls(function))
+        _RETURN_CALLEES[function] = [weakref.ref(callee) for callee in callees]
+
+        return callees
+
+    return [reference() for reference in references]
+
+
+def _split_items(text):
+    '''Split `text` at every option separator which isn't inside of []s or <>s.
+
+    Args:
+        text (str): The return-types to split. e.g. "list[int or str] or bool".
+
+    Returns:
+        list[str]: Each option of `text`. e.g. ["list[int or str]", "bool"].
+
+    '''
+    separator = environment.get_option_separator()
+    items = []
+    start = 0
+    index = 0
+    depth = 0
+
+    while index < len(text):
+        character = text[index]
+
+        if character in '[<':
+            depth += 1
+        elif character in ']>':
+            # A ">" without a "<" (like "->") doesn't close anything
+            depth = max(depth - 1, 0)
+        elif depth == 0 and text.startswith(separator, index):
+            items.append(text[start:index])
+            index += len(separator)
+            start = index
+            continue
+
+        index += 1
+
+    items.append(text[start:])
+
+    return items
+
+
+def _merge_items(text):
+    '''Remove the options of `text` which are listed more than once.
+
+    Args:
+        text (str): The return-types to merge. e.g. "bool or str or bool".
+
+    Returns:
+        str: The merged return-types. e.g. "bool or str".
+
+    '''
+    items = []
+
+    for item in _split_items(text):
+        if item and item not in items:
+            items.append(item)
+
+    if len(items) > 1 and RECURSIVE_TYPE in items:
+        items.remove(RECURSIVE_TYPE)
+
+    return make_items_text(items)
+
+
+def _resolve_component(members, graph):
+    '''Find the return-types of functions which call each other, as one unit.
+
+    Every member starts with :data:`RECURSIVE_TYPE`. Then each member is
+    followed again, using the latest types of the other members, until no
+    member's types change. The types are the same no matter which member
+    is asked for first.
+
+    Types which keep growing (e.g. a function which returns a list of its
+    own return value) never settle. Those are left to be found when
+    they're followed.
+
+    Args:
+        members (list[`astroid.FunctionDef`]): The functions which call each other.
+        graph (dict[`astroid.FunctionDef`, list[`astroid.FunctionDef`]]):
+            Each function and the local functions that it calls.
+
+    Returns:
+        bool: If the types of `members` settled and were stored.
+
+    '''
+    stack = _get_follow_stack()
+    member_set = set(members)
+    callers = {member: [] for member in members}
+
+    for member in members:
+        for callee in graph[member]:
+            if callee in member_set:
+                callers[callee].append(member)
+
+    seeded = dict.fromkeys(members, RECURSIVE_TYPE)
+    needed = dict()
+    queue = collections.deque(members)
+    queued = set(members)
+    steps = len(members) * (len(members) + 2)
+
+    previous, _FOLLOW.seeded = getattr(_FOLLOW, 'seeded', None), seeded
+
+    try:
+        while queue:
+            if not steps:
+                return False
+
+            steps -= 1
+            member = queue.popleft()
+            queued.discard(member)
+
+            text, frame = _follow(member, stack)
+
+            if not frame.storable or frame.needed is None:
+                return False
+
+            needed[member] = frame.needed
+            text = _merge_items(text)
+
+            if text == seeded[member]:
+                continue
+
+            seeded[member] = text
+
+            for caller in callers[member]:
+                if caller not in queued:
+                    queue.append(caller)
+                    queued.add(caller)
+    finally:
+        _FOLLOW.seeded = previous
+
+    if max(needed.values()) > environment.get_type_follow_depth():
+        return False
+
+    key = _get_settings_key()
+
+    for member in members:
+        _LOCAL_RETURN_TYPES[member] = (key, (needed[member], False, seeded[member]), dict())
+
+    return True
+
+
+def _resolve(roots):
+    '''Find the return-types of `roots` and every local function that they call.
+
+    Functions are resolved callees first so each function is followed
+    once and every function which calls it re-uses its types. Functions
+    that call each other (or themselves) are resolved together, using
+    :func:`_resolve_component`.
+
+    Args:
+        roots (iter[`astroid.FunctionDef`]): The functions to start from.
+
+    Returns:
+        dict[`astroid.FunctionDef`, str]:
+            Each function whose types couldn't be inferred and the error message.
+
+    '''
+    if not environment.allow_type_follow():
+        return dict()
+
+    graph = collections.OrderedDict()
+    pending = list(roots)
+
+    while pending:
+        function = pending.pop()
+
+        if function in graph:
+            continue
+
+        graph[function] = _get_return_callees(function)
+        pending.extend(graph[function])
+
+    key = _get_settings_key()
+    errors = dict()
+
+    for component in call_graph.get_strongly_connected_components(graph):
+        if all(_is_resolved(member, key) for member in component):
+            continue
+
+        # Members are followed in source-order so their types don't depend
+        # on which function was asked for first
+        #
+        component = sorted(component, key=lambda node: (node.lineno, node.col_offset))
+
+        try:
+            if len(component) == 1 and component[0] not in graph[component[0]]:
+                _get_local_return_types(component[0])
+            else:
+                _resolve_component(component, graph)
+        except astroid.AstroidError as error:
+            for member in component:
+                errors[member] = str(error)
+
+    return errors
+
+
+def resolve_return_types(function):
+    '''Find the return-types of every local function that `function` returns or yields.
+
+    Functions which call each other are resolved as one unit, once. After
+    that, their types are re-used by every "Returns:" and "Yields:" block.
+
+    Args:
+        function (`astroid.FunctionDef`): The function to resolve.
+
+    Returns:
+        dict[`astroid.FunctionDef`, str]:
+            Each function whose types couldn't be inferred and the error message.
+
+    '''
+    roots = [function]
+    roots.extend(_get_local_callees(function, call_graph.get_yield_calls(function)))
+
+    return _resolve(roots)
+
+
+def resolve_local_return_types(module):
+    '''Find the return-types of every function in `module`.
+
+    See :func:`resolve_return_types`.
+
+    Args:
+        module (`astroid.Module`): The module to resolve.
+
+    Returns:
+        dict[`astroid.FunctionDef`, str]:
+            Each function whose types couldn't be inferred and the error message.
+
+    '''
+    return _resolve(module.nodes_of_class(astroid.FunctionDef))
+
+
+def _get_import_from_path(module, statement, name):
+    '''Get the full import path of a name that a "from X import Y" statement imports.
+
+    Relative imports are made absolute, using the name of `module`. If
+    `module` has no name (for example, it was parsed from a string), the
+    leading dots are dropped, like they always were.
+
+    Args:
+        module (`astroid.Module`): The module that contains `statement`.
+        statement (`astroid.ImportFrom`): The import to get the path of.
+        name (str): The imported name. e.g. "Y".
+
+    Returns:
+        str: The found path. e.g. "X.Y".
+
+    '''
+    if not statement.level or not module.name:
+        return statement.modname + '.' + name
+
+    try:
+        base = module.relative_to_absolute_name(statement.modname, statement.level)
+    except astroid.TooManyLevelsError:
+        base = '.' * statement.level + statement.modname
+
+    if base.endswith('.'):
+        return base + name
+
+    return base + '.' + name
+
+
+def _get_import_paths(module):
+    '''Find every name that the imports of `module` define and the path that each imports.
+
+    Only the first import of each name is kept. The table is only built the
+    first time that it's needed for `module`.
+
+    Args:
+        module (`astroid.Module`): The module to search within.
+
+    Returns:
+        dict[str, tuple[int, str]]:
+            Each defined name, the line of the import which defines it
+            and its full import path.
+
+    '''
+    try:
+        return _IMPORT_PATHS[module]
+    except KeyError:
+        pass
+
+    paths = dict()
+
+    for statement in module.nodes_of_class((astroid.ImportFrom, astroid.Import)):
+        for name, alias in statement.names:
+            if isinstance(statement, astroid.Import):
+                path = name
+            elif name == '*':
+                continue
+            else:
+                path = _get_import_from_path(module, statement, name)
+
+            paths.setdefault(alias or name, (statement.lineno, path))
+
+    _IMPORT_PATHS[module] = paths
+
+    return paths
+
+
+def _get_imported_object(node):
+    '''Find the module and name of an object that `node` imported.
+
+    Only names which are bound once, by an absolute "from module import name",
+    are found. Any other name may refer to something in the current module.
+
+    Args:
+        node (`astroid.NodeNG`): The node to check.
+
+    Returns:
+        tuple[str, str] or NoneType: The module path and name of the object, if found.
+
+    '''
+    if not isinstance(node, astroid.Name):
+        return None
+
+    # This is much faster than a lookup so check it before doing one
+    if node.name not in _get_import_paths(node.root()):
+        return None
+
+    _, assignments = node.lookup(node.name)
+
+    if len(assignments) != 1 or not isinstance(assignments[0], astroid.ImportFrom):
+        return None
+
+    statement = assignments[0]
+
+    if statement.level:
+        return None
+
+    for name, alias in statement.names:
+        if (alias or name) == node.name:
+            return (statement.modname, name)
+
+    return None
+
+
 # TODO : Move this inner functions out
 def _process_as_thirdparty_attribute(node, wrap=False):
     '''Get the string representation of some `node`.
@@ -635,31 +1350,6 @@ def _process_as_thirdparty_attribute(node, wrap=False):
         str: The found type for the given `node`.
 
     '''
-    # TODO : This function is messed up. Double-Check it
-    def get_end_name_of_node(obj):
-        '''Get the tail-name of the given `obj`.
-
-        Args:
-            obj (`astroid.Name` or `astroid.Attribute`):
-                The node to get the name of.
-
-        Returns:
-            str: The found name for the given `obj`.
-
-        '''
-        try:
-            return obj.name
-        except AttributeError:
-            try:
-                # If the attribute path contains an `astroid.Call` object then
-                # we need to get the `func`. Otherwise, `expr` will fail
-                #
-                obj = obj.func
-            except AttributeError:
-                pass
-
-            return get_end_name_of_node(obj.expr)
-
     # TODO : Couldn't I just if function == obj?
     def get_local_function_types(module, node):
         '''Look at the given `module` defined functions and try to find `node`.
@@ -674,21 +1364,15 @@ def _process_as_thirdparty_attribute(node, wrap=False):
                  If no function types were found, return an empty string.
 
         '''
-        from . import common_block
-        search_name = get_end_name_of_node(node)
+        search_name = _get_end_name_of_node(node)
 
         # First, try to see if the object is defined in this module
-        for function in module.nodes_of_class(astroid.FunctionDef):
-            if function.name == search_name:
-                full_info = visit.get_info(function)['functions'][function]['returns']
-                # TODO : Note to self. This is very bad. I should not be calling
-                # MultiTypeBlock here. Pull out these functions
-                #
-                obj_types = common_block.MultiTypeBlock._expand_types(full_info)
-                type_info_as_str = common_block.MultiTypeBlock._change_type_to_str(*obj_types)
-                return type_info_as_str
+        function = _get_local_functions(module).get(search_name)
 
-        return ''
+        if function is None:
+            return ''
+
+        return _get_local_return_types(function())
 
     # def get_local_method_types(module, obj):
     #     # for classobj in module.nodes_of_class(astroid.ClassDef):
@@ -716,28 +1400,13 @@ def _process_as_thirdparty_attribute(node, wrap=False):
                  to import `node`.
 
         '''
-        search_name = get_end_name_of_node(node)
-        object_line_number = node.lineno
-
-        for item in module.nodes_of_class((astroid.ImportFrom, astroid.Import)):
-            if item.lineno >= object_line_number:
-                break
-
-            # If this is "import X"
-            if isinstance(item, astroid.Import):
-                for name, alias in item.names:
-                    if not alias:
-                        alias = name
-
-                    if alias == search_name:
-                        return name
-
-            # If it was imported using "from X import Y"
-            if isinstance(item, astroid.ImportFrom):
-                for name, _ in item.names:
-                    if name == search_name:
-                        return item.modname + '.' + search_name
-        return ''
+        found = _get_import_paths(module).get(_get_end_name_of_node(node))
+
+        # Imports that come after `node` don't define its name, yet
+        if found is None or found[0] >= node.lineno:
+            return ''
+
+        return found[1]
 
     # This third-party attribute may be an object that is either imported or
     # is actually defined (i.e. accessible) in the current module. Find it.
@@ -885,6 +1554,13 @@ def _process_as_known_object(obj):
     module_path = '.'.join(_split[:-1])
     obj_name = _split[-1]
 
+    # Importing the module can be slow so check if its type was stored, first
+    if module_path:
+        cached_type = type_cache.get(module_path, obj_name)
+
+        if cached_type is not type_cache.MISSING:
+            return cached_type
+
     try:
         module = __import__(module_path, fromlist=[obj_name])
     except (ImportError, ValueError):
@@ -899,8 +1575,17 @@ def _process_as_known_object(obj):
     real_obj = getattr(module, obj_name)
     default_function = registry.get_default(real_obj, not_found)
 
-    if default_function != not_found:
-        return default_function(obj)
+    if default_function == not_found:
+        type_cache.add(module_path, obj_name, None)
+        return
+
+    found_type = default_function(obj)
+
+    # Callable defaults depend on `obj` so only string defaults can be stored
+    if registry.is_constant(real_obj):
+        type_cache.add(module_path, obj_name, found_type)
+
+    return found_type
 
 
 def get_object(node):
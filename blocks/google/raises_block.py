@@ -30,18 +30,20 @@ class Raises(common_block.CommonBlock):
         return ['{}:'.format(cls.label)]
 
     @classmethod
-    def draw(cls, info):
+    def draw(cls, info, state=None):
         '''Create the docstring lines to represent the given `info`.
 
         Args:
-            info (dict[str, list]):
+            info (:class:`auto_docstring.parsing.visit.FunctionInfo`):
                 Each of the different "raise" statements and their values.
+            state (:class:`auto_docstring.blocks.google.common_block.RenderState`, optional):
+                The lines that were drawn before this block. This block doesn't use them.
 
         Returns:
             list[str]: The lines to create.
 
         '''
-        raise_info = info.get('raises', [])
+        raise_info = info.raises
         raise_info = cls._filter_unnamed(raise_info)
 
         if not raise_info:
@@ -4,7 +4,9 @@
 '''The class and functions needed to print a Google-style "Returns:" block.'''
 
 # IMPORT LOCAL LIBRARIES
+from ...parsing import visit
 from . import common_block
+from . import common_type
 
 
 class Returns(common_block.MultiTypeBlock):
@@ -14,3 +16,27 @@ class Returns(common_block.MultiTypeBlock):
     label = 'Returns'
     name = 'returns'
     _info_key = name
+
+    @classmethod
+    def _process_args(cls, info):
+        '''Re-use the return-types of the function, if they were already found.
+
+        See :func:`auto_docstring.blocks.google.common_type.resolve_return_types`.
+
+        '''
+        if cls._info_key != Returns._info_key:
+            # Subclasses that draw other values (like Sphinx's "Yields") have no return-types
+            return super(Returns, cls)._process_args(info)
+
+        for value in info.returns:
+            if value is None:
+                continue
+
+            text = common_type.get_resolved_return_types(visit.get_scope(value.parent))
+
+            if text is not None:
+                return [text]
+
+            break
+
+        return super(Returns, cls)._process_args(info)
@@ -48,7 +48,7 @@ class Returns(mixin.NumpyMixin, returns_block.Returns):
         return output
 
     @classmethod
-    def draw(cls, info):
+    def draw(cls, info, state=None):
         lines = cls._process_args(info)
 
         if not lines:
@@ -56,7 +56,7 @@ class Returns(mixin.NumpyMixin, returns_block.Returns):
 
         starting_lines = []
 
-        if info.get('lines'):
+        if state is not None and state.lines:
             starting_lines = cls.get_starting_lines()
 
         return starting_lines + cls._build_docstring_lines(lines)
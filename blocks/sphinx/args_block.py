@@ -20,7 +20,7 @@ class Args(mixin.SphinxBlockMixin, args_block.Args):
 
     @classmethod
     def _make_type_line(cls, arg, value):
-        if value is not None:
+        if value:
             return '{type_label} {arg}: {{{id_}:{value}!f}}'.format(
                 type_label=cls._type_label,
                 arg=arg,
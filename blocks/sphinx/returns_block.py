@@ -22,14 +22,14 @@ class Returns(mixin.SphinxBlockMixin, returns_block.Returns):
 
     @classmethod
     def _make_type_line(cls, value):
-        if value is not None:
+        if value:
             return '{rtype_label} {{{id_}:{value}!f}}'.format(
                 rtype_label=cls._rtype_label,
                 id_=common.get_unique_number(),
                 value=value,
             )
 
-        return '{rtype_label} {{!f}}'.format(rtype_label=cls._type_label, arg=arg)
+        return '{rtype_label} {{!f}}'.format(rtype_label=cls._rtype_label)
 
     @classmethod
     def _build_indented_docstring_lines(cls, lines, indent='', multiline=False):
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''A module which tracks how much time a docstring is allowed to take.
+
+Type inference can follow calls into other functions and even import other
+modules, so finding a type has no upper bound on time. If a time budget is
+given, types that are found after the budget has run out are skipped and
+their docstring marker is left empty, instead.
+
+Work can also be stopped early by another thread, using a
+:class:`threading.Event`. Once the event is set, the budget counts as
+having run out and the work is cancelled. Unlike a time budget, which only
+skips types, a cancelled docstring isn't finished at all.
+
+Example:
+    >>> with budget.limit(0.5):
+    ...     # Any type that is inferred after 0.5 seconds raises DeadlineExceeded
+    ...     docstring = style.draw(info)
+
+'''
+
+# IMPORT STANDARD LIBRARIES
+import contextlib
+import threading
+import timeit
+
+
+_STATE = threading.local()
+
+
+class DeadlineExceeded(Exception):
+
+    '''An exception that is raised once the time budget has run out.'''
+
+    pass
+
+
+class Cancelled(Exception):
+
+    '''An exception that is raised once the current work has been cancelled.'''
+
+    pass
+
+
+@contextlib.contextmanager
+def limit(seconds=None, event=None):
+    '''Only allow the code in this context to run for the given time.
+
+    Args:
+        seconds (:obj:`float`, optional):
+            The time budget, in seconds. If no time is given,
+            the code in this context has no time limit.
+        event (:class:`threading.Event`, optional):
+            If given, the budget also runs out as soon as this event is set.
+            If no event is given, the event of any outer context is kept.
+
+    '''
+    previous = (getattr(_STATE, 'deadline', None), getattr(_STATE, 'event', None))
+
+    if seconds is None:
+        _STATE.deadline = None
+    else:
+        _STATE.deadline = timeit.default_timer() + seconds
+
+    if event is not None:
+        _STATE.event = event
+
+    try:
+        yield
+    finally:
+        _STATE.deadline, _STATE.event = previous
+
+
+def cancelled():
+    '''bool: If the event of the current time budget has been set.'''
+    event = getattr(_STATE, 'event', None)
+    return event is not None and event.is_set()
+
+
+def expired():
+    '''bool: If the current time budget has run out.'''
+    if cancelled():
+        return True
+
+    deadline = getattr(_STATE, 'deadline', None)
+    return deadline is not None and timeit.default_timer() >= deadline
+
+
+def check_cancelled():
+    '''Stop the current work if it has been cancelled.
+
+    Raises:
+        Cancelled: If the event of the current time budget has been set.
+
+    '''
+    if cancelled():
+        raise Cancelled('This docstring was cancelled.')
+
+
+def check():
+    '''Stop the current work if its time budget has run out.
+
+    Raises:
+        Cancelled: If the event of the current time budget has been set.
+        DeadlineExceeded: If the time budget has run out.
+
+    '''
+    check_cancelled()
+
+    if expired():
+        raise DeadlineExceeded('The time budget for this docstring has run out.')
@@ -4,15 +4,46 @@
 '''A series of very generic functions used by auto_docstring.'''
 
 # IMPORT STANDARD LIBRARIES
+import importlib
 import uuid
 
+# IMPORT THIRD-PARTY LIBRARIES
+import six
+
 # IMPORT LOCAL LIBRARIES
 from . import environment
 
 
+_PACKAGE = __name__.rsplit('.', 2)[0]
+
+
+def import_object(path):
+    '''Import the Python object at the given dot "." path.
+
+    Example:
+        >>> import_object('.styles.google.GoogleStyle')
+        >>> # Result: <class 'auto_docstring.styles.google.GoogleStyle'>
+
+    Args:
+        path (str):
+            The module and name of the object to import. If the path starts
+            with a ".", it is imported relative to the auto_docstring package.
+
+    Returns:
+        The found object.
+
+    '''
+    module_path, name = path.rsplit('.', 1)
+    module = importlib.import_module(module_path, package=_PACKAGE)
+    return getattr(module, name)
+
+
 def get_code_style(name):
     '''Get the Python object needed to generate docstrings for the given style.
 
+    If the style was registered as an import path, it is imported the first
+    time that it is needed.
+
     Args:
         name (str): The name of the style to get.
 
@@ -24,12 +55,17 @@ def get_code_style(name):
         check out :func:`auto_docstring.get_all_style_info`.
 
     '''
-    styles = environment.get_all_style_info()
     try:
-        return styles[name]
+        style = environment.get_registered_style(name)
     except KeyError:
         raise ValueError('Style: "{name}" was invalid. Options were, "{options}".'
-                         ''.format(name=name, options=sorted(styles.keys())))
+                         ''.format(name=name, options=environment.get_style_names()))
+
+    if isinstance(style, six.string_types):
+        style = import_object(style)
+        environment.register_code_style(name, style)
+
+    return style
 
 
 def get_unique_number():
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''A module which keeps the settings, styles and default values in use.
+
+Config entries, docstring styles and registered default values are all
+stored on a :class:`Context`. Everything that is registered when no
+context is active goes into a default context, which is shared by the
+whole process.
+
+To create docstrings for many projects at once, each with their own
+settings, give each project its own context. A context is only active in
+the thread that activated it so threads never see each other's settings.
+
+Example:
+    >>> project = create_context()  # Starts as a copy of the current context
+    >>> with project.activate():
+    ...     auto_docstring.register('foo.bar', returns='str')  # Only for `project`
+    ...     docstring = docstring_builder.create_docstring(code, row=10)
+
+'''
+
+# IMPORT STANDARD LIBRARIES
+import collections
+import contextlib
+import itertools
+import threading
+
+
+_STATE = threading.local()
+
+# Every context shares this counter so that two contexts never have the same generation
+_GENERATIONS = itertools.count(1)
+
+
+def next_generation():
+    '''int: Get a generation number which has never been used before.'''
+    return next(_GENERATIONS)
+
+
+class Context(object):
+
+    '''The settings, styles and default values used to create docstrings.
+
+    Attributes:
+        config (dict[str, list[callable]]):
+            The name of each config entry and the functions that read its value.
+        styles (dict[str, object or str]):
+            The name of each docstring style and its class or import path.
+        known_types (dict[object, str or callable]):
+            Each registered object and its default value.
+        presets_loaded (bool):
+            If the default values of the preset modules were added to `known_types`.
+        generation (int):
+            A number that changes every time that `known_types` changes.
+        signature (tuple[int or NoneType, str]):
+            The last hash of `known_types` and the generation that it was made for.
+
+    '''
+
+    def __init__(self, base=None):
+        '''Create the context.
+
+        Args:
+            base (:class:`Context`, optional):
+                The context to copy. If nothing is given, the context starts empty.
+
+        '''
+        super(Context, self).__init__()
+
+        self.config = collections.defaultdict(list)
+        self.styles = dict()
+        self.known_types = dict()
+        self.presets_loaded = False
+        self.generation = next_generation()
+        self.signature = (None, '')
+
+        if base is not None:
+            for name, predicates in list(base.config.items()):
+                self.config[name] = list(predicates)
+
+            self.styles.update(base.styles)
+            self.known_types.update(base.known_types)
+            self.presets_loaded = base.presets_loaded
+
+    @contextlib.contextmanager
+    def activate(self):
+        '''Use this context, in the current thread, while in this context.'''
+        previous = getattr(_STATE, 'context', None)
+        _STATE.context = self
+
+        try:
+            yield self
+        finally:
+            _STATE.context = previous
+
+
+_DEFAULT_CONTEXT = Context()
+
+
+def get_default_context():
+    ''':class:`Context`: The context that is used when no other context is active.'''
+    return _DEFAULT_CONTEXT
+
+
+def get_current_context():
+    ''':class:`Context`: The context that is active in this thread.'''
+    return getattr(_STATE, 'context', None) or _DEFAULT_CONTEXT
+
+
+def create_context():
+    ''':class:`Context`: Make a copy of the context that is active in this thread.'''
+    return Context(base=get_current_context())
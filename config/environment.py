@@ -1,25 +1,108 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-'''A module for loading and storing user customization settings.'''
+'''A module for loading and storing user customization settings.
+
+Every setting is read from a list of predicates, which usually read from
+`os.environ`. Drawing one docstring reads many settings, many times, so
+:func:`get_config` can resolve every setting once into a :class:`Config`.
+While a :class:`Config` is used (see :func:`use_config`), every setting is
+read from it instead of from the predicates.
+
+Example:
+    >>> config = get_config()
+    >>> with use_config(config):
+    ...     get_default_indent()  # Read from `config`, not `os.environ`
+
+'''
 
 # IMPORT STANDARD LIBRARIES
-import collections
+import contextlib
+import threading
 import os
 import re
 
+# IMPORT LOCAL LIBRARIES
+from . import context
+
 
-_STYLES = dict()
 _STYLE_BLOCK_ORDER_COMPILE = re.compile(r'(?P<name>\w+):(?P<blocks>[\w,]+):')
-_CONFIG = collections.defaultdict(list)
+_STATE = threading.local()
+_NOT_FOUND = object()
+_DEFAULT_TYPE_FOLLOW_DEPTH = 10
+
+
+class Config(object):
+
+    '''An immutable snapshot of every resolved config setting.
+
+    Settings whose predicates all failed are left out of the snapshot so
+    that each getter still falls back to its own default.
+
+    '''
+
+    __slots__ = ('_entries', '_block_orders')
+
+    def __init__(self, entries=None, block_order=''):
+        '''Store the settings.
+
+        Args:
+            entries (:obj:`dict[str]`, optional):
+                The name of each config entry and its resolved value.
+            block_order (:obj:`str`, optional):
+                The text of the `AUTO_DOCSTRING_BLOCK_ORDER` environment variable.
+
+        '''
+        super(Config, self).__setattr__('_entries', dict(entries or {}))
+        super(Config, self).__setattr__('_block_orders', _parse_block_order(block_order))
+
+    def __setattr__(self, name, value):
+        '''Stop the settings from being changed.
+
+        Raises:
+            AttributeError: Every time this method is called.
+
+        '''
+        raise AttributeError('Config objects cannot be changed.')
+
+    def get(self, name, default=None):
+        '''Get the value of a config entry.
+
+        Args:
+            name (str): The name of the config entry to get.
+            default (:obj:`object`, optional): The value to use if `name` wasn't resolved.
+
+        Returns:
+            The found value or `default`.
+
+        '''
+        return self._entries.get(name, default)
+
+    def get_block_orders(self):
+        '''dict[str or NoneType, tuple[str]]: The block order of each style.'''
+        return self._block_orders
+
+    def get_names(self):
+        '''list[str]: The name of every resolved config entry.'''
+        return sorted(self._entries)
 
 
 def register_config_entry(name, predicate):
-    _CONFIG[name].insert(0, predicate)
+    context.get_current_context().config[name].insert(0, predicate)
 
 
-def get_config_entry(name, default=None):
-    for function in _CONFIG[name]:
+def _resolve_config_entry(name, default=None):
+    '''Read a config entry from its predicates.
+
+    Args:
+        name (str): The name of the config entry to get.
+        default (:obj:`object`, optional): The value to use if every predicate fails.
+
+    Returns:
+        The value of the first predicate that didn't fail or `default`.
+
+    '''
+    for function in context.get_current_context().config.get(name, []):
         try:
             return function()
         except Exception:
@@ -28,6 +111,67 @@ def get_config_entry(name, default=None):
     return default
 
 
+def get_config_entry(name, default=None):
+    config = get_active_config()
+
+    if config is not None:
+        return config.get(name, default)
+
+    return _resolve_config_entry(name, default=default)
+
+
+def get_active_config():
+    '''Config or NoneType: The config that is currently used, if any.'''
+    return getattr(_STATE, 'config', None)
+
+
+def get_config():
+    '''Get the config that is currently used or resolve every setting, now.
+
+    Returns:
+        :class:`Config`: The found config.
+
+    '''
+    config = get_active_config()
+
+    if config is not None:
+        return config
+
+    entries = dict()
+
+    for name in list(context.get_current_context().config):
+        value = _resolve_config_entry(name, default=_NOT_FOUND)
+
+        if value is not _NOT_FOUND:
+            entries[name] = value
+
+    return Config(entries, block_order=os.getenv('AUTO_DOCSTRING_BLOCK_ORDER', ''))
+
+
+@contextlib.contextmanager
+def use_config(config):
+    '''Read every setting from `config` while in this context.
+
+    Args:
+        config (:class:`Config` or NoneType):
+            The settings to use. If nothing is given, settings are read
+            from their predicates, as usual.
+
+    '''
+    previous = get_active_config()
+    _STATE.config = config
+
+    try:
+        yield
+    finally:
+        _STATE.config = previous
+
+
+def get_config_names():
+    '''list[str]: The name of every registered config entry.'''
+    return sorted(context.get_current_context().config)
+
+
 def _auto_raw_prefix():
     return os.environ['AUTO_DOCSTRING_RAW_PREFIX'] == '1'
 
@@ -36,27 +180,141 @@ def auto_raw_prefix():
     return get_config_entry('raw_prefix', default=True)
 
 
-def _allow_type_follow():
-    '''Check if it is OK to follow the type of a Call or Name object.
+def _get_type_follow_depth():
+    '''The most functions that may be followed to find the type of a Call or Name object.
+
+    ```
+    export AUTO_DOCSTRING_TYPE_FOLLOW_DEPTH = "4"
+    ```
+
+    If a function calls another function, auto_docstring follows the called
+    function to get its return type(s), which may call other functions, and
+    so on. Once this many functions are being followed, any other function
+    is treated like it was imported. If the depth is 0, nothing is followed.
 
     Returns:
-        bool: If False and a function calls another function, auto_docstring
-              will not attempt to get the called function's return type(s).
-              If True, it will recursively travel up the called function until
-              it has found all its return types. Default is True.
+        int: The depth.
 
     '''
-    return os.environ['AUTO_DOCSTRING_TYPE_FOLLOW'] == '1'
+    return int(os.environ['AUTO_DOCSTRING_TYPE_FOLLOW_DEPTH'])
+
+
+def _get_legacy_type_follow_depth():
+    '''Read the type follow depth from the older, on / off setting.
+
+    ```
+    export AUTO_DOCSTRING_TYPE_FOLLOW = "0"
+    ```
+
+    Returns:
+        int: 0 if type follow is off. Otherwise, the default depth.
+
+    '''
+    if os.environ['AUTO_DOCSTRING_TYPE_FOLLOW'] == '1':
+        return _DEFAULT_TYPE_FOLLOW_DEPTH
+
+    return 0
+
+
+def get_type_follow_depth():
+    return get_config_entry('type_follow_depth', default=_DEFAULT_TYPE_FOLLOW_DEPTH)
 
 
 def allow_type_follow():
-    return get_config_entry('type_follow', default=True)
+    return get_type_follow_depth() > 0
+
+
+def _allow_fast_path():
+    '''Check if functions may be found without building an astroid tree of their module.
+
+    ```
+    export AUTO_DOCSTRING_FAST_PATH = "0"
+    ```
+
+    Returns:
+        bool: If True, functions that only use their own names and Python's
+              builtins are parsed on their own. See
+              :mod:`auto_docstring.parsing.syntax`. Default is True.
+
+    '''
+    return os.environ['AUTO_DOCSTRING_FAST_PATH'] == '1'
+
+
+def allow_fast_path():
+    return get_config_entry('fast_path', default=True)
 
 
-# TODO : Add this to __init__.py
 def get_all_style_info():
-    '''dict[str, object]: The name of a docstring style and its Python object.'''
-    return _STYLES
+    '''Get every registered docstring style.
+
+    Styles that have not been imported yet are imported by this function.
+
+    Returns:
+        dict[str, object]: The name of a docstring style and its Python object.
+
+    '''
+    from . import common
+
+    return {name: common.get_code_style(name) for name in get_style_names()}
+
+
+def get_registered_style(name):
+    '''Get the object or import path that was registered for the given style.
+
+    Args:
+        name (str): The name of the style to get.
+
+    Raises:
+        KeyError: If `name` is not a registered style.
+
+    Returns:
+        object or str: The style's Python object or the path to import it from.
+
+    '''
+    return context.get_current_context().styles[name]
+
+
+def get_style_names():
+    '''list[str]: The name of every registered docstring style.'''
+    return sorted(context.get_current_context().styles)
+
+
+def _get_unique_blocks(text):
+    '''tuple[str]: Get the comma-separated block names in `text`, without duplicates.'''
+    blocks = []
+    for block in text.split(','):
+        block = block.strip()
+        if block and block not in blocks:
+            blocks.append(block)
+
+    return tuple(blocks)
+
+
+def _parse_block_order(text):
+    '''Find the block order of each style in `text`.
+
+    Args:
+        text (str): The value of the `AUTO_DOCSTRING_BLOCK_ORDER` environment variable.
+
+    Returns:
+        dict[str or NoneType, tuple[str]]:
+            Each style name and its blocks. If `text` doesn't list styles,
+            the blocks are stored under None and are used for every style.
+
+    '''
+    if not text:
+        return dict()
+
+    info = _STYLE_BLOCK_ORDER_COMPILE.findall(text)
+
+    if not info:
+        return {None: _get_unique_blocks(text)}
+
+    orders = dict()
+    for style, blocks in info:
+        orders.setdefault(style, _get_unique_blocks(blocks))
+
+    return orders
 
 
 # TODO : Remove this function, later
@@ -80,44 +338,28 @@ def get_block_order(name):
         tuple[str]: The order of blocks.
 
     '''
-    def get_default_style_blocks(name):
-        try:
-            style_class = _STYLES[name]
-        except KeyError:
-            return tuple()
-
-        return style_class.get_default_block_order()
-
-    order_info = os.getenv('AUTO_DOCSTRING_BLOCK_ORDER', '')
-
-    if not order_info:
-        # Fall-back to the class definition, if no env var for that style was defined
-        return get_default_style_blocks(name)
-
-    info = _STYLE_BLOCK_ORDER_COMPILE.findall(order_info)
+    config = get_active_config()
 
-    if not info:
-        blocks = []
-        for block in order_info.split(','):
-            block = block.strip()
-            if block and block not in blocks:
-                blocks.append(block)
+    if config is not None:
+        orders = config.get_block_orders()
+    else:
+        orders = _parse_block_order(os.getenv('AUTO_DOCSTRING_BLOCK_ORDER', ''))
 
-        return tuple(blocks)
+    if None in orders:
+        return orders[None]
 
-    for style, blocks in info:
-        if style != name:
-            continue
+    if name in orders:
+        return orders[name]
 
-        output_blocks = []
-        for block in blocks.split(','):
-            block = block.strip()
-            if block and block not in output_blocks:
-                output_blocks.append(block)
+    # Fall-back to the class definition, if no env var for that style was defined
+    from . import common
 
-        return tuple(output_blocks)
+    try:
+        style_class = common.get_code_style(name)
+    except ValueError:
+        return tuple()
 
-    return get_default_style_blocks(name)
+    return style_class.get_default_block_order()
 
 
 def _get_container_prefix():
@@ -219,16 +461,96 @@ def get_option_separator():
     return get_config_entry('option_separator', ' or ')
 
 
-# TODO : Finish this docstring
+def _get_time_budget():
+    '''The most time that a docstring's types are allowed to take, in seconds.
+
+    ```
+    export AUTO_DOCSTRING_TIME_BUDGET = "0.25"
+    ```
+
+    Once the time budget runs out, any type that still needs to be found
+    is left as an empty marker, "{!f}".
+
+    Returns:
+        float: The time budget.
+
+    '''
+    return float(os.environ['AUTO_DOCSTRING_TIME_BUDGET'])
+
+
+def get_time_budget():
+    return get_config_entry('time_budget', default=None)
+
+
+def _get_result_cache_size():
+    '''The most docstrings to keep in the result cache.
+
+    ```
+    export AUTO_DOCSTRING_RESULT_CACHE_SIZE = "0"
+    ```
+
+    If the size is 0, docstrings are not cached.
+
+    Returns:
+        int: The size of the cache.
+
+    '''
+    return int(os.environ['AUTO_DOCSTRING_RESULT_CACHE_SIZE'])
+
+
+def get_result_cache_size():
+    return get_config_entry('result_cache_size', default=256)
+
+
+def _get_type_cache_path():
+    '''The file that stores the types of imported objects between processes.
+
+    ```
+    export AUTO_DOCSTRING_TYPE_CACHE = "~/.cache/auto_docstring/types.sqlite"
+    ```
+
+    Returns:
+        str: The path to the cache file. If empty, no types are stored.
+
+    '''
+    return os.environ['AUTO_DOCSTRING_TYPE_CACHE']
+
+
+def get_type_cache_path():
+    return get_config_entry('type_cache', default='')
+
+
+def _get_type_cache_size():
+    '''The most types to keep in the type cache file.
+
+    ```
+    export AUTO_DOCSTRING_TYPE_CACHE_SIZE = "10000"
+    ```
+
+    Returns:
+        int: The size of the cache.
+
+    '''
+    return int(os.environ['AUTO_DOCSTRING_TYPE_CACHE_SIZE'])
+
+
+def get_type_cache_size():
+    return get_config_entry('type_cache_size', default=10000)
+
+
 def register_code_style(name, obj):
     '''Add a new code style to auto_docstring.
 
     Args:
-        name (str): The name of the code-style to use.
-        obj: The Python class needed to generate this style's docstrings.
+        name (str):
+            The name of the code-style to use.
+        obj (object or str):
+            The Python class needed to generate this style's docstrings.
+            If a dot "." import path is given, like ".styles.google.GoogleStyle",
+            the class is only imported once the style is first used.
 
     '''
-    _STYLES[name] = obj
+    context.get_current_context().styles[name] = obj
 
 
 def drop_trailing_characters(text, characters=''):
@@ -260,9 +582,15 @@ def drop_trailing_characters(text, characters=''):
 register_config_entry('container_prefix', predicate=_get_container_prefix)
 register_config_entry('container_suffix', predicate=_get_container_suffix)
 register_config_entry('delimiter', predicate=_get_docstring_delimiter)
+register_config_entry('fast_path', predicate=_allow_fast_path)
 register_config_entry('indent', predicate=_get_default_indent)
 register_config_entry('option_separator', predicate=_get_option_separator)
 register_config_entry('raw_prefix', predicate=_auto_raw_prefix)
+register_config_entry('result_cache_size', predicate=_get_result_cache_size)
 register_config_entry('style', predicate=_get_current_style)
-register_config_entry('type_follow', predicate=_allow_type_follow)
+register_config_entry('time_budget', predicate=_get_time_budget)
+register_config_entry('type_cache', predicate=_get_type_cache_path)
+register_config_entry('type_cache_size', predicate=_get_type_cache_size)
+register_config_entry('type_follow_depth', predicate=_get_legacy_type_follow_depth)
+register_config_entry('type_follow_depth', predicate=_get_type_follow_depth)
 register_config_entry('description_separator', predicate=_get_description_separator)
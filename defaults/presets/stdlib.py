@@ -7,7 +7,7 @@
 import os
 
 # IMPORT LOCAL LIBRARIES
-from ...auto_docstring.blocks.google import common_type
+from ...blocks.google import common_type
 from .. import registry
 
 
@@ -5,12 +5,114 @@
 
 # IMPORT STANDARD LIBRARIES
 import functools
+import importlib
+import threading
+import hashlib
 
 # IMPORT THIRD-PARTY LIBRARIES
 import six
 
+# IMPORT LOCAL LIBRARIES
+from ..config import context
 
-_KNOWN_TYPES = dict()
+
+_PRESETS = ('.presets.stdlib', )
+
+# Preset modules only call `register` the first time that they are imported
+# so their default values are kept here and copied into each context
+#
+_PRESET_CONTEXT = context.Context()
+_PRESET_CONTEXT.presets_loaded = True
+_PRESET_LOCK = threading.Lock()
+_PRESETS_IMPORTED = False
+
+
+def _import_presets():
+    '''Import every preset module and store their default values, if needed.'''
+    global _PRESETS_IMPORTED  # pylint: disable=global-statement
+
+    with _PRESET_LOCK:
+        if _PRESETS_IMPORTED:
+            return
+
+        with _PRESET_CONTEXT.activate():
+            for path in _PRESETS:
+                importlib.import_module(path, package=__name__.rsplit('.', 1)[0])
+
+        _PRESETS_IMPORTED = True
+
+
+def _load_presets():
+    '''Register the default values of every preset module, if needed.
+
+    Presets import modules (like astroid) that are slow to import. So instead
+    of loading them when auto_docstring is imported, they are loaded the first
+    time that the registry is used.
+
+    Returns:
+        :class:`auto_docstring.config.context.Context`: The current context.
+
+    '''
+    current = context.get_current_context()
+
+    if current.presets_loaded:
+        return current
+
+    _import_presets()
+    current.presets_loaded = True
+
+    for obj, value in six.iteritems(_PRESET_CONTEXT.known_types):
+        current.known_types.setdefault(obj, value)
+
+    current.generation = context.next_generation()
+
+    return current
+
+
+def get_generation():
+    '''int: A number that changes every time that a default value is changed.'''
+    return context.get_current_context().generation
+
+
+def _get_label(obj):
+    '''str: Get a name for `obj` which is the same in every Python process.'''
+    if isinstance(obj, six.string_types):
+        return obj
+
+    name = getattr(obj, '__qualname__', getattr(obj, '__name__', obj.__class__.__name__))
+    return '{module}.{name}'.format(module=getattr(obj, '__module__', ''), name=name)
+
+
+def get_signature():
+    '''Create a hash which represents every registered default value.
+
+    Unlike :func:`get_generation`, this hash is the same across Python
+    processes, as long as the same default values are registered.
+
+    Returns:
+        str: The created hash.
+
+    '''
+    current = _load_presets()
+
+    generation, signature = current.signature
+
+    if generation == current.generation:
+        return signature
+
+    generation = current.generation
+    items = sorted(
+        (_get_label(obj), _get_label(value))
+        for obj, value in list(current.known_types.items()))
+    signature = hashlib.sha1(repr(items).encode('utf-8')).hexdigest()
+    current.signature = (generation, signature)
+
+    return signature
+
+
+def is_constant(obj):
+    '''bool: If `obj` was registered with a string, instead of a callable function.'''
+    return isinstance(_load_presets().known_types.get(obj), six.string_types)
 
 
 def get_default(obj, default=None):
@@ -31,8 +133,10 @@ def get_default(obj, default=None):
         '''Return the given object and ignore all other input.'''
         return obj
 
+    current = _load_presets()
+
     try:
-        value = _KNOWN_TYPES[obj]
+        value = current.known_types[obj]
     except KeyError:
         return default
 
@@ -43,11 +147,13 @@ def get_default(obj, default=None):
 
 
 def deregister_all():
-    '''Forget all object default values.'''
-    _KNOWN_TYPES.clear()
+    '''Forget all object default values, including the default presets.'''
+    current = context.get_current_context()
+    current.presets_loaded = True
+    current.known_types.clear()
+    current.generation = context.next_generation()
 
 
-# TODO : Add to __init__.py
 def register(obj, returns):
     '''Add a default value for the given `obj`.
 
@@ -64,4 +170,6 @@ def register(obj, returns):
             If the given object is a string, then it will just be returned.
 
     '''
-    _KNOWN_TYPES[obj] = returns
+    current = _load_presets()
+    current.known_types[obj] = returns
+    current.generation = context.next_generation()
@@ -3,13 +3,24 @@
 
 '''The module that's responsible for add docstrings to source-code.'''
 
+# IMPORT STANDARD LIBRARIES
+import contextlib
+import hashlib
+
 # IMPORT THIRD-PARTY LIBRARIES
 import astroid
+import six
 
 # IMPORT LOCAL LIBRARIES
+from .config import context as config_context
+from .blocks.google import common_type
 from .config import common
+from .config import budget
+from . import result_cache
+from . import profiler
 from .parsing import visit
 from .parsing import numberify
+from .parsing import syntax
 from .config import environment
 from .parsing import ultisnips_build
 
@@ -23,41 +34,397 @@ def _needs_prefix(text):
     return False
 
 
-def create_docstring(code, row, style='', wrap=False):
-    '''Create a docstring for the given `code`, at the specified `row`.
+class DocstringSession(object):
+
+    '''An object that keeps the parsed information of one buffer of code.
+
+    Parsing a module and gathering its information is the most expensive part
+    of creating a docstring. If an editor asks for docstrings in the same
+    buffer many times, this class lets each request re-use the parse from
+    the last request, as long as the buffer's text has not changed.
+
+    The information of each function is only gathered the first time
+    that a docstring is requested for it.
+
+    If a function only uses its own names and Python's builtins, only that
+    function is given to astroid. The rest of the module is parsed with
+    Python's faster `ast` module. See :mod:`auto_docstring.parsing.syntax`.
+
+    Attributes:
+        last_path (str):
+            How the function of the last request was found. "ast" if only
+            the function was built with astroid or "astroid" if the whole
+            module was. If nothing was requested yet, this is empty.
+
+    Example:
+        >>> session = DocstringSession()
+        >>> create_docstring(code, row=10, session=session)  # Parses `code`
+        >>> create_docstring(code, row=40, session=session)  # Re-uses the parse
+        >>> session.last_path
+        ... # Result: "ast"
+
+    '''
+
+    def __init__(self):
+        '''Create the object and start with nothing parsed.'''
+        super(DocstringSession, self).__init__()
+        self.last_path = ''
+        self._key = None
+        self._lines = []
+        self._module = None
+        self._syntax = None
+        self._info = None
+        self._functions = dict()
+        self._snippets = dict()
+        self._snippet_lines = dict()
+
+    @staticmethod
+    def _make_key(code):
+        '''str: Create a hash which uniquely represents the given `code`.'''
+        if isinstance(code, six.text_type):
+            code = code.encode('utf-8')
+
+        return hashlib.sha1(code).hexdigest()
+
+    def _update(self, code):
+        '''Forget the last parse if `code` is different from the last code.
+
+        Args:
+            code (str): The code to parse.
+
+        '''
+        key = self._make_key(code)
+
+        if key == self._key:
+            return
+
+        self.clear()
+        self._lines = code.splitlines()
+        self._key = key
+
+    def get_lines(self, code):
+        '''Get the given `code`, split into lines.
+
+        Args:
+            code (str): The code to split.
+
+        Returns:
+            list[str]: The lines of `code`.
+
+        '''
+        self._update(code)
+        return self._lines
+
+    def get_module(self, code):
+        '''Get the parsed module of the given `code`.
+
+        Args:
+            code (str): The code to parse.
+
+        Returns:
+            `astroid.Module`: The parsed module.
+
+        '''
+        self._update(code)
+
+        if self._module is None:
+            with profiler.stage('parse'):
+                self._module = astroid.parse(code)
+
+        return self._module
+
+    def get_info(self, code):
+        '''Get everything needed to build docstrings for the given `code`.
+
+        Args:
+            code (str): The code to parse and break down into parts.
+
+        Returns:
+            dict[str]: The information from :func:`auto_docstring.parsing.visit.get_info`.
+
+        '''
+        module = self.get_module(code)
+
+        if self._info is None:
+            with profiler.stage('get_info'):
+                self._info = visit.get_info(module)
+
+        return self._info
+
+    def _get_syntax(self, code):
+        '''Parse `code` with Python's `ast` module.
+
+        Args:
+            code (str): The code to parse.
+
+        Returns:
+            :class:`auto_docstring.parsing.syntax.SyntaxTree` or NoneType:
+                The parsed code or nothing, if `ast` could not parse it.
+
+        '''
+        if self._syntax is None:
+            with profiler.stage('parse_ast'):
+                try:
+                    self._syntax = syntax.SyntaxTree(code)
+                except (SyntaxError, ValueError):
+                    # Let astroid raise its own error, later
+                    self._syntax = False
+
+        return self._syntax or None
+
+    def _get_self_contained_node(self, code, row):
+        '''Find the function at `row`, if it can be built without the rest of `code`.
+
+        Args:
+            code (str): The code to search through.
+            row (int): The point in the code to find a function for.
+
+        Returns:
+            `astroid.FunctionDef` or NoneType: The found function, if any.
+
+        '''
+        tree = self._get_syntax(code)
+
+        if tree is None:
+            return None
+
+        source = tree.get_function_at_row(row)
+
+        if source is None or not tree.is_self_contained(source):
+            return None
+
+        key = (source.start, source.end)
+
+        try:
+            return self._snippets[key]
+        except KeyError:
+            pass
+
+        with profiler.stage('parse'):
+            node = tree.build(source)
+
+        self._snippets[key] = node
+        self._snippet_lines[node] = tree.get_source(source).splitlines()
+
+        return node
+
+    def get_node(self, code, row):
+        '''Find the function whose docstring is closest to `row`.
+
+        Only the statements around `row` are searched. If no function
+        contains `row`, every function in `code` is gathered and the closest
+        function is used, instead.
+
+        Args:
+            code (str): The code to parse and search through.
+            row (int): The point in the code to find a function for.
+
+        Returns:
+            `astroid.FunctionDef` or NoneType: The found function, if any.
+
+        '''
+        self._update(code)
+
+        # Once the whole module is built, it's faster to keep using it
+        if self._module is None and environment.allow_fast_path():
+            node = self._get_self_contained_node(code, row)
+
+            if node is not None:
+                self.last_path = syntax.AST_PATH
+                return node
+
+        self.last_path = syntax.ASTROID_PATH
+        node = visit.get_function_at_row(self.get_module(code), row)
+
+        if node is not None:
+            return node
+
+        return visit.get_closest_docstring_node(row, self.get_info(code))
+
+    def get_source(self, code, node):
+        '''Get the lines and module that the given function was built from.
+
+        Args:
+            code (str): The code that contains `node`.
+            node (`astroid.FunctionDef`): A function from :meth:`get_node`.
+
+        Returns:
+            tuple[list[str], `astroid.Module`]: The source-code and parsed module of `node`.
+
+        '''
+        self._update(code)
+
+        try:
+            return (self._snippet_lines[node], node.root())
+        except KeyError:
+            return (self._lines, self.get_module(code))
+
+    def get_function_info(self, code, node):
+        '''Get everything needed to build the docstring of a function in `code`.
+
+        Args:
+            code (str): The code that contains `node`.
+            node (`astroid.FunctionDef`): The function to break down into parts.
+
+        Returns:
+            :class:`auto_docstring.parsing.visit.FunctionInfo`: The gathered information.
+
+        '''
+        self._update(code)
+
+        if self._info is not None and node in self._info['nodes']:
+            group = self._info['nodes'][node]
+            return self._info[group][node]
+
+        try:
+            return self._functions[node]
+        except KeyError:
+            pass
+
+        with profiler.stage('get_info'):
+            info = visit.get_function_info(node)
+
+        self._functions[node] = info
+
+        return info
+
+    def clear(self):
+        '''Forget the last code that was parsed.'''
+        self._key = None
+        self._lines = []
+        self._module = None
+        self._syntax = None
+        self._info = None
+        self._functions = dict()
+        self._snippets = dict()
+        self._snippet_lines = dict()
+
+
+@contextlib.contextmanager
+def _use_settings(context=None, config=None):
+    '''Use the given context and config while in this context.
+
+    Args:
+        context (:class:`auto_docstring.config.context.Context`, optional):
+            The settings, styles and default values to use.
+            If no context is given, the current context is kept.
+        config (:class:`auto_docstring.config.environment.Config`, optional):
+            The resolved settings to use. If no config is given,
+            the settings of the context are resolved once.
+
+    '''
+    if context is None:
+        context = config_context.get_current_context()
+
+    with context.activate():
+        if config is None:
+            config = environment.get_config()
+
+        with environment.use_config(config):
+            yield
+
+
+def _get_result_cache():
+    '''Get the cache of generated docstrings, if the user allows it.
+
+    Returns:
+        :class:`auto_docstring.result_cache.ResultCache` or NoneType:
+            The cache or nothing, if the cache size is 0.
+
+    '''
+    size = environment.get_result_cache_size()
+
+    if not size:
+        return None
+
+    cache = result_cache.get_default_cache()
+
+    if cache.max_size != size:
+        cache.resize(size)
+
+    return cache
+
+
+def _get_docstring_node(code, row, session):
+    '''Find the node whose docstring is closest to `row`.
 
     Args:
         code (str): The code to create a docstring for.
         row (int): The point in the code to create a docstring for.
-        style (:obj:`str`, optional):
-            The style to use to create the docstring. If no style is given,
-            a default style is used from the `AUTO_DOCSTRING_STYLE`
-            environment variable. If that variable isn't set,
-            the code-style defaults to "google".
-        wrap (:obj:`bool`, optional):
-            If True, add `"""` around the generated docstring.
-            If False, do not add any delimiter around the generated docstring.
-            Default is False.
+        session (:class:`DocstringSession`): The parsed `code`.
 
     Returns:
-        str: The auto-generated docstring.
+        `astroid.NodeNG`: The found node.
 
     '''
-    if not style:
-        style = environment.get_current_style()
+    with profiler.stage('get_closest_docstring_node'):
+        return session.get_node(code, row)
+
+
+def _get_docstring_info(code, node_that_needs_a_docstring, session):
+    '''Find the information of the node that needs a docstring.
+
+    Args:
+        code (str): The code to create a docstring for.
+        node_that_needs_a_docstring (`astroid.NodeNG`): The node to get the info of.
+        session (:class:`DocstringSession`): The parsed `code`.
+
+    Returns:
+        :class:`auto_docstring.parsing.visit.FunctionInfo`:
+            The information needed to draw the node's docstring.
+
+    '''
+    return session.get_function_info(code, node_that_needs_a_docstring)
+
+
+def _resolve_return_types(node):
+    '''Find the return-types of the local functions that `node` returns or yields.
+
+    Functions which call each other are resolved as one unit, before the
+    docstring is drawn. See
+    :func:`auto_docstring.blocks.google.common_type.resolve_return_types`.
+
+    Args:
+        node (`astroid.NodeNG`): The node whose docstring will be drawn.
+
+    '''
+    if not isinstance(node, astroid.FunctionDef):
+        return
+
+    try:
+        with profiler.stage('resolve_return_types'):
+            # Functions whose types can't be inferred are left out. If the
+            # docstring needs them, drawing raises their error again
+            #
+            common_type.resolve_return_types(node)
+    except budget.DeadlineExceeded:
+        # Drawing stops at the same deadline and leaves the types to fill in
+        pass
+
+
+def _draw_docstring(node, docstring_info, style):
+    '''Draw the docstring of some node, using its gathered information.
+
+    Args:
+        node (`astroid.NodeNG`): The node to draw the docstring of.
+        docstring_info (:class:`auto_docstring.parsing.visit.FunctionInfo`):
+            The information needed to draw the docstring.
+        style (str): The name of the style to use to create the docstring.
 
-    # Parse the code
-    node = astroid.parse(code)
-    full_info = visit.get_info(node)
-    node_that_needs_a_docstring = visit.get_closest_docstring_node(row, full_info)
+    Returns:
+        str: The auto-generated docstring.
 
-    # Find the node's group and then get its info
-    group = full_info['nodes'][node_that_needs_a_docstring]
-    docstring_info = full_info[group][node_that_needs_a_docstring]
+    '''
+    _resolve_return_types(node)
+    budget.check_cancelled()
 
     # draw the docstring!
     style_object = common.create_code_style(style)
-    initial_docstring = '\n'.join(style_object.draw(docstring_info))
+
+    with profiler.stage('draw'):
+        initial_docstring = '\n'.join(style_object.draw(docstring_info))
+
+    budget.check_cancelled()
 
     # Now the most important part, we need to convert the docstring that was
     # generated into a numbered-format string
@@ -82,8 +449,55 @@ def create_docstring(code, row, style='', wrap=False):
     #
     #     '''
     #
-    parser = numberify.RecursiveNumberifyParser()
-    generated_docstring = parser.parse(initial_docstring)
+    with profiler.stage('numberify'):
+        parser = numberify.RecursiveNumberifyParser()
+        return parser.parse(initial_docstring)
+
+
+def _create_docstring(code, row, session, style, wrap=False):
+    '''Create the docstring of the node at `row`, using the result cache if possible.
+
+    Args:
+        code (str): The code to create a docstring for.
+        row (int): The point in the code to create a docstring for.
+        session (:class:`DocstringSession`): The parsed `code`.
+        style (str): The name of the style to use to create the docstring.
+        wrap (:obj:`bool`, optional):
+            If True, add `"""` around the generated docstring.
+            If False, do not add any delimiter around the generated docstring.
+            Default is False.
+
+    Raises:
+        :class:`auto_docstring.config.budget.Cancelled`:
+            If the current time budget's event is set before the docstring is done.
+
+    Returns:
+        str: The auto-generated docstring.
+
+    '''
+    # Stop between stages so that cancelled work doesn't keep using the CPU
+    budget.check_cancelled()
+    node = _get_docstring_node(code, row, session)
+    budget.check_cancelled()
+    docstring_info = _get_docstring_info(code, node, session)
+    budget.check_cancelled()
+    cache = _get_result_cache()
+
+    if cache is None:
+        generated_docstring = _draw_docstring(node, docstring_info, style)
+    else:
+        with profiler.stage('make_cache_key'):
+            lines, module = session.get_source(code, node)
+            key = result_cache.make_key(lines, module, node, style)
+
+        generated_docstring = cache.get(key)
+
+        if generated_docstring is None:
+            generated_docstring = _draw_docstring(node, docstring_info, style)
+
+            # If time ran out, some types may have been skipped. Don't keep those
+            if not budget.expired():
+                cache.add(key, generated_docstring)
 
     if wrap:
         delimiter = environment.get_docstring_delimiter()
@@ -92,7 +506,116 @@ def create_docstring(code, row, style='', wrap=False):
     return generated_docstring
 
 
-def create_ultisnips_docstring(code, row, style='', wrap=False):
+def create_docstring(
+        code, row, style='', wrap=False, session=None, deadline=None, config=None, context=None):
+    '''Create a docstring for the given `code`, at the specified `row`.
+
+    Args:
+        code (str): The code to create a docstring for.
+        row (int): The point in the code to create a docstring for.
+        style (:obj:`str`, optional):
+            The style to use to create the docstring. If no style is given,
+            a default style is used from the `AUTO_DOCSTRING_STYLE`
+            environment variable. If that variable isn't set,
+            the code-style defaults to "google".
+        wrap (:obj:`bool`, optional):
+            If True, add `"""` around the generated docstring.
+            If False, do not add any delimiter around the generated docstring.
+            Default is False.
+        session (:class:`DocstringSession`, optional):
+            If given, the parsed `code` is stored in and re-used from this object.
+            If no session is given, `code` is parsed on every call.
+        deadline (:obj:`float`, optional):
+            The time budget of this docstring, in seconds. Once it runs out,
+            any type that still needs to be inferred is left as an empty "{!f}".
+            If no time is given, the `AUTO_DOCSTRING_TIME_BUDGET` environment
+            variable is used. If that variable isn't set, there is no budget.
+        config (:class:`auto_docstring.config.environment.Config`, optional):
+            The settings to draw the docstring with. If no config is given,
+            every setting is resolved once, at the start of this call.
+        context (:class:`auto_docstring.config.context.Context`, optional):
+            The settings, styles and default values to use for this call.
+            If no context is given, the context of the current thread is used.
+
+    Raises:
+        :class:`auto_docstring.config.budget.Cancelled`:
+            If this call runs in a time budget whose event gets set.
+
+    Returns:
+        str: The auto-generated docstring.
+
+    '''
+    with _use_settings(context=context, config=config):
+        if not style:
+            style = environment.get_current_style()
+
+        if deadline is None:
+            deadline = environment.get_time_budget()
+
+        with budget.limit(deadline):
+            # Parse the code
+            if session is None:
+                session = DocstringSession()
+
+            return _create_docstring(code, row, session, style, wrap=wrap)
+
+
+def create_docstrings(
+        code, rows, style='', wrap=False, session=None, deadline=None, config=None, context=None):
+    '''Create a docstring for the given `code`, at each of the given `rows`.
+
+    Unlike calling :func:`create_docstring` once per-row, `code` is only
+    parsed once and that parse is shared by every row.
+
+    Args:
+        code (str): The code to create docstrings for.
+        rows (iter[int]): The points in the code to create docstrings for.
+        style (:obj:`str`, optional):
+            The style to use to create the docstrings. If no style is given,
+            a default style is used from the `AUTO_DOCSTRING_STYLE`
+            environment variable. If that variable isn't set,
+            the code-style defaults to "google".
+        wrap (:obj:`bool`, optional):
+            If True, add `"""` around each generated docstring.
+            If False, do not add any delimiter around the generated docstrings.
+            Default is False.
+        session (:class:`DocstringSession`, optional):
+            If given, the parsed `code` is stored in and re-used from this object.
+            If no session is given, `code` is parsed once for this call.
+        deadline (:obj:`float`, optional):
+            The time budget of each docstring, in seconds.
+            See :func:`create_docstring` for details.
+        config (:class:`auto_docstring.config.environment.Config`, optional):
+            The settings to draw the docstrings with. If no config is given,
+            every setting is resolved once and shared by every row.
+        context (:class:`auto_docstring.config.context.Context`, optional):
+            The settings, styles and default values to use.
+            See :func:`create_docstring` for details.
+
+    Returns:
+        list[str]: The auto-generated docstrings, in the same order as `rows`.
+
+    '''
+    with _use_settings(context=context, config=config):
+        if not style:
+            style = environment.get_current_style()
+
+        if deadline is None:
+            deadline = environment.get_time_budget()
+
+        if session is None:
+            session = DocstringSession()
+
+        output = []
+        for row in rows:
+            with budget.limit(deadline):
+                output.append(_create_docstring(code, row, session, style, wrap=wrap))
+
+    return output
+
+
+def create_ultisnips_docstring(
+        code, row, style='', wrap=False, session=None, deadline=None, config=None, context=None):
     '''Create an UltiSnips-style docstring for the given `code`.
 
     Args:
@@ -109,26 +632,42 @@ def create_ultisnips_docstring(code, row, style='', wrap=False):
             If True, add `"""` around the generated docstring.
             If False, do not add any delimiter around the generated docstring.
             Default is False.
+        session (:class:`DocstringSession`, optional):
+            If given, the parsed `code` is stored in and re-used from this object.
+            If no session is given, `code` is parsed on every call.
+        deadline (:obj:`float`, optional):
+            The time budget of this docstring, in seconds.
+            See :func:`create_docstring` for details.
+        config (:class:`auto_docstring.config.environment.Config`, optional):
+            The settings to draw the docstring with.
+            See :func:`create_docstring` for details.
+        context (:class:`auto_docstring.config.context.Context`, optional):
+            The settings, styles and default values to use.
+            See :func:`create_docstring` for details.
 
     Returns:
         str: The auto-generated, UltiSnips docstring.
 
     '''
-    docstring = create_docstring(code, row, style=style)
-    docstring = convert_to_ultisnips(docstring)
+    with _use_settings(context=context, config=config):
+        docstring = create_docstring(code, row, style=style, session=session, deadline=deadline)
+        budget.check_cancelled()
+        docstring = convert_to_ultisnips(docstring)
+
+        # TODO : Once parsing has been fixed, remove this "if wrap:" condition
+        # and get create_docstring do it, instead.
+        #
+        if wrap:
+            delimiter = environment.get_docstring_delimiter()
+            return delimiter + docstring + delimiter
 
-    # TODO : Once parsing has been fixed, remove this "if wrap:" condition
-    # and get create_docstring do it, instead.
-    #
-    if wrap:
-        delimiter = environment.get_docstring_delimiter()
-        return delimiter + docstring + delimiter
     return docstring
 
 
 def convert_to_ultisnips(code):
     '''Convert an auto-generated docstring to a UltiSnips-style docstring.'''
-    return ultisnips_build.RecursiveParser().parse(code)
+    with profiler.stage('convert_to_ultisnips'):
+        return ultisnips_build.RecursiveParser().parse(code)
 
 
 def add_docstring(code, row, style='', mode='replace'):
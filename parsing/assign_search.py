@@ -10,14 +10,29 @@ This module is made to assist this process.
 
 '''
 
+# IMPORT STANDARD LIBRARIES
+import collections
+import weakref
+
 # IMPORT THIRD-PARTY LIBRARIES
 import astroid
 
+# IMPORT LOCAL LIBRARIES
+from . import visit
+
+
+# Each scope and its assignments. The assignments are weak references because
+# they point back to the scope, which would keep the scope alive, forever
+#
+_INDEXES = weakref.WeakKeyDictionary()
 
-class AssignmentVisitor(object):
+
+class AssignmentVisitor(visit.DispatchVisitor):
 
     '''A node visitor that captures `astroid.Assign` nodes.'''
 
+    handlers = {astroid.Assign: 'visit_assign'}
+
     def __init__(self, *args, **kwargs):
         '''Create a blank list of assignments to store nodes into.'''
         super(AssignmentVisitor, self).__init__(*args, **kwargs)
@@ -27,14 +42,6 @@ class AssignmentVisitor(object):
         '''Store the given `astroid.Assign` node.'''
         self.assignments.append(node)
 
-    def visit(self, node):
-        '''Find all `astroid.Assign` nodes in the given `node`, recursively.'''
-        for child in node.get_children():
-            try:
-                child.accept(self)
-            except AttributeError:
-                self.visit(child)
-
 
 # TODO : This can probably be moved or replaced with visit.get_type
 def get_ast_type(node):
@@ -57,6 +64,15 @@ def get_ast_type(node):
         raise NotImplementedError('Node: "{node}" is not supported yet.'.format(node=node))
 
 
+def _get_target_name(target, visitor):
+    '''str: Get the source-code of an assignment target, like "foo" or "self.bar".'''
+    if isinstance(target, astroid.AssignName):
+        # This is what `visitor` would return, anyway
+        return target.name
+
+    return target.accept(visitor)
+
+
 def get_assign_names(node):
     '''Find the name of every assigned variable, given some node.
 
@@ -71,7 +87,64 @@ def get_assign_names(node):
 
     '''
     visitor = astroid.as_string.AsStringVisitor(indent='')
-    return [n.accept(visitor) for n in node.targets]
+    return [_get_target_name(target, visitor) for target in node.targets]
+
+
+def _get_index(node):
+    '''Find every assignment in `node` and keep them until `node` is garbage-collected.
+
+    Args:
+        node (`astroid.NodeNG`): The outer-scope (usually, a FunctionDef) to search within.
+
+    Returns:
+        dict[str, list[`weakref.ref`]]:
+            Each assigned name and its assignments, in the order they were found.
+
+    '''
+    try:
+        return _INDEXES[node]
+    except KeyError:
+        pass
+
+    visitor = AssignmentVisitor()
+    visitor.visit(node)
+
+    index = collections.defaultdict(list)
+    string_visitor = astroid.as_string.AsStringVisitor(indent='')
+
+    for assign in visitor.assignments:
+        names = set()
+
+        for target in assign.targets:
+            names.add(_get_target_name(target, string_visitor))
+
+        for name in names:
+            index[name].append(weakref.ref(assign))
+
+    index = dict(index)
+    _INDEXES[node] = index
+
+    return index
+
+
+def get_assignment_index(node):
+    '''Find every assignment in `node`, grouped by the name that it assigns.
+
+    The assignments are only searched for the first time that they're
+    needed for `node`.
+
+    Args:
+        node (`astroid.NodeNG`): The outer-scope (usually, a FunctionDef) to search within.
+
+    Returns:
+        dict[str, list[`astroid.Assign`]]:
+            Each assigned name and its assignments, in the order they were found.
+
+    '''
+    return {
+        name: [reference() for reference in references]
+        for name, references in _get_index(node).items()
+    }
 
 
 def find_node_type(node, name):
@@ -93,19 +166,11 @@ def find_node_type(node, name):
         The found type.
 
     '''
-    visitor = AssignmentVisitor()
-    visitor.visit(node)
-
-    matches = []
-    for assign in visitor.assignments:
-        if name in get_assign_names(assign):
-            matches.append(assign)
+    matches = _get_index(node).get(name)
 
-    # We reverse the matches because the last assignment will always be the most
-    # current assignment
-    #
-    for assign in reversed(matches):
-        return get_ast_type(assign.value)
+    if not matches:
+        raise RuntimeError('Node/Name: "{node}/{name}" was not found.'.format(
+            node=node, name=name))
 
-    raise RuntimeError('Node/Name: "{node}/{name}" was not found.'.format(
-        node=node, name=name))
+    # The last assignment will always be the most current assignment
+    return get_ast_type(matches[-1]().value)
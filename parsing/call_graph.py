@@ -0,0 +1,199 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''Find which functions of a module call each other.
+
+The return-type of a function which returns the result of another local
+function depends on that other function's return-type. If the functions
+are resolved in an order where every called function comes first, each
+function only needs to be resolved once.
+
+Functions that call each other (directly or through other functions) are
+grouped together. Their types depend on each other so no order is better
+than another, for them.
+
+Example:
+    >>> graph = get_call_graph(functions, get_name)
+    >>> for group in get_strongly_connected_components(graph):
+    ...     # Every function that `group` calls was already given
+    ...     print(group)
+
+'''
+
+# IMPORT STANDARD LIBRARIES
+import collections
+
+# IMPORT THIRD-PARTY LIBRARIES
+import astroid
+
+
+_SCOPE_TYPES = (astroid.FunctionDef, astroid.ClassDef, astroid.Lambda)
+
+
+def _get_value_calls(function, statement_type):
+    '''Find every call that `function` makes in the values of its `statement_type` nodes.'''
+    calls = []
+
+    # Nested functions, classes and lambdas return (or yield) their own values
+    for statement in function.nodes_of_class(statement_type, skip_klass=_SCOPE_TYPES):
+        if statement.value is not None and not isinstance(statement.value, astroid.Lambda):
+            calls.extend(statement.value.nodes_of_class(astroid.Call, skip_klass=astroid.Lambda))
+
+    return calls
+
+
+def get_return_calls(function):
+    '''Find every call that `function` makes while creating its return values.
+
+    Args:
+        function (`astroid.FunctionDef`): The function to check.
+
+    Returns:
+        list[`astroid.Call`]: The found calls, in the order they were found.
+
+    '''
+    return _get_value_calls(function, astroid.Return)
+
+
+def get_yield_calls(function):
+    '''Find every call that `function` makes while creating its yielded values.
+
+    Args:
+        function (`astroid.FunctionDef`): The function to check.
+
+    Returns:
+        list[`astroid.Call`]: The found calls, in the order they were found.
+
+    '''
+    return _get_value_calls(function, astroid.Yield)
+
+
+def get_callees(calls, functions, get_name):
+    '''Find the functions that the given `calls` call.
+
+    Args:
+        calls (iter[`astroid.Call`]): The calls to check.
+        functions (dict[str, `astroid.FunctionDef`]):
+            Each name that can be called and the function that it calls.
+        get_name (callable[`astroid.NodeNG`] -> str):
+            A function that gets the name that a call's `func` looks up.
+            If it can't find a name, it may raise any exception.
+
+    Returns:
+        list[`astroid.FunctionDef`]: Each called function, once, in the order they were found.
+
+    '''
+    called = []
+
+    for call in calls:
+        try:
+            name = get_name(call.func)
+        except Exception:  # pylint: disable=broad-except
+            continue
+
+        callee = functions.get(name)
+
+        if callee is not None and callee not in called:
+            called.append(callee)
+
+    return called
+
+
+def get_call_graph(functions, get_name):
+    '''Find the functions that each function calls in its return values.
+
+    Args:
+        functions (dict[str, `astroid.FunctionDef`]):
+            Each name that can be called and the function that it calls.
+        get_name (callable[`astroid.NodeNG`] -> str):
+            A function that gets the name that a call's `func` looks up.
+            If it can't find a name, it may raise any exception.
+
+    Returns:
+        `collections.OrderedDict`[`astroid.FunctionDef`, list[`astroid.FunctionDef`]]:
+            Each function and the functions that it calls, in source-order.
+
+    '''
+    graph = collections.OrderedDict()
+    functions_in_order = sorted(
+        set(functions.values()), key=lambda node: (node.lineno, node.col_offset))
+
+    for function in functions_in_order:
+        graph[function] = get_callees(get_return_calls(function), functions, get_name)
+
+    return graph
+
+
+def get_strongly_connected_components(graph):
+    '''Group the nodes of `graph` which can reach each other.
+
+    This is Tarjan's algorithm. It uses an explicit stack so that long
+    chains of calls can't reach Python's recursion limit.
+
+    Args:
+        graph (dict[object, list[object]]):
+            Each node and the nodes that it points to. Nodes that are
+            pointed to but aren't in `graph` are ignored.
+
+    Returns:
+        list[list[object]]: Each group. A group comes after every group that it points to.
+
+    '''
+    indexes = dict()
+    lowest = dict()
+    stack = []
+    on_stack = set()
+    components = []
+    # The nodes that are being visited and the children that they have left
+    work = []
+
+    def start(node):
+        '''Give `node` the next index and start to visit it.'''
+        indexes[node] = lowest[node] = len(indexes)
+        stack.append(node)
+        on_stack.add(node)
+        work.append((node, iter(graph[node])))
+
+    for root in graph:
+        if root in indexes:
+            continue
+
+        start(root)
+
+        while work:
+            node, children = work[-1]
+
+            for child in children:
+                if child not in graph:
+                    continue
+
+                if child not in indexes:
+                    start(child)
+                    break
+
+                if child in on_stack:
+                    lowest[node] = min(lowest[node], indexes[child])
+            else:
+                work.pop()
+
+                if work:
+                    parent = work[-1][0]
+                    lowest[parent] = min(lowest[parent], lowest[node])
+
+                if lowest[node] != indexes[node]:
+                    continue
+
+                component = []
+
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+
+                    if member is node:
+                        break
+
+                component.reverse()
+                components.append(component)
+
+    return components
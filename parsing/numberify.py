@@ -168,31 +168,30 @@ class RecursiveNumberifyParser(ultisnips_build.RecursiveParser):
 
         '''
         # expected - text that doesn't already have !f on it
-        def _add_conversion(items):
-            if not check.is_itertype(items):
-                return items
-
+        def _is_convertible(items):
             try:
-                is_convertible = cls._is_list_convertible(items)
+                return cls._is_list_convertible(items)
             except AttributeError:
-                # If this happens, it's because items is a nested list
-                # Since lists are recursively processed by _add_conversion, it's
-                # OK to just set this value to False. Other recursion levels
-                # will sort it out
+                # If this happens, it's because items ends with a nested list.
+                # That nested list is processed on its own so it's OK to
+                # just return False, here
                 #
-                is_convertible = False
-
-            for index, item in enumerate(items):
-                items[index] = _add_conversion(item)
+                return False
 
+        def _add_list_conversion(items, is_convertible):
             if not is_convertible:
                 items.insert(0, ':')
                 items.insert(0, str(common.get_unique_number()))
                 items.append(cls.conversion_text)
 
             # Re-add the "{}"s that pyparsing removed
-            output = cls._wrap(items)
-            return output
+            return cls._wrap(items)
+
+        def _add_conversion(items):
+            if not check.is_itertype(items):
+                return items
+
+            return cls._expand_nested(items, _is_convertible, _add_list_conversion)
 
         output = cls._parse(text, function=_add_conversion)
 
@@ -0,0 +1,392 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''Find functions with Python's own `ast` module, before astroid is needed.
+
+Building an astroid tree of a whole module is much slower than parsing it
+with :mod:`ast`. But many functions only use their own args and variables
+and Python's builtins. The types of those functions don't depend on anything
+else in the module so only the function's own source-code is given to astroid.
+
+Functions that use any other name of the module still need the full tree.
+
+Example:
+    >>> tree = SyntaxTree(code)
+    >>> source = tree.get_function_at_row(10)
+    >>> if source is not None and tree.is_self_contained(source):
+    ...     node = tree.build(source)  # An `astroid.FunctionDef` of just that function
+
+'''
+
+# IMPORT STANDARD LIBRARIES
+import collections
+import ast
+
+# IMPORT THIRD-PARTY LIBRARIES
+import astroid
+import six
+
+
+AST_PATH = 'ast'
+ASTROID_PATH = 'astroid'
+
+_FUNCTION_TYPES = tuple(
+    getattr(ast, name) for name in ('FunctionDef', 'AsyncFunctionDef') if hasattr(ast, name))
+_SCOPE_TYPES = _FUNCTION_TYPES + (ast.ClassDef, )
+_ARG_TYPES = tuple(getattr(ast, name) for name in ('arg', ) if hasattr(ast, name))
+_NONLOCAL_TYPES = tuple(
+    getattr(ast, name) for name in ('Global', 'Nonlocal') if hasattr(ast, name))
+# `super()` and `__class__` find the class of a method, which a function's source doesn't have
+_CLASS_NAMES = frozenset(('super', '__class__'))
+_BUILTIN_NAMES = frozenset(
+    name for name in dir(six.moves.builtins) if not name.startswith('__'))
+
+FunctionSource = collections.namedtuple('FunctionSource', 'node start end parent')
+
+
+def _get_start(node):
+    '''int: Find the first line of `node`, including its decorators.'''
+    lines = [decorator.lineno for decorator in getattr(node, 'decorator_list', [])]
+    lines.append(node.lineno)
+
+    return min(lines)
+
+
+def _get_last_line(node):
+    '''int: Find the last line that any part of `node` is defined on.'''
+    return max(getattr(child, 'lineno', 0) for child in ast.walk(node))
+
+
+def _get_bound_names(node):
+    '''set[str] or NoneType: Find every name that `node` defines or None, for a star-import.'''
+    if isinstance(node, _SCOPE_TYPES):
+        return {node.name}
+
+    if isinstance(node, (ast.Import, ast.ImportFrom)):
+        names = set()
+
+        for alias in node.names:
+            if alias.name == '*':
+                return None
+
+            # "import os.path" defines "os"
+            names.add(alias.asname or alias.name.split('.')[0])
+
+        return names
+
+    if isinstance(node, ast.Name) and not isinstance(node.ctx, ast.Load):
+        return {node.id}
+
+    if isinstance(node, _ARG_TYPES):
+        return {node.arg}
+
+    names = set()
+
+    if isinstance(node, ast.arguments):
+        # `*args` and `**kwargs` are strings in Python 2
+        names.update((node.vararg, node.kwarg))
+    elif isinstance(node, ast.ExceptHandler):
+        # `except Foo as name` is a string in Python 3
+        names.add(node.name)
+
+    return {name for name in names if isinstance(name, six.string_types)}
+
+
+class SyntaxTree(object):
+
+    '''The parsed `ast` of some code and the functions that are found in it.'''
+
+    def __init__(self, code):
+        '''Parse `code`.
+
+        Args:
+            code (str): The Python source-code to parse.
+
+        Raises:
+            SyntaxError: If `code` is not valid Python.
+
+        '''
+        super(SyntaxTree, self).__init__()
+        self.lines = code.split('\n')
+        self.module = ast.parse(code)
+        self._module_names = None
+        self._has_star_import = False
+
+    @staticmethod
+    def _get_body_range(statements, row, limit):
+        '''Find the statement, in `statements`, which contains `row`.
+
+        Args:
+            statements (list[`ast.stmt`]): The statements of one block of code.
+            row (int): The line number to find.
+            limit (int): The last line that the last statement may use.
+
+        Returns:
+            tuple[`ast.stmt` or NoneType, int]:
+                The found statement, if any, and the last line before the
+                statement which follows it.
+
+        '''
+        found = None
+
+        for index, statement in enumerate(statements):
+            if statement.lineno > row:
+                break
+
+            found = index
+
+        if found is None:
+            return (None, limit)
+
+        statement = statements[found]
+
+        # Only statements that start after `row` were skipped so only this
+        # statement can contain `row`. That's why only it needs to be walked
+        #
+        # `row` is the line above the cursor so the cursor is only inside
+        # of `statement` if `row` comes before its last line
+        #
+        if row >= _get_last_line(statement):
+            return (None, limit)
+
+        if found + 1 < len(statements):
+            limit = _get_start(statements[found + 1]) - 1
+
+        return (statement, limit)
+
+    def get_function_at_row(self, row):
+        '''Find the innermost function that contains `row`.
+
+        This follows the same rules as
+        :func:`auto_docstring.parsing.visit.get_function_at_row`.
+
+        Args:
+            row (int): The line number to find a function for.
+
+        Returns:
+            :class:`FunctionSource` or NoneType:
+                The found function, the first and last line of its source-code
+                and the class that it is defined in, if any.
+
+        '''
+        function = None
+        statements = self.module.body
+        limit = len(self.lines)
+        parents = []
+
+        while statements:
+            statement, limit = self._get_body_range(statements, row, limit)
+
+            if statement is None:
+                break
+
+            if isinstance(statement, _FUNCTION_TYPES):
+                parent = None
+                if parents:
+                    parent = parents[-1]
+
+                function = FunctionSource(statement, _get_start(statement), limit, parent)
+
+            parents.append(statement)
+
+            # Check the body of each `if`, `for`, `try`, etc. Any of them may contain `row`
+            statements = []
+            for field in ('body', 'orelse', 'handlers', 'finalbody'):
+                statements.extend(getattr(statement, field, None) or [])
+
+            statements.sort(key=_get_start)
+
+        return function
+
+    def _get_module_names(self):
+        '''Find every name that module-level code defines.
+
+        Returns:
+            set[str] or NoneType: The found names or None, if there is a star-import.
+
+        '''
+        if self._has_star_import:
+            return None
+
+        if self._module_names is not None:
+            return self._module_names
+
+        names = set()
+
+        for statement in self.module.body:
+            nodes = [statement]
+
+            if not isinstance(statement, _SCOPE_TYPES):
+                nodes = ast.walk(statement)
+
+            for node in nodes:
+                found = _get_bound_names(node)
+
+                if found is None:
+                    self._has_star_import = True
+                    return None
+
+                names.update(found)
+
+        self._module_names = frozenset(names)
+
+        return self._module_names
+
+    def _get_future_imports(self):
+        '''list[str]: The `__future__` features that the module uses.'''
+        features = []
+
+        for statement in self.module.body:
+            if isinstance(statement, ast.ImportFrom) and statement.module == '__future__':
+                features.extend(alias.name for alias in statement.names)
+
+        return features
+
+    def is_self_contained(self, source):
+        '''Check if a function can be understood without the rest of its module.
+
+        A function is self-contained if every name that it uses is either
+        defined inside of the function or is a builtin that the module
+        doesn't replace. Methods must also not use their `self` or `cls` arg.
+
+        Args:
+            source (:class:`FunctionSource`): The function to check.
+
+        Returns:
+            bool: If the function's source-code is enough to find its types.
+
+        '''
+        function = source.node
+        parent = source.parent
+
+        if parent is not None and not isinstance(parent, ast.ClassDef):
+            # Nested functions can use the variables of the functions that contain them
+            return False
+
+        if parent is not None and all(parent is not node for node in self.module.body):
+            # Only classes of the module are re-created by `get_source`
+            return False
+
+        module_names = self._get_module_names()
+
+        if module_names is None:
+            return False
+
+        used = set()
+        defined = set()
+
+        if parent is None:
+            defined.add(function.name)
+
+        for decorator in function.decorator_list:
+            # Decorators run in the module, not in the function
+            used.update(
+                node.id for node in ast.walk(decorator) if isinstance(node, ast.Name))
+
+        nodes = [function.args] + function.body
+
+        if getattr(function, 'returns', None) is not None:
+            nodes.append(function.returns)
+
+        for node in nodes:
+            for child in ast.walk(node):
+                if isinstance(child, _NONLOCAL_TYPES):
+                    return False
+
+                if isinstance(child, ast.Name) and isinstance(child.ctx, ast.Load):
+                    used.add(child.id)
+                    continue
+
+                found = _get_bound_names(child)
+
+                if found is None:
+                    return False
+
+                defined.update(found)
+
+        free = used - defined
+
+        if free & module_names or not free <= _BUILTIN_NAMES:
+            return False
+
+        if parent is None:
+            return True
+
+        if free & _CLASS_NAMES:
+            return False
+
+        return self._is_static(function) or not self._uses_first_arg(function, used)
+
+    @staticmethod
+    def _is_static(function):
+        '''bool: If `function` is decorated with `staticmethod`.'''
+        return any(
+            getattr(decorator, 'id', '') == 'staticmethod' for decorator in function.decorator_list)
+
+    @staticmethod
+    def _uses_first_arg(function, used):
+        '''Check if a method reads its `self` or `cls` arg.
+
+        Args:
+            function (`ast.FunctionDef`): The method to check.
+            used (set[str]): Every name that `function` reads.
+
+        Returns:
+            bool: If the first arg is read anywhere in `function`.
+
+        '''
+        args = function.args.args
+
+        if not args:
+            return False
+
+        first = args[0]
+        name = getattr(first, 'arg', None) or getattr(first, 'id', '')
+
+        return name in used
+
+    def get_source(self, source):
+        '''Get code that defines the given function and nothing else.
+
+        A method is given a class with the same name but with no base classes.
+        The module's `__future__` imports are kept because they change how
+        code is parsed.
+
+        Args:
+            source (:class:`FunctionSource`): The function to get the code of.
+
+        Returns:
+            str: The created code.
+
+        '''
+        lines = []
+
+        features = self._get_future_imports()
+
+        if features:
+            lines.append('from __future__ import {}'.format(', '.join(features)))
+
+        if source.parent is not None:
+            lines.append('class {}:'.format(source.parent.name))
+
+        lines.extend(self.lines[source.start - 1:source.end])
+
+        return '\n'.join(lines)
+
+    def build(self, source):
+        '''Create an astroid node of the given function, using only its source-code.
+
+        Args:
+            source (:class:`FunctionSource`): A function where :meth:`is_self_contained` is True.
+
+        Returns:
+            `astroid.FunctionDef`: The created node.
+
+        '''
+        module = astroid.parse(self.get_source(source))
+        statement = module.body[-1]
+
+        if source.parent is None:
+            return statement
+
+        return statement.body[0]
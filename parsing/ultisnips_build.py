@@ -135,25 +135,63 @@ class RecursiveParser(object):
         '''str: Add "$" to the beginning of the given text.'''
         return '$' + text
 
-    def expand(self, items):
-        '''Recursively convert `items` into an UltiSnips-snippet string.
+    @staticmethod
+    def _expand_nested(items, prepare, finish):
+        '''Replace every list in `items` with a string, starting with the deepest lists.
+
+        The lists are walked with a stack instead of with recursion, so
+        markers can be nested as deeply as needed.
 
         Args:
-            items (list[str] or str): The information to convert.
+            items (list[str or list]): The parsed text to convert.
+            prepare (callable[list] -> object):
+                A function that runs on each list before its nested lists are converted.
+            finish (callable[list[str], object] -> str):
+                A function that converts a list, once its nested lists are
+                strings, along with the output of `prepare`.
 
         Returns:
-            str: The UltiSnips-snippet string.
+            str: The converted `items`.
 
         '''
-        if not check.is_itertype(items):
-            return items
+        # Each frame is a list, the index of its next item and the output of `prepare`
+        stack = [[items, 0, prepare(items)]]
+
+        while True:
+            frame = stack[-1]
+            current, index, state = frame
 
-        is_convertible = self._is_list_convertible(items)
+            if index < len(current):
+                item = current[index]
+
+                if check.is_itertype(item):
+                    stack.append([item, 0, prepare(item)])
+                else:
+                    frame[1] += 1
+
+                continue
+
+            stack.pop()
+            output = finish(current, state)
+
+            if not stack:
+                return output
+
+            parent = stack[-1]
+            parent[0][parent[1]] = output
+            parent[1] += 1
+
+    def _expand_list(self, items, is_convertible):
+        '''Convert a list whose nested lists were already expanded.
+
+        Args:
+            items (list[str]): The expanded text.
+            is_convertible (bool): If `items` was an auto_docstring marker.
 
-        for index, item in enumerate(items):
-            expanded_item = self.expand(item)
-            items[index] = expanded_item
+        Returns:
+            str: The UltiSnips-snippet string.
 
+        '''
         # Re-add the "{}"s that pyparsing removed
         items = self._convert(''.join(items), force=True)
         output = self._wrap(items)
@@ -164,6 +202,21 @@ class RecursiveParser(object):
 
         return output
 
+    def expand(self, items):
+        '''Convert `items` into an UltiSnips-snippet string.
+
+        Args:
+            items (list[str] or str): The information to convert.
+
+        Returns:
+            str: The UltiSnips-snippet string.
+
+        '''
+        if not check.is_itertype(items):
+            return items
+
+        return self._expand_nested(items, self._is_list_convertible, self._expand_list)
+
     @classmethod
     def _parse(cls, text, function):
         '''Prep `text` into a list of strs and then pass it to `function`.
@@ -205,8 +258,7 @@ class RecursiveParser(object):
         '''Convert the given `text` into an UltiSnips-compatible string.
 
         Note:
-            This method is recursive. Markers-within-markers will be parsed
-            as separate UltiSnips tabstops.
+            Markers-within-markers will be parsed as separate UltiSnips tabstops.
 
         Args:
             text (str): The input to convert.
@@ -9,20 +9,385 @@ The source-code is parsed to find information needed to build docstrings.
 
 # IMPORT STANDARD LIBRARIES
 import collections
+import bisect
 
 # IMPORT THIRD-PARTY LIBRARIES
+from astroid import scoped_nodes
 import six
 import astroid
 
 
-class Visitor(object):
+def get_scope(node):
+    '''Find the first node, starting from `node`, which defines a new scope.
+
+    This is the same as `node.scope()` but it loops over each parent instead
+    of recursing so it works for nodes of any depth.
+
+    Args:
+        node (<astroid.NodeNG>): The node to get the scope of.
+
+    Returns:
+        <astroid.Module or astroid.FunctionDef or astroid.ClassDef or astroid.Lambda>:
+            The found scope.
+
+    '''
+    while not isinstance(node, scoped_nodes.LocalsDictNodeNG):
+        if isinstance(node, astroid.Decorators):
+            # Decorators are run in the scope outside of the function that they decorate
+            node = node.parent
+
+        node = node.parent
+
+    return node
+
+
+class DispatchVisitor(object):
+
+    '''A class that walks AST Nodes and calls a method for some of them.
+
+    Each subclass lists the node classes that it handles in `handlers`.
+    A node whose exact class has no handler has its children visited, instead.
+
+    Nodes are walked with a stack instead of with recursion, so that deeply
+    nested code can't hit Python's recursion limit. When a handler calls
+    :meth:`visit`, the node's children are added to the stack and are
+    visited once the handler returns.
+
+    Attributes:
+        handlers (dict[type, str]): Each node class and the name of its method.
+
+    '''
+
+    handlers = dict()
+
+    def __init__(self):
+        '''Look up the method of every handled node class, once.'''
+        super(DispatchVisitor, self).__init__()
+        self._table = {
+            node_class: getattr(self, name) for node_class, name in six.iteritems(self.handlers)}
+        self._stack = None
+
+    def _walk(self, nodes):
+        '''Visit every node in `nodes`, in order, and their children.
+
+        Args:
+            nodes (iter[<astroid.NodeNG>]): The nodes to visit.
+
+        '''
+        nodes = list(nodes)
+        nodes.reverse()
+
+        if self._stack is not None:
+            # A handler is running. Its nodes are visited once it returns
+            self._stack.extend(nodes)
+            return
+
+        self._stack = nodes
+
+        try:
+            while self._stack:
+                node = self._stack.pop()
+                handler = self._table.get(node.__class__)
+
+                if handler is None:
+                    children = list(node.get_children())
+                    children.reverse()
+                    self._stack.extend(children)
+                else:
+                    handler(node)
+        finally:
+            self._stack = None
+
+    def dispatch(self, node):
+        '''Call the method for `node` or visit its children if there is none.'''
+        self._walk([node])
+
+    def visit(self, node):
+        '''Visit the given Node's children.'''
+        self._walk(node.get_children())
+
+
+class _StatementLevel(object):
+
+    '''The return statements and yields of one list of statements.
+
+    A list of statements is something like the body of a function or of
+    an if-statement. It is classified once, in one pass, so that checking
+    a return or yield is constant-time, no matter how long the list is.
+
+    '''
+
+    __slots__ = ('_followed_by_yield', '_first_returns')
+
+    def __init__(self, statements):
+        '''Classify every statement in `statements`.
+
+        Args:
+            statements (list[<astroid.NodeNG>]): The statements to classify.
+
+        '''
+        super(_StatementLevel, self).__init__()
+
+        followed_by_yield = [False] * len(statements)
+
+        # A yield only counts if every statement before it, back to the
+        # return statement, is written at the same column
+        #
+        # Some fields, like `With.items`, contain tuples instead of nodes
+        columns = [getattr(statement, 'col_offset', None) for statement in statements]
+
+        for index in reversed(six.moves.range(len(statements) - 1)):
+            following = statements[index + 1]
+
+            if columns[index] != columns[index + 1]:
+                continue
+
+            followed_by_yield[index] = \
+                isinstance(getattr(following, 'value', None), astroid.Yield) \
+                or followed_by_yield[index + 1]
+
+        first_returns = dict()
+
+        for index, statement in enumerate(statements):
+            if isinstance(statement, astroid.Return):
+                first_returns.setdefault(statement.col_offset, index)
+
+        self._followed_by_yield = followed_by_yield
+        self._first_returns = first_returns
+
+    def is_followed_by_yield(self, index):
+        '''bool: If a yield comes after the statement at `index`, at the same column.'''
+        return self._followed_by_yield[index]
+
+    def has_return_before(self, index, column):
+        '''Check if a return statement comes before the statement at `index`.
+
+        Args:
+            index (int): The position of some statement.
+            column (int): The column that the return statement must be written at.
+
+        Returns:
+            bool: If there is a return statement at `column`, before `index`.
+
+        '''
+        return self._first_returns.get(column, index) < index
+
+
+# The level of any statement that has no siblings
+_SINGLE_LEVEL = _StatementLevel([None])
+
+
+def _get_statement_levels(parent):
+    '''Classify each list of statements that is a direct child of `parent`.
+
+    Args:
+        parent (<astroid.NodeNG>): The node that contains the statements.
+
+    Returns:
+        dict[<astroid.NodeNG>, tuple[:class:`_StatementLevel`, int]]:
+            Each child of `parent`, its classified statements and its index in them.
+
+    '''
+    positions = dict()
+
+    for field in parent._astroid_fields:  # pylint: disable=protected-access
+        value = getattr(parent, field)
+
+        # Statements are only ever listed in sequences, like `body` or `orelse`
+        if not value or not isinstance(value, (list, tuple)):
+            continue
+
+        if len(value) == 1:
+            # One statement can't have a sibling so every one-statement block shares a level
+            positions.setdefault(value[0], (_SINGLE_LEVEL, 0))
+            continue
+
+        level = _StatementLevel(value)
+
+        for index, child in enumerate(value):
+            # Like `astroid.NodeNG.child_sequence`, the first list that has a child wins
+            positions.setdefault(child, (level, index))
+
+    return positions
+
+
+class FunctionInfo(object):
+
+    '''An immutable record of everything needed to draw one function's docstring.
+
+    Attributes:
+        args (tuple[str]): The names of the positional args that have no default value.
+        defaults (tuple[tuple[str, <astroid.NodeNG>]]):
+            The name and default value of every other positional arg.
+        vararg (str or NoneType): The name of the `*args` parameter, if any.
+        kwarg (str or NoneType): The name of the `**kwargs` parameter, if any.
+        returns (tuple[<astroid.NodeNG>]): The value of every return statement.
+        raises (tuple[<astroid.Raise>]): Every raise statement.
+        yields (tuple[<astroid.NodeNG>]): The value of every yield expression.
+        parent (<astroid.NodeNG> or NoneType): The node that defines the function.
+
+    Like the dict that blocks used to be given, this record can also be read
+    as a read-only mapping of the names above. For example,
+    `info.get('args')` and `info['returns']` still work. The lines that
+    were drawn before a block aren't stored here anymore. Blocks get them
+    from the `state` argument of their `draw` method, instead.
+
+    '''
+
+    __slots__ = ('args', 'defaults', 'vararg', 'kwarg', 'returns', 'raises', 'yields', 'parent')
+
+    def __init__(
+            self,
+            args=tuple(),
+            defaults=tuple(),
+            vararg=None,
+            kwarg=None,
+            returns=tuple(),
+            raises=tuple(),
+            yields=tuple(),
+            parent=None):
+        '''Store the information of a function.
+
+        Args:
+            args (:obj:`iter[str]`, optional):
+                The names of the positional args that have no default value.
+            defaults (:obj:`iter[tuple[str, <astroid.NodeNG>]]`, optional):
+                The name and default value of every other positional arg.
+            vararg (:obj:`str`, optional): The name of the `*args` parameter.
+            kwarg (:obj:`str`, optional): The name of the `**kwargs` parameter.
+            returns (:obj:`iter[<astroid.NodeNG>]`, optional): The returned values.
+            raises (:obj:`iter[<astroid.Raise>]`, optional): The raise statements.
+            yields (:obj:`iter[<astroid.NodeNG>]`, optional): The yielded values.
+            parent (:obj:`<astroid.NodeNG>`, optional): The node that defines the function.
+
+        '''
+        setter = super(FunctionInfo, self).__setattr__
+        setter('args', tuple(args))
+        setter('defaults', tuple(defaults))
+        setter('vararg', vararg)
+        setter('kwarg', kwarg)
+        setter('returns', tuple(returns))
+        setter('raises', tuple(raises))
+        setter('yields', tuple(yields))
+        setter('parent', parent)
+
+    def __setattr__(self, name, value):
+        '''Stop the information from being changed.
+
+        Raises:
+            AttributeError: Every time this method is called.
+
+        '''
+        raise AttributeError('FunctionInfo objects cannot be changed.')
+
+    def _get_values(self):
+        '''tuple: Every stored value, in the same order as `__slots__`.'''
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other):
+        '''bool: If `other` has the same information as this instance.'''
+        if not isinstance(other, FunctionInfo):
+            return NotImplemented
+
+        return self._get_values() == other._get_values()  # pylint: disable=protected-access
+
+    def __ne__(self, other):
+        '''bool: If `other` has different information than this instance.'''
+        result = self.__eq__(other)
+
+        if result is NotImplemented:
+            return result
+
+        return not result
+
+    __hash__ = None
+
+    def __repr__(self):
+        '''str: A description of this instance.'''
+        return '{cls_}({values})'.format(
+            cls_=self.__class__.__name__,
+            values=', '.join(
+                '{name}={value!r}'.format(name=name, value=getattr(self, name))
+                for name in self.__slots__
+            ),
+        )
+
+    def __getitem__(self, key):
+        '''Get the stored value of the given `key`.
+
+        Args:
+            key (str): The name of the value. e.g. "args".
+
+        Raises:
+            KeyError: If `key` is not the name of a stored value.
+
+        Returns:
+            The found value.
+
+        '''
+        if key not in self.__slots__:
+            raise KeyError(key)
+
+        return getattr(self, key)
+
+    def __contains__(self, key):
+        '''bool: If `key` is the name of a stored value.'''
+        return key in self.__slots__
+
+    def __iter__(self):
+        '''iter[str]: The name of every stored value.'''
+        return iter(self.__slots__)
+
+    def __len__(self):
+        '''int: The number of stored values.'''
+        return len(self.__slots__)
+
+    def get(self, key, default=None):
+        '''Get the stored value of the given `key`, or `default` if there is none.'''
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        '''list[str]: The name of every stored value.'''
+        return list(self.__slots__)
+
+    def values(self):
+        '''list: Every stored value, in the same order as :meth:`keys`.'''
+        return list(self._get_values())
+
+    def items(self):
+        '''list[tuple[str, object]]: The name and value of everything that is stored.'''
+        return list(zip(self.__slots__, self._get_values()))
+
+
+# Inheriting from Mapping would give every instance a `__dict__` on Python 2
+six.moves.collections_abc.Mapping.register(FunctionInfo)
+
+
+class Visitor(DispatchVisitor):
 
     '''A class that recursively walks AST Nodes and gathers docstings data.'''
 
+    handlers = {
+        astroid.FunctionDef: 'visit_functiondef',
+        astroid.Raise: 'visit_raise',
+        astroid.Return: 'visit_return',
+        astroid.Yield: 'visit_yield',
+    }
+
     def __init__(self):
         '''Create an object to store informatino about functions.'''
         super(Visitor, self).__init__()
-        self.functions = collections.defaultdict(dict)
+        self._found = collections.defaultdict(dict)
+        self._positions = dict()
+
+    @property
+    def functions(self):
+        '''dict[<astroid.NodeNG>, :class:`FunctionInfo`]: Each visited function and its info.'''
+        return {
+            function: FunctionInfo(**found) for function, found in six.iteritems(self._found)}
 
     def visit_functiondef(self, node):
         '''Get the given FunctionDef `node` args.
@@ -31,122 +396,98 @@ class Visitor(object):
             node (<astroid.FunctionDef>): The node to get info for.
 
         '''
-        info = {
-            'args': [],
-            'defaults': [],
-            'in': node.parent,
-        }
-
         all_args = self._get_all_args(node)
         args, defaults = self._organize_args(node, all_args)
 
-        for arg in args:
-            info['args'].append(arg.name)
-
-        for default, value, in six.moves.zip(*defaults):
-            info['defaults'].append((default.name, value))
-
-        info['vararg'] = node.args.vararg
-        info['kwarg'] = node.args.kwarg
-
-        self.functions[node].update(info)
+        self._found[node].update({
+            'args': [arg.name for arg in args],
+            'defaults': [(default.name, value) for default, value in six.moves.zip(*defaults)],
+            'vararg': node.args.vararg,
+            'kwarg': node.args.kwarg,
+            'parent': node.parent,
+        })
 
         # Recurse through the node's children so we can find more nodes
         self.visit(node)
 
-    def visit(self, node):
-        '''Visit the given Node's children.'''
-        for child in node.get_children():
-            try:
-                child.accept(self)
-            except AttributeError:
-                self.visit(child)
-
     def visit_raise(self, node):
         '''Add raise statements to this instance's function information.'''
-        function = node.scope()
-        self.functions[function].setdefault('raises', [])
-        self.functions[function]['raises'].append(node)
+        function = get_scope(node)
+        self._found[function].setdefault('raises', []).append(node)
 
-    def visit_return(self, node):
-        '''Whenever a Return object is found, get its parent scope and store it.
+    def _get_level(self, statement):
+        '''Find the list of statements that contains `statement`.
+
+        Every list of statements that shares a parent is classified the
+        first time that one of its statements is needed. After that, each
+        lookup is a dictionary hit.
 
         Args:
-            node (<astroid.Return>): The node to get info for.
+            statement (<astroid.NodeNG>): Some statement to find the list of.
+
+        Returns:
+            tuple[:class:`_StatementLevel`, int]:
+                The classified statements and the index of `statement` in them.
 
         '''
-        def is_yield_return(node):
-            '''If `node` is a return/yield statement.
+        parent = statement.parent
 
-            Args:
-                node (:class:`astroid.Return`): The node to check.
+        try:
+            positions = self._positions[parent]
+        except KeyError:
+            positions = _get_statement_levels(parent)
+            self._positions[parent] = positions
 
-            Example:
-                >>> def foo():
-                ...     return
-                ...     yield
+        try:
+            return positions[statement]
+        except KeyError:
+            return (_SINGLE_LEVEL, 0)
 
-            '''
-            sibling = node.next_sibling()
-            node_column_offset = node.col_offset
+    def visit_return(self, node):
+        '''Whenever a Return object is found, get its parent scope and store it.
 
-            while sibling is not None:
-                is_in_same_statement = node_column_offset == sibling.col_offset
-                if isinstance(sibling.value, astroid.Yield) and is_in_same_statement:
-                    return True
+        A return statement that is followed by a yield isn't stored. It only
+        exists to make the function into a generator.
 
-                if not is_in_same_statement:
-                    return False
+        Example:
+            >>> def foo():
+            ...     return
+            ...     yield
 
-                sibling = sibling.next_sibling()
+        Args:
+            node (<astroid.Return>): The node to get info for.
 
-            return False
+        '''
+        level, index = self._get_level(node)
 
-        if is_yield_return(node):
+        if level.is_followed_by_yield(index):
             return
 
-        function = node.scope()
-        self.functions[function].setdefault('returns', [])
-        self.functions[function]['returns'].append(node.value)
+        function = get_scope(node)
+        self._found[function].setdefault('returns', []).append(node.value)
 
     def visit_yield(self, node):
         '''Whenever a Yield object is found, get its parent scope and store it.
 
+        A yield that comes after a return statement isn't stored.
+        See :meth:`visit_return` for details.
+
         Args:
-            node (<astroid.Return>): The node to get info for.
+            node (<astroid.Yield>): The node to get info for.
 
         '''
-        def is_blank_yield(node):
-            '''If `node` is a return/yield statement.
+        statement = node.parent
 
-            Args:
-                node (:class:`astroid.Yield`): The node to check.
+        while not statement.is_statement:
+            statement = statement.parent
 
-            Example:
-                >>> def foo():
-                ...     return
-                ...     yield
+        level, index = self._get_level(statement)
 
-            '''
-            sibling = node.previous_sibling()
-            node_column_offset = node.col_offset
-
-            while sibling is not None:
-                is_in_same_statement = node_column_offset == sibling.col_offset
-                if isinstance(sibling, astroid.Return) and is_in_same_statement:
-                    return True
-
-                sibling = sibling.previous_sibling()
-
-            return False
-
-        if is_blank_yield(node):
+        if level.has_return_before(index, node.col_offset):
             return
 
-        function = node.scope()
-
-        self.functions[function].setdefault('yields', [])
-        self.functions[function]['yields'].append(node.value)
+        function = get_scope(node)
+        self._found[function].setdefault('yields', []).append(node.value)
 
     @staticmethod
     def _get_all_args(node):
@@ -168,7 +509,8 @@ class Visitor(object):
         except AttributeError:
             decorators = []
 
-        children = list(node.args.get_children())
+        # Only positional args and their defaults. See `_organize_args`
+        children = list(node.args.args or []) + list(node.args.defaults or [])
 
         drop_first_arg = isinstance(node.parent, astroid.ClassDef)
 
@@ -176,7 +518,7 @@ class Visitor(object):
             return children
 
         for decorator in decorators:
-            if decorator.name == 'staticmethod':
+            if getattr(decorator, 'name', '') == 'staticmethod':
                 return children
 
         return children[1:]
@@ -226,6 +568,122 @@ class Visitor(object):
         return (args, (defaults, values))
 
 
+class _FunctionVisitor(Visitor):
+
+    '''A Visitor which only gathers information for one function.
+
+    Nested functions, classes and lambdas are skipped because anything
+    inside of them belongs to their own scope, not to the visited function.
+
+    '''
+
+    handlers = dict(Visitor.handlers)
+    handlers.update({
+        astroid.ClassDef: 'visit_classdef',
+        astroid.Lambda: 'visit_lambda',
+    })
+
+    def __init__(self, function):
+        '''Keep track of the function to visit.
+
+        Args:
+            function (<astroid.FunctionDef>): The function to gather information for.
+
+        '''
+        super(_FunctionVisitor, self).__init__()
+        self._function = function
+
+    def visit_functiondef(self, node):
+        '''Visit `node`, but only if it is the function that info is gathered for.'''
+        if node is self._function:
+            super(_FunctionVisitor, self).visit_functiondef(node)
+
+    def visit_classdef(self, node):
+        '''Skip nested classes.'''
+        pass
+
+    def visit_lambda(self, node):
+        '''Skip nested lambdas.'''
+        pass
+
+
+class FunctionIndex(object):
+
+    '''A sorted index of function line ranges, for finding functions by row.
+
+    Functions are sorted by the row that they start on and each function
+    keeps a link to the function that encloses it. Finding the function that
+    encloses a row is a binary search followed by a walk up those links,
+    which is only as long as the functions are nested.
+
+    '''
+
+    def __init__(self, functions):
+        '''Sort the given functions by their line ranges.
+
+        Args:
+            functions (iter[<astroid.FunctionDef>]): The functions to index.
+
+        '''
+        super(FunctionIndex, self).__init__()
+
+        self._starts = []
+        self._ends = []
+        self._nodes = []
+        self._parents = []
+
+        # Sort outer functions before the inner functions that start on the same row
+        ranges = sorted(
+            ((function.lineno, function.tolineno, function) for function in functions),
+            key=lambda item: (item[0], -item[1]),
+        )
+
+        enclosing = []
+        for start, end, function in ranges:
+            while enclosing and self._ends[enclosing[-1]] < start:
+                enclosing.pop()
+
+            if enclosing:
+                self._parents.append(enclosing[-1])
+            else:
+                self._parents.append(-1)
+
+            enclosing.append(len(self._nodes))
+            self._starts.append(start)
+            self._ends.append(end)
+            self._nodes.append(function)
+
+    def get_closest(self, row):
+        '''Find the innermost function that contains `row`.
+
+        `row` is the line above the cursor so a function only contains
+        `row` if the cursor is inside of its body. A cursor below a
+        function's last line is outside of that function.
+
+        If no function contains `row`, the function which ends closest
+        above `row` is used, instead.
+
+        Args:
+            row (int): The line number to find a function for.
+
+        Returns:
+            <astroid.FunctionDef> or NoneType: The found function, if any.
+
+        '''
+        index = bisect.bisect_right(self._starts, row) - 1
+        closest = None
+
+        while index != -1:
+            closest = self._nodes[index]
+
+            if row < self._ends[index]:
+                break
+
+            index = self._parents[index]
+
+        return closest
+
+
 def get_info(node):
     '''Get everything needed to build docstrings from the given `node`.
 
@@ -234,31 +692,86 @@ def get_info(node):
 
     Returns:
         dict[str]: The
-            "functions" (dict[<astroid.FunctionDef>, dict[str]]):
+            "functions" (dict[<astroid.FunctionDef>, :class:`FunctionInfo`]):
                 A function node and all of its gathered information.
             "nodes" (dict[<astroid Node>, str]):
                 The found node and what group it belongs to. This string
                 should be a different key in this dictionary.
                 Example: "functions".
+            "function_index" (:class:`FunctionIndex`):
+                The line range of every function in "functions".
 
     '''
-    output = {'nodes': dict()}
-
     visitor = Visitor()
-    try:
-        node.accept(visitor)
-    except AttributeError:
-        visitor.visit(node)
+    visitor.dispatch(node)
 
     functions = visitor.functions
-    for function, info in six.iteritems(functions):
-        functions[function] = info
-        output['nodes'][function] = 'functions'
 
-    functions = default_to_regular(functions)
-    output['functions'] = functions
+    return {
+        'nodes': {function: 'functions' for function in functions},
+        'functions': functions,
+        'function_index': FunctionIndex(functions),
+    }
 
-    return output
+
+def get_function_at_row(node, row):
+    '''Find the innermost FunctionDef that contains `row`.
+
+    Unlike :func:`get_info`, this function doesn't visit the whole module.
+    Only the statements that contain `row` are descended into.
+
+    `row` is the line above the cursor. See :meth:`FunctionIndex.get_closest`.
+
+    Args:
+        node (<astroid.Module>): The parsed code to search through.
+        row (int): The line number to find a function for.
+
+    Returns:
+        <astroid.FunctionDef> or NoneType:
+            The found function or nothing, if no function contains `row`.
+
+    '''
+    function = None
+    parent = node
+
+    while parent is not None:
+        children = parent.get_children()
+        parent = None
+
+        for child in children:
+            if not child.is_statement:
+                continue
+
+            if child.lineno > row:
+                break
+
+            if row < child.tolineno:
+                parent = child
+
+                if isinstance(child, astroid.FunctionDef):
+                    function = child
+
+                break
+
+    return function
+
+
+def get_function_info(function):
+    '''Get everything needed to build the docstring of one function.
+
+    Only `function` is visited. Nested functions and classes are skipped.
+
+    Args:
+        function (<astroid.FunctionDef>): The function to break down into parts.
+
+    Returns:
+        :class:`FunctionInfo`: The gathered information.
+
+    '''
+    visitor = _FunctionVisitor(function)
+    visitor.visit_functiondef(function)
+
+    return visitor.functions[function]
 
 
 def get_closest_docstring_node(row, info):
@@ -272,15 +785,12 @@ def get_closest_docstring_node(row, info):
         <astroid Node>: The found astroid.FunctionDef node.
 
     '''
-    closest_node = None
-    closest_row = 0
-    functions = info.get('functions', [])
-    for function in functions:
-        if function.lineno <= row and function.lineno > closest_row:
-            closest_node = function
-            closest_row = function.lineno
+    try:
+        index = info['function_index']
+    except KeyError:
+        index = FunctionIndex(info.get('functions', []))
 
-    return closest_node
+    return index.get_closest(row)
 
 
 def get_container_types():
@@ -399,15 +909,3 @@ def iterate(obj):
         return obj.get_children()
     except AttributeError:
         return obj
-
-
-def recursive_default_dict():
-    '''<collections.defaultdict>: A dict that allows nested mappings.'''
-    return collections.defaultdict(recursive_default_dict)
-
-
-def default_to_regular(obj):
-    '''Convert a nested defaultdict into a regular dict.'''
-    if isinstance(obj, collections.defaultdict):
-        obj = {key: default_to_regular(value) for key, value in six.iteritems(obj)}
-    return obj
@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''An opt-in set of timers for each stage of creating a docstring.
+
+Creating a docstring is split into stages, like "parse", "get_info" and
+"draw". If this module is enabled, every stage records how many times it was
+called and how long it took, in seconds.
+
+Example:
+    >>> from auto_docstring import profiler
+    >>> profiler.enable()
+    >>> docstring_builder.create_docstring(code, row=10)
+    >>> profiler.get_stats()['parse']
+    ... # Result: {'calls': 1, 'total': 0.0131, 'mean': 0.0131}
+    >>> profiler.dump_json()
+
+Note:
+    Stages can be nested. For example, the time of "draw.google.returns" is
+    also counted in "draw".
+
+'''
+
+# IMPORT STANDARD LIBRARIES
+import contextlib
+import threading
+import timeit
+import json
+
+# IMPORT THIRD-PARTY LIBRARIES
+import six
+
+
+_ENABLED = False
+_LOCK = threading.Lock()
+_STATS = dict()
+
+
+def enable(reset=True):
+    '''Start recording the time of each stage.
+
+    Args:
+        reset (:obj:`bool`, optional):
+            If True, forget every time that was recorded before now.
+            Default is True.
+
+    '''
+    global _ENABLED  # pylint: disable=global-statement
+
+    if reset:
+        clear()
+
+    _ENABLED = True
+
+
+def disable():
+    '''Stop recording the time of each stage.'''
+    global _ENABLED  # pylint: disable=global-statement
+    _ENABLED = False
+
+
+def is_enabled():
+    '''bool: If stages are currently being recorded.'''
+    return _ENABLED
+
+
+def clear():
+    '''Forget every time that has been recorded.'''
+    with _LOCK:
+        _STATS.clear()
+
+
+def record(name, elapsed):
+    '''Add one call of a stage to the recorded stats.
+
+    Args:
+        name (str): The name of the stage.
+        elapsed (float): The time that the stage took, in seconds.
+
+    '''
+    with _LOCK:
+        stats = _STATS.setdefault(name, [0, 0.0])
+        stats[0] += 1
+        stats[1] += elapsed
+
+
+@contextlib.contextmanager
+def stage(name):
+    '''Record the time that the code in this context takes, if enabled.
+
+    Args:
+        name (str): The name of the stage to record.
+
+    '''
+    if not _ENABLED:
+        yield
+        return
+
+    start = timeit.default_timer()
+
+    try:
+        yield
+    finally:
+        record(name, timeit.default_timer() - start)
+
+
+def get_stats():
+    '''Get every stage that has been recorded.
+
+    Returns:
+        dict[str, dict[str, int or float]]:
+            The name of each stage and its "calls", "total" and "mean" time.
+
+    '''
+    with _LOCK:
+        items = [(name, list(stats)) for name, stats in six.iteritems(_STATS)]
+
+    return {
+        name: {'calls': calls, 'total': total, 'mean': total / calls}
+        for name, (calls, total) in items
+    }
+
+
+def dump_json(stream=None):
+    '''Write every recorded stage as JSON.
+
+    Args:
+        stream (:obj:`file`, optional):
+            If given, the JSON is written to this object.
+
+    Returns:
+        str: The recorded stages, as JSON.
+
+    '''
+    text = json.dumps(get_stats(), indent=4, sort_keys=True)
+
+    if stream is not None:
+        stream.write(text)
+
+    return text
@@ -0,0 +1,328 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''A cache of generated docstrings, keyed by the code that they depend on.
+
+Finding types is the slowest part of creating a docstring. But a function's
+docstring only depends on a few things:
+
+- The source-code of the function (or the class / function that contains it)
+- The module-level imports, functions, classes and variables that it uses
+- The docstring style and the user's config settings
+- The registered default values of :mod:`auto_docstring.defaults.registry`
+
+If all of those are the same as a previous request, the previous docstring is
+returned and nothing is inferred or drawn. This helps with copy-pasted helper
+functions and editors that ask for the same docstring many times.
+
+Note:
+    Imported modules are not part of the key. astroid keeps imported
+    modules in memory for the whole process, so changes to other files
+    already aren't seen until the process restarts.
+
+'''
+
+# IMPORT STANDARD LIBRARIES
+import collections
+import threading
+import hashlib
+import weakref
+import sys
+
+# IMPORT THIRD-PARTY LIBRARIES
+import astroid
+import six
+
+# IMPORT LOCAL LIBRARIES
+from .defaults import registry
+from .config import environment
+
+
+_DEFAULT_CACHE = None
+_MODULE_NAMES = weakref.WeakKeyDictionary()
+_BINDING_TYPES = (
+    astroid.AssignName,
+    astroid.ClassDef,
+    astroid.FunctionDef,
+    astroid.Import,
+    astroid.ImportFrom,
+)
+
+
+class ResultCache(object):
+
+    '''A thread-safe, least-recently-used cache of docstrings.'''
+
+    def __init__(self, max_size=256):
+        '''Create an empty cache.
+
+        Args:
+            max_size (:obj:`int`, optional):
+                The most docstrings to keep. Once the cache is full, the
+                docstring that was used the longest time ago is removed.
+
+        '''
+        super(ResultCache, self).__init__()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._items = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        '''Find the docstring of the given `key`.
+
+        Args:
+            key (str): The key from :func:`make_key`.
+
+        Returns:
+            str or NoneType: The found docstring, if any.
+
+        '''
+        with self._lock:
+            try:
+                value = self._items.pop(key)
+            except KeyError:
+                self.misses += 1
+                return None
+
+            # Add the item back so that it is now the most recently used item
+            self._items[key] = value
+            self.hits += 1
+
+            return value
+
+    def add(self, key, value):
+        '''Store the given docstring and remove the oldest one, if needed.
+
+        Args:
+            key (str): The key from :func:`make_key`.
+            value (str): The docstring to store.
+
+        '''
+        with self._lock:
+            self._items.pop(key, None)
+            self._items[key] = value
+            self._trim()
+
+    def resize(self, max_size):
+        '''Change the most docstrings that this cache can keep.
+
+        Args:
+            max_size (int): The new size of this cache.
+
+        '''
+        with self._lock:
+            self.max_size = max_size
+            self._trim()
+
+    def _trim(self):
+        '''Remove the oldest items until this cache is no bigger than its max size.'''
+        while len(self._items) > max(self.max_size, 0):
+            self._items.popitem(last=False)
+
+    def clear(self):
+        '''Forget every docstring and reset the hit and miss counters.'''
+        with self._lock:
+            self._items.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self):
+        '''dict[str, int]: The "hits", "misses", "size" and "max_size" of this cache.'''
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._items),
+                'max_size': self.max_size,
+            }
+
+    def __len__(self):
+        '''int: The number of stored docstrings.'''
+        return len(self._items)
+
+
+def get_default_cache():
+    '''ResultCache: The cache that is shared by every docstring request.'''
+    global _DEFAULT_CACHE  # pylint: disable=global-statement
+
+    if _DEFAULT_CACHE is None:
+        _DEFAULT_CACHE = ResultCache(max_size=environment.get_result_cache_size())
+
+    return _DEFAULT_CACHE
+
+
+def _get_top_statement(node):
+    '''Find the module-level statement that contains the given `node`.'''
+    while not isinstance(node.parent, astroid.Module):
+        node = node.parent
+
+    return node
+
+
+def _get_source(lines, node):
+    '''str: Get the source-code of the given `node`, including its decorators.'''
+    start = node.fromlineno
+    decorators = getattr(node, 'decorators', None)
+
+    if decorators is not None:
+        start = min(start, decorators.fromlineno)
+
+    return '\n'.join(lines[start - 1:node.tolineno])
+
+
+def _get_bound_names(statement):
+    '''set[str]: Find every name that a module-level `statement` defines.'''
+    if isinstance(statement, (astroid.ClassDef, astroid.FunctionDef)):
+        return {statement.name}
+
+    names = set()
+
+    for node in statement.nodes_of_class(_BINDING_TYPES):
+        if isinstance(node, (astroid.Import, astroid.ImportFrom)):
+            for name, alias in node.names:
+                # "import os.path" defines "os"
+                names.add(alias or name.split('.')[0])
+        else:
+            names.add(node.name)
+
+    return names
+
+
+def _get_module_names(module):
+    '''Find every module-level statement that defines a name.
+
+    The statements are stored as weak references because each statement's
+    parent is `module`. Storing them directly would keep `module` alive.
+
+    Args:
+        module (`astroid.Module`): The parsed module.
+
+    Returns:
+        tuple[dict[str, list[`weakref.ref`]], list[`weakref.ref`]]:
+            Each name and the statements that define it. Also, every
+            statement that must always be included, like star-imports.
+
+    '''
+    try:
+        return _MODULE_NAMES[module]
+    except KeyError:
+        pass
+
+    names = collections.defaultdict(list)
+    always = []
+
+    for statement in module.body:
+        for name in _get_bound_names(statement):
+            if name == '*':
+                always.append(weakref.ref(statement))
+            else:
+                names[name].append(weakref.ref(statement))
+
+    _MODULE_NAMES[module] = (names, always)
+
+    return (names, always)
+
+
+def _get_dependencies(statement, module):
+    '''Find every module-level statement that the given `statement` needs.
+
+    Functions that use other functions are followed, recursively.
+
+    Args:
+        statement (`astroid.NodeNG`): The module-level statement to check.
+        module (`astroid.Module`): The module that contains `statement`.
+
+    Returns:
+        list[`astroid.NodeNG`]: `statement`, followed by every statement it needs.
+
+    '''
+    names, always = _get_module_names(module)
+    output = [statement] + [reference() for reference in always if reference() is not statement]
+    seen = set(output)
+    unchecked = [statement]
+
+    while unchecked:
+        current = unchecked.pop()
+        used = sorted(set(name.name for name in current.nodes_of_class(astroid.Name)))
+
+        for name in used:
+            for reference in names.get(name, []):
+                dependency = reference()
+
+                if dependency in seen:
+                    continue
+
+                seen.add(dependency)
+                output.append(dependency)
+                unchecked.append(dependency)
+
+    return output
+
+
+def get_config_snapshot(style):
+    '''Get every config setting that changes how a docstring is drawn.
+
+    Args:
+        style (str): The name of the docstring style that will be drawn.
+
+    Returns:
+        tuple: The settings, in a consistent order.
+
+    '''
+    config = environment.get_config()
+    settings = [
+        (name, config.get(name))
+        for name in environment.get_config_names()
+        # The time budget never changes a cached docstring because
+        # docstrings that run out of time are never cached. And both
+        # ways of parsing a function create the same docstring
+        #
+        if name not in ('time_budget', 'fast_path')
+    ]
+
+    try:
+        registered = environment.get_registered_style(style)
+    except KeyError:
+        registered = None
+
+    return (
+        tuple(settings),
+        environment.get_block_order(style),
+        (id(registered), repr(registered)),
+        registry.get_generation(),
+        tuple(sys.path),
+    )
+
+
+def make_key(lines, module, node, style):
+    '''Create a hash which uniquely represents the docstring of `node`.
+
+    Args:
+        lines (list[str]): The source-code of `module`.
+        module (`astroid.Module`): The module that contains `node`.
+        node (`astroid.FunctionDef`): The function that needs a docstring.
+        style (str): The name of the docstring style that will be drawn.
+
+    Returns:
+        str: The created hash.
+
+    '''
+    statement = _get_top_statement(node)
+
+    parts = [
+        repr(get_config_snapshot(style)),
+        style,
+        node.name,
+        str(node.lineno - statement.fromlineno),
+    ]
+    parts.extend(
+        _get_source(lines, dependency) for dependency in _get_dependencies(statement, module))
+
+    text = '\0'.join(parts)
+
+    if isinstance(text, six.text_type):
+        text = text.encode('utf-8')
+
+    return hashlib.sha1(text).hexdigest()
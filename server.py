@@ -0,0 +1,383 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''A long-running process that creates docstrings for editors.
+
+Starting Python and importing auto_docstring is often slower than creating
+the docstring itself. This module keeps one process (and all of its caches)
+alive and answers JSON-RPC 2.0 requests, one JSON object per-line, over
+stdin/stdout or over a Unix socket.
+
+Example:
+    >>> python -m auto_docstring.server
+    >>> {"jsonrpc": "2.0", "id": 1, "method": "create_docstring", "params": {"code": "def foo(bar):\n    pass\n", "row": 1, "buffer": "foo.py"}}
+    ... {"id": 1, "jsonrpc": "2.0", "result": {"docstring": "...", "elapsed": 0.0021}}
+
+Every "create" method takes the same parameters as its function in
+:mod:`auto_docstring.docstring_builder`, plus an optional "buffer" name.
+Requests with the same "buffer" re-use the last parse of that buffer.
+
+'''
+
+# IMPORT STANDARD LIBRARIES
+import collections
+import argparse
+import inspect
+import timeit
+import json
+import sys
+import os
+
+# IMPORT THIRD-PARTY LIBRARIES
+from six.moves import socketserver
+import six
+
+# IMPORT LOCAL LIBRARIES
+from . import docstring_builder
+
+
+_PARSE_ERROR = -32700
+_INVALID_REQUEST = -32600
+_METHOD_NOT_FOUND = -32601
+_INVALID_PARAMS = -32602
+_INTERNAL_ERROR = -32603
+
+
+class DocstringServer(object):
+
+    '''An object that answers JSON-RPC requests for docstrings.
+
+    Attributes:
+        max_sessions (int): The number of buffers whose parse will be kept.
+
+    '''
+
+    max_sessions = 32
+
+    def __init__(self):
+        '''Create the object with no known buffers and no recorded requests.'''
+        super(DocstringServer, self).__init__()
+        self._sessions = collections.OrderedDict()
+        self._stats = dict()
+        self.running = True
+
+        self._methods = {
+            'create_docstring': self._create_docstring,
+            'create_docstrings': self._create_docstrings,
+            'create_ultisnips_docstring': self._create_ultisnips_docstring,
+            'stats': self._get_stats,
+            'shutdown': self._shutdown,
+        }
+
+    def _get_session(self, name):
+        '''Find the session for the given buffer `name`, or create a new one.
+
+        Args:
+            name (str): The name of some buffer. If empty, a new session is used.
+
+        Returns:
+            :class:`auto_docstring.docstring_builder.DocstringSession`: The found session.
+
+        '''
+        if not name:
+            return docstring_builder.DocstringSession()
+
+        try:
+            session = self._sessions.pop(name)
+        except KeyError:
+            session = docstring_builder.DocstringSession()
+
+        # Keep the most recently used buffers and forget the oldest ones
+        self._sessions[name] = session
+
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+
+        return session
+
+    def _create_docstring(self, code, row, style='', wrap=False, buffer=''):
+        '''dict[str]: Create a docstring for `code` at `row`.'''
+        return {
+            'docstring': docstring_builder.create_docstring(
+                code, row, style=style, wrap=wrap, session=self._get_session(buffer)),
+        }
+
+    def _create_docstrings(self, code, rows, style='', wrap=False, buffer=''):
+        '''dict[str]: Create a docstring for `code` at every one of the `rows`.'''
+        return {
+            'docstrings': docstring_builder.create_docstrings(
+                code, rows, style=style, wrap=wrap, session=self._get_session(buffer)),
+        }
+
+    def _create_ultisnips_docstring(self, code, row, style='', wrap=False, buffer=''):
+        '''dict[str]: Create an UltiSnips docstring for `code` at `row`.'''
+        return {
+            'docstring': docstring_builder.create_ultisnips_docstring(
+                code, row, style=style, wrap=wrap, session=self._get_session(buffer)),
+        }
+
+    def _get_stats(self):
+        '''dict[str]: Get the number of requests and the time spent on each method.'''
+        return {'methods': self.get_stats(), 'buffers': list(self._sessions)}
+
+    def _shutdown(self):
+        '''dict[str]: Stop the server after this request has been answered.'''
+        self.running = False
+        return {}
+
+    def _record(self, method, elapsed):
+        '''Add the `elapsed` time of a request to the stats of its `method`.'''
+        stats = self._stats.setdefault(method, {'calls': 0, 'total': 0.0, 'max': 0.0})
+        stats['calls'] += 1
+        stats['total'] += elapsed
+        stats['max'] = max(stats['max'], elapsed)
+
+    def get_stats(self):
+        '''Get the latency of every method which has been requested.
+
+        Returns:
+            dict[str, dict[str, float]]:
+                Each method name and its "calls", "total", "max" and "mean" time,
+                in seconds.
+
+        '''
+        output = dict()
+        for method, stats in six.iteritems(self._stats):
+            stats = dict(stats)
+            stats['mean'] = stats['total'] / stats['calls']
+            output[method] = stats
+
+        return output
+
+    @staticmethod
+    def _make_error(identifier, code, message):
+        '''dict[str]: Create a JSON-RPC error response.'''
+        return {
+            'jsonrpc': '2.0',
+            'id': identifier,
+            'error': {'code': code, 'message': message},
+        }
+
+    def handle(self, request):
+        '''Run the method of the given JSON-RPC `request`.
+
+        Args:
+            request (dict[str]): The JSON-RPC request to run.
+
+        Returns:
+            dict[str] or NoneType:
+                The JSON-RPC response. If `request` is a notification
+                (it has no "id"), nothing is returned.
+
+        '''
+        if not isinstance(request, dict) or 'method' not in request:
+            return self._make_error(None, _INVALID_REQUEST, 'Request must be an object with a "method".')
+
+        identifier = request.get('id')
+        is_notification = 'id' not in request
+        name = request['method']
+
+        try:
+            method = self._methods[name]
+        except (KeyError, TypeError):
+            if is_notification:
+                return None
+
+            return self._make_error(
+                identifier,
+                _METHOD_NOT_FOUND,
+                'Method: "{name}" was invalid. Options were, "{options}".'
+                ''.format(name=name, options=sorted(self._methods)),
+            )
+
+        params = request.get('params', dict())
+
+        if isinstance(params, dict):
+            args, kwargs = [], params
+        elif isinstance(params, list):
+            args, kwargs = params, dict()
+        else:
+            if is_notification:
+                return None
+
+            return self._make_error(
+                identifier, _INVALID_PARAMS, 'Params must be an object or an array.')
+
+        # Check the params before the call so that a TypeError raised
+        # while creating a docstring isn't mistaken for a bad request
+        try:
+            inspect.getcallargs(method, *args, **kwargs)
+        except TypeError as error:
+            if is_notification:
+                return None
+
+            return self._make_error(identifier, _INVALID_PARAMS, str(error))
+
+        start = timeit.default_timer()
+
+        try:
+            result = method(*args, **kwargs)
+        except Exception as error:  # pylint: disable=broad-except
+            response = self._make_error(identifier, _INTERNAL_ERROR, str(error))
+        else:
+            elapsed = timeit.default_timer() - start
+            self._record(name, elapsed)
+            result['elapsed'] = elapsed
+            response = {'jsonrpc': '2.0', 'id': identifier, 'result': result}
+
+        if is_notification:
+            return None
+
+        return response
+
+    def handle_line(self, line):
+        '''Run the JSON-RPC request in the given line of text.
+
+        Args:
+            line (str): A JSON-encoded request.
+
+        Returns:
+            str: The JSON-encoded response. If no response is needed, return "".
+
+        '''
+        try:
+            request = json.loads(line)
+        except ValueError as error:
+            response = self._make_error(None, _PARSE_ERROR, str(error))
+        else:
+            response = self.handle(request)
+
+        if response is None:
+            return ''
+
+        return json.dumps(response, sort_keys=True)
+
+    def serve_stream(self, reader, writer):
+        '''Answer requests, one per-line, until `reader` ends or "shutdown" is called.
+
+        Args:
+            reader (file): The object to read requests from.
+            writer (file): The object to write responses to.
+
+        '''
+        while self.running:
+            line = reader.readline()
+
+            if not line:
+                break
+
+            if not line.strip():
+                continue
+
+            response = self.handle_line(line)
+
+            if response:
+                writer.write(response + '\n')
+                writer.flush()
+
+    def serve_socket(self, path):
+        '''Answer requests from a Unix socket until "shutdown" is called.
+
+        Args:
+            path (str): The socket file to create and listen to.
+
+        '''
+        server = self
+
+        class _Handler(socketserver.StreamRequestHandler):
+
+            '''Pass every line that the client sends to the server.'''
+
+            def handle(self):
+                '''Answer the client's requests until it disconnects.'''
+                server.serve_stream(_TextReader(self.rfile), _TextWriter(self.wfile))
+
+        if os.path.exists(path):
+            os.remove(path)
+
+        socket_server = socketserver.UnixStreamServer(path, _Handler)
+
+        try:
+            while self.running:
+                socket_server.handle_request()
+        finally:
+            socket_server.server_close()
+            os.remove(path)
+
+
+class _TextReader(object):
+
+    '''Read lines of text from a socket file, which only reads bytes.'''
+
+    def __init__(self, handler):
+        '''Keep the socket file to read from.'''
+        super(_TextReader, self).__init__()
+        self._handler = handler
+
+    def readline(self):
+        '''str: Get the next line of text.'''
+        return self._handler.readline().decode('utf-8')
+
+
+class _TextWriter(object):
+
+    '''Write text to a socket file, which only writes bytes.'''
+
+    def __init__(self, handler):
+        '''Keep the socket file to write to.'''
+        super(_TextWriter, self).__init__()
+        self._handler = handler
+
+    def write(self, text):
+        '''Send the given `text` to the client.'''
+        self._handler.write(text.encode('utf-8'))
+
+    def flush(self):
+        '''Make sure that everything written has been sent.'''
+        self._handler.flush()
+
+
+def _parse_arguments(args):
+    '''Read the command-line arguments of this module.
+
+    Args:
+        args (list[str]): The command-line arguments to parse.
+
+    Returns:
+        `argparse.Namespace`: The parsed arguments.
+
+    '''
+    parser = argparse.ArgumentParser(
+        description='Answer JSON-RPC docstring requests in a long-running process.')
+
+    parser.add_argument(
+        '--socket',
+        default='',
+        help='Listen to this Unix socket path instead of stdin/stdout.',
+    )
+
+    return parser.parse_args(args)
+
+
+def main(args=None):
+    '''Run the server until it is shut down.
+
+    Args:
+        args (:obj:`list[str]`, optional):
+            The command-line arguments. If nothing is given, `sys.argv` is used.
+
+    '''
+    if args is None:
+        args = sys.argv[1:]
+
+    arguments = _parse_arguments(args)
+    server = DocstringServer()
+
+    if arguments.socket:
+        server.serve_socket(arguments.socket)
+    else:
+        server.serve_stream(sys.stdin, sys.stdout)
+
+
+if __name__ == '__main__':
+    main()
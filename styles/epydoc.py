@@ -2,16 +2,14 @@
 # -*- coding: utf-8 -*-
 
 # IMPORT LOCAL LIBRARIES
-from ..blocks.epydoc import returns_block
-from ..blocks.epydoc import args_block
 from . import sphinx
 
 
 class EpydocStyle(sphinx.SphinxStyle):
 
     _blocks = {
-        args_block.Args.name: args_block.Args,
-        returns_block.Returns.name: returns_block.Returns,
+        'args': '.blocks.epydoc.args_block.Args',
+        'returns': '.blocks.epydoc.returns_block.Returns',
     }
     name = 'epydoc'
 
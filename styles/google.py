@@ -4,6 +4,7 @@
 '''The module responsible for printing a Google-style docstring for functions.'''
 
 # IMPORT STANDARD LIBRARIES
+import inspect
 import os
 import abc
 import sys
@@ -12,12 +13,14 @@ import sys
 import six
 
 # IMPORT LOCAL LIBRARIES
-from ..blocks.google import args_block
-from ..blocks.google import raises_block
 from ..blocks.google import common_block
-from ..blocks.google import yields_block
-from ..blocks.google import returns_block
 from ..config import environment
+from ..config import common
+from .. import profiler
+
+
+# If the `draw` method of each block class takes a render state
+_ACCEPTS_STATE = {}
 
 
 # TODO : Double check that this has everything
@@ -59,6 +62,9 @@ class BaseStyle(object):
     def _get_block(cls, block):
         '''Get the class used for the given `block` name.
 
+        Blocks are registered as import paths and are only imported
+        the first time that they are drawn.
+
         Args:
             block (str): The name of a registered block class.
 
@@ -68,10 +74,16 @@ class BaseStyle(object):
 
         '''
         try:
-            return cls._blocks[block]
+            block_class = cls._blocks[block]
         except KeyError:
             return
 
+        if isinstance(block_class, six.string_types):
+            block_class = common.import_object(block_class)
+            cls._blocks[block] = block_class
+
+        return block_class
+
 
 class GoogleStyle(BaseStyle):
 
@@ -85,10 +97,10 @@ class GoogleStyle(BaseStyle):
 
     name = 'google'
     _blocks = {
-        args_block.Args.name: args_block.Args,
-        returns_block.Returns.name: returns_block.Returns,
-        raises_block.Raises.name: raises_block.Raises,
-        yields_block.Yields.name: yields_block.Yields,
+        'args': '.blocks.google.args_block.Args',
+        'returns': '.blocks.google.returns_block.Returns',
+        'raises': '.blocks.google.raises_block.Raises',
+        'yields': '.blocks.google.yields_block.Yields',
     }
 
     @classmethod
@@ -103,26 +115,20 @@ class GoogleStyle(BaseStyle):
     # TODO : Come back to this docstring and write about NotImplementedError
     #        after there are some unittests for user-defined blocks
     #
-    # TODO : Make note about how info is mutated by this function
-    #
     @classmethod
     def draw(cls, info):
         '''Create a list of docstring lines to create, given some `info`.
 
+        `info` is never changed. The lines that each block draws are kept
+        in a new :class:`auto_docstring.blocks.google.common_block.RenderState`,
+        so the same `info` can be drawn any number of times.
+
         Args:
-            info (dict[str, list[str] or `astroid.NodeNG` or NoneType):
-                The information to draw.
-
-                'vararg' (str or NoneType):
-                    The name of the `*args` function parameter.
-                'returns' (list[`astroid.NodeNG`]):
-                    The object(s) that this function returns.
-                'kwarg': (NoneType or str):
-                    The name of the `**kwargs` function parameter.
-                'defaults' (list[tuple[str, `astroid.NodeNG`]]):
-                    The name and default value of the function parameters.
-                'in': (`astroid.Module` or NoneType):
-                    The root module that defined the `astroid.FunctionDef`.
+            info (:class:`auto_docstring.parsing.visit.FunctionInfo`):
+                The args, returns, raises and yields of the function to draw.
+
+        Blocks whose `draw` only takes `info` are still supported. They are
+        drawn without the state.
 
         Raises:
             NotImplementedError:
@@ -133,8 +139,7 @@ class GoogleStyle(BaseStyle):
 
         '''
         blocks = []
-
-        info.setdefault('lines', [])
+        state = common_block.RenderState()
 
         # Collect the blocks to draw and their contents
         for block_name in environment.get_block_order(cls.name):
@@ -145,10 +150,11 @@ class GoogleStyle(BaseStyle):
                     'Block: "{block_name}" has no class for style, "{obj.name}".'
                     ''.format(block_name=block_name, obj=cls))
 
-            block_lines = block.draw(info)
+            with profiler.stage('draw.{style}.{block}'.format(style=cls.name, block=block_name)):
+                block_lines = _draw_block(block, info, state)
 
             if block_lines:
-                info['lines'] += block_lines
+                state.lines.extend(block_lines)
                 blocks.append((block, block_lines))
                 continue
 
@@ -233,3 +239,44 @@ class GoogleStyle(BaseStyle):
         if cls._is_multiline(lines):
             return ['', '']
         return []
+
+
+def _accepts_state(block):
+    '''bool: Check if the `draw` method of `block` takes a render state.'''
+    try:
+        return _ACCEPTS_STATE[block]
+    except KeyError:
+        pass
+
+    try:
+        inspect.getcallargs(block.draw, None, None)
+    except TypeError:
+        accepts = False
+    else:
+        accepts = True
+
+    _ACCEPTS_STATE[block] = accepts
+    return accepts
+
+
+def _draw_block(block, info, state):
+    '''Draw a block, with or without the lines that were drawn before it.
+
+    Args:
+        block (:class:`auto_docstring.blocks.google.common_block.CommonBlock`):
+            The block to draw. Blocks written before
+            :class:`auto_docstring.blocks.google.common_block.RenderState`
+            existed define `draw(info)`. They are called without `state`.
+        info (:class:`auto_docstring.parsing.visit.FunctionInfo`):
+            The args, returns, raises and yields of the function to draw.
+        state (:class:`auto_docstring.blocks.google.common_block.RenderState`):
+            The lines that were drawn before this block.
+
+    Returns:
+        list[str]: The lines that `block` drew.
+
+    '''
+    if _accepts_state(block):
+        return block.draw(info, state)
+
+    return block.draw(info)
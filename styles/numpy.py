@@ -2,9 +2,6 @@
 # -*- coding: utf-8 -*-
 
 # IMPORT LOCAL LIBRARIES
-from ..blocks.numpy import parameters_block
-from ..blocks.numpy import returns_block
-from ..blocks.numpy import raises_block
 from . import google
 
 
@@ -13,10 +10,10 @@ class NumpyStyle(google.GoogleStyle):
     name = 'numpy'
 
     _blocks = {
-        parameters_block.Parameters.name: parameters_block.Parameters,
-        raises_block.Raises.name: raises_block.Raises,
-        returns_block.Returns.name: returns_block.Returns,
-        # yields_block.Yields.name: yields_block.Yields,
+        'parameters': '.blocks.numpy.parameters_block.Parameters',
+        'raises': '.blocks.numpy.raises_block.Raises',
+        'returns': '.blocks.numpy.returns_block.Returns',
+        # 'yields': '.blocks.numpy.yields_block.Yields',
     }
 
     @classmethod
@@ -7,10 +7,6 @@
 import os
 
 # IMPORT LOCAL LIBRARIES
-from ..blocks.sphinx import returns_block
-from ..blocks.sphinx import raises_block
-from ..blocks.sphinx import yields_block
-from ..blocks.sphinx import args_block
 from . import google
 
 
@@ -19,10 +15,10 @@ class SphinxStyle(google.GoogleStyle):
     name = 'sphinx'
 
     _blocks = {
-        args_block.Args.name: args_block.Args,
-        raises_block.Raises.name: raises_block.Raises,
-        returns_block.Returns.name: returns_block.Returns,
-        yields_block.Yields.name: yields_block.Yields,
+        'args': '.blocks.sphinx.args_block.Args',
+        'raises': '.blocks.sphinx.raises_block.Raises',
+        'returns': '.blocks.sphinx.returns_block.Returns',
+        'yields': '.blocks.sphinx.yields_block.Yields',
     }
 
     @classmethod
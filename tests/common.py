@@ -15,6 +15,7 @@ import six
 
 # IMPORT AUTO-DOCSTING LIBRARIES
 from auto_docstring import docstring_builder
+from auto_docstring import result_cache
 import auto_docstring
 
 
@@ -55,6 +56,7 @@ class CommonTestCase(unittest.TestCase):
 
     def setUp(self):
         auto_docstring.deregister_all()
+        result_cache.get_default_cache().clear()
         self.files_folders = set()
         self.paths = list(sys.path)
         os.environ.clear()
@@ -3,6 +3,13 @@
 
 '''A series of tests for Google-style function docstrings.'''
 
+# IMPORT STANDARD LIBRARIES
+import os
+
+# IMPORT AUTO-DOCSTING LIBRARIES
+from auto_docstring.blocks.google import common_block
+from auto_docstring.styles import google
+
 # IMPORT LOCAL LIBRARIES
 from .. import common
 
@@ -781,3 +788,94 @@ class StandardTestCase(common.CommonTestCase):
         expected_output = '{1:_STYLES!f}: {2!f}.'
 
         self.compare(expected_output, code)
+
+
+class _Notes(common_block.CommonBlock):
+
+    '''A user-defined block that was written before render states existed.'''
+
+    name = 'notes'
+    label = 'Notes'
+
+    @classmethod
+    def draw(cls, info):
+        '''list[str]: A label and one placeholder line.'''
+        return cls.get_starting_lines() + ['    {!f}.']
+
+
+class _Names(common_block.CommonBlock):
+
+    '''A user-defined block that reads its info like a dict.'''
+
+    name = 'names'
+    label = 'Names'
+
+    @classmethod
+    def draw(cls, info):
+        '''list[str]: A label and the name of every arg.'''
+        names = list(info.get('args', [])) + [name for name, _ in info['defaults']]
+
+        if not info.get('lines'):
+            names.append('first')
+
+        return cls.get_starting_lines() + ['    ' + name for name in names]
+
+
+class CustomBlockTestCase(common.CommonTestCase):
+
+    '''Test blocks that are added to a style by the user.'''
+
+    def setUp(self):
+        '''Add "notes" and "names" blocks to the Google style.'''
+        super(CustomBlockTestCase, self).setUp()
+        google.GoogleStyle._blocks['notes'] = _Notes
+        google.GoogleStyle._blocks['names'] = _Names
+        self.addCleanup(google.GoogleStyle._blocks.pop, 'notes')
+        self.addCleanup(google.GoogleStyle._blocks.pop, 'names')
+
+    def test_draw_without_state(self):
+        '''Draw a block whose `draw` method only takes `info`.'''
+        os.environ['AUTO_DOCSTRING_BLOCK_ORDER'] = 'args,notes'
+        code = \
+            '''
+            def foo(bar):
+                {curs}
+                pass
+            '''
+
+        expected_output = \
+            '''\
+            {1!f}.
+
+            Args:
+                bar ({2!f}): {3!f}.
+
+            Notes:
+                {4!f}.
+
+            '''
+
+        self.compare(expected_output, code)
+
+    def test_dict_info(self):
+        '''Draw a block that reads its info with `get` and `[]`, like a dict.'''
+        os.environ['AUTO_DOCSTRING_BLOCK_ORDER'] = 'names'
+        code = \
+            '''
+            def foo(bar, fizz=8):
+                {curs}
+                pass
+            '''
+
+        expected_output = \
+            '''\
+            {1!f}.
+
+            Names:
+                bar
+                fizz
+                first
+
+            '''
+
+        self.compare(expected_output, code)
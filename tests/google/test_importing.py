@@ -172,6 +172,81 @@ class TypeTestCase(common.CommonTestCase):
 
         self.compare(expected_output, code)
 
+    def test_from_import_alias(self):
+        '''Get the full import path of an object that was imported with an alias.'''
+        code = \
+            '''
+            from collections import OrderedDict as Ordered
+
+            def foo():
+                {curs}
+                return Ordered()
+            '''
+
+        expected_output = '{1:<collections.OrderedDict>!f}: {2!f}.'
+
+        self.compare(expected_output, code)
+
+    def test_from_import_module_alias(self):
+        '''Get the full import path of a module that was imported with an alias.'''
+        code = \
+            '''
+            from PySide import QtGui as Gui
+
+            def foo():
+                {curs}
+                return Gui.QRegExpValidator()
+            '''
+
+        expected_output = '{1:<PySide.QtGui.QRegExpValidator>!f}: {2!f}.'
+
+        self.compare(expected_output, code)
+
+    def test_import_after_use(self):
+        '''Ignore imports that come after the object is used.'''
+        code = \
+            '''
+            def foo():
+                {curs}
+                return QtGui.QRegExpValidator()
+
+            from PySide import QtGui
+            '''
+
+        expected_output = '{1:<QtGui.QRegExpValidator>!f}: {2!f}.'
+
+        self.compare(expected_output, code)
+
+    def test_relative_parent_path(self):
+        '''Drop the leading dots of a relative import if the module has no name.'''
+        code = \
+            '''
+            from ..things import QtGui
+
+            def foo():
+                {curs}
+                return QtGui.QRegExpValidator()
+            '''
+
+        expected_output = '{1:<things.QtGui.QRegExpValidator>!f}: {2!f}.'
+
+        self.compare(expected_output, code)
+
+    def test_relative_grandparent_path(self):
+        '''Drop every leading dot of a relative import if the module has no name.'''
+        code = \
+            '''
+            from ...parsing import visit
+
+            def foo():
+                {curs}
+                return visit.get_value()
+            '''
+
+        expected_output = '{1:<parsing.visit.get_value>!f}: {2!f}.'
+
+        self.compare(expected_output, code)
+
     # def test_relative_import(self):
     #     # Create the temporary Python package and set it up with files
     #     temporary_directory = os.path.join(tempfile.mkdtemp(), 'fake_project')
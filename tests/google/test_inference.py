@@ -3,6 +3,19 @@
 
 '''Test the ways that auto_docstring finds object types.'''
 
+# IMPORT STANDARD LIBRARIES
+import textwrap
+import os
+
+# IMPORT THIRD-PARTY LIBRARIES
+import astroid
+
+# IMPORT AUTO-DOCSTING LIBRARIES
+from auto_docstring.blocks.google import returns_block
+from auto_docstring.blocks.google import common_type
+from auto_docstring.parsing import visit
+import auto_docstring
+
 # IMPORT LOCAL LIBRARIES
 from .. import common
 
@@ -97,6 +110,406 @@ class RecursionTestCase(common.CommonTestCase):
 
         self.compare(expected_output, code)
 
+    def test_same_function_many_times(self):
+        '''Get the return-type of a function that calls the same function, more than once.'''
+        code = \
+            '''
+            def foo(arg1):
+                if arg1:
+                    return 8
+                return 'something'
+
+            def bar():
+                {curs}
+                if foo(1) == 8:
+                    return foo(1)
+                if foo(2) == 8:
+                    return foo(2)
+                return foo(None)
+            '''
+
+        expected_output = '{1:int or str!f}: {2!f}.'
+
+        self.compare(expected_output, code)
+
+
+class LocalFunctionTestCase(common.CommonTestCase):
+
+    '''Test how the functions of the current module are found and remembered.'''
+
+    def setUp(self):
+        '''Create a module with a few functions.'''
+        super(LocalFunctionTestCase, self).setUp()
+        self.module = astroid.parse(textwrap.dedent(
+            '''
+            def foo():
+                return 8
+
+            class Thing(object):
+                def foo(self):
+                    return 'something'
+
+                def bar(self):
+                    return 9.0
+            '''))
+
+    @staticmethod
+    def _replace_types(function, text):
+        '''Change the remembered return-types of `function` to `text`.'''
+        key, (needed, recursive, _), texts = common_type._LOCAL_RETURN_TYPES[function]
+        common_type._LOCAL_RETURN_TYPES[function] = (key, (needed, recursive, text), texts)
+
+    def test_first_function(self):
+        '''Only keep the first function of each name.'''
+        functions = common_type._get_local_functions(self.module)
+
+        self.assertEqual(['bar', 'foo'], sorted(functions))
+        self.assertIs(self.module.body[0], functions['foo']())
+
+    def test_remember_types(self):
+        '''Only find the return-types of a function once.'''
+        function = self.module.body[0]
+
+        self.assertEqual('int', common_type._get_local_return_types(function))
+
+        self._replace_types(function, 'remembered')
+
+        self.assertEqual('remembered', common_type._get_local_return_types(function))
+
+    def test_register_resets(self):
+        '''Find the return-types again after a default value is registered.'''
+        function = self.module.body[0]
+        common_type._get_local_return_types(function)
+
+        self._replace_types(function, 'remembered')
+        auto_docstring.register('some.module.function', returns='str')
+
+        self.assertEqual('int', common_type._get_local_return_types(function))
+
+    def test_recursion_not_remembered(self):
+        '''Don't remember types that were found while their caller was still being followed.'''
+        module = astroid.parse(textwrap.dedent(
+            '''
+            def even(value):
+                if value:
+                    return odd(value - 1)
+                return True
+
+            def odd(value):
+                if value:
+                    return even(value - 1)
+                return 'something'
+            '''))
+        even, odd = module.body
+
+        self.assertEqual('str or bool', common_type._get_local_return_types(even))
+        self.assertNotIn(odd, common_type._LOCAL_RETURN_TYPES)
+        self.assertEqual((2, True, 'str or bool'), common_type._LOCAL_RETURN_TYPES[even][1])
+
+    def test_resolve_module(self):
+        '''Find the return-types of every function of a module at once.'''
+        module = astroid.parse(textwrap.dedent(
+            '''
+            def foo():
+                return bar()
+
+            def bar():
+                if some_value:
+                    return fizz()
+                return 8
+
+            def fizz():
+                return 'something'
+            '''))
+
+        self.assertEqual({}, common_type.resolve_local_return_types(module))
+
+        foo, bar, fizz = module.body
+        self.assertEqual((3, False, 'str or int'), common_type._LOCAL_RETURN_TYPES[foo][1])
+        self.assertEqual((2, False, 'str or int'), common_type._LOCAL_RETURN_TYPES[bar][1])
+        self.assertEqual((1, False, 'str'), common_type._LOCAL_RETURN_TYPES[fizz][1])
+
+    def test_returns_block(self):
+        '''Draw the return-types that were already found, instead of finding them again.'''
+        function = self.module.body[0]
+        common_type._get_local_return_types(function)
+        info = visit.get_info(self.module)['functions'][function]
+
+        self.assertEqual(['int'], returns_block.Returns._process_args(info))
+        self._replace_types(function, 'remembered')
+        self.assertEqual(['remembered'], returns_block.Returns._process_args(info))
+
+    def test_resolve_recursion(self):
+        '''Resolve functions that call each other as one unit.'''
+        module = astroid.parse(textwrap.dedent(
+            '''
+            def foo():
+                return bar()
+
+            def bar():
+                if some_value:
+                    return fizz()
+                return 8
+
+            def fizz():
+                return bar()
+            '''))
+        common_type.resolve_local_return_types(module)
+
+        foo, bar, fizz = module.body
+        self.assertEqual((3, False, 'int'), common_type._LOCAL_RETURN_TYPES[foo][1])
+        self.assertEqual((2, False, 'int'), common_type._LOCAL_RETURN_TYPES[bar][1])
+        self.assertEqual((2, False, 'int'), common_type._LOCAL_RETURN_TYPES[fizz][1])
+
+    def test_resolve_cycle_order(self):
+        '''Find the same types for a cycle, no matter which of its functions comes first.'''
+        code = textwrap.dedent(
+            '''
+            def even(value):
+                if value:
+                    return odd(value - 1)
+                return True
+
+            def odd(value):
+                if value:
+                    return even(value - 1)
+                return 'something'
+            ''')
+        texts = []
+
+        for index in range(2):
+            module = astroid.parse(code)
+            common_type.resolve_return_types(module.body[index])
+            texts.append([common_type.get_resolved_return_types(function) for function in module.body])
+
+        self.assertEqual([['bool or str', 'bool or str']] * 2, texts)
+
+    def test_resolve_self(self):
+        '''Resolve a function that calls itself.'''
+        module = astroid.parse(textwrap.dedent(
+            '''
+            def foo(value):
+                if value:
+                    return foo(value - 1)
+                return 8
+            '''))
+        common_type.resolve_return_types(module.body[0])
+
+        self.assertEqual((1, False, 'int'), common_type._LOCAL_RETURN_TYPES[module.body[0]][1])
+
+    def test_resolve_growing(self):
+        '''Leave types that never stop changing to be found when they're followed.'''
+        module = astroid.parse(textwrap.dedent(
+            '''
+            def foo(value):
+                if value:
+                    return foo(value - 1)
+                return 8
+            '''))
+        follow = common_type._follow
+
+        def _follow(function, stack):
+            _, frame = follow(function, stack)
+            # Pretend that `function` returns a list of its own return-types
+            return ('list[{}]'.format(common_type._get_local_return_types(function)), frame)
+
+        self.addCleanup(setattr, common_type, '_follow', follow)
+        common_type._follow = _follow
+
+        common_type.resolve_return_types(module.body[0])
+
+        self.assertIsNone(common_type.get_resolved_return_types(module.body[0]))
+
+    def test_resolve_yields(self):
+        '''Resolve the functions that a generator yields.'''
+        module = astroid.parse(textwrap.dedent(
+            '''
+            def foo():
+                yield bar()
+
+            def bar():
+                return 8
+            '''))
+        common_type.resolve_return_types(module.body[0])
+
+        self.assertEqual('int', common_type.get_resolved_return_types(module.body[1]))
+
+    def test_resolve_errors(self):
+        '''Give the functions whose types can't be inferred instead of raising.'''
+        module = astroid.parse(textwrap.dedent(
+            '''
+            def foo():
+                return bar()
+
+            def bar():
+                return 8
+            '''))
+        foo, bar = module.body
+        follow = common_type._follow
+
+        def _follow(function, stack):
+            if function is bar:
+                raise astroid.InferenceError('Bad inference')
+
+            return follow(function, stack)
+
+        self.addCleanup(setattr, common_type, '_follow', follow)
+        common_type._follow = _follow
+
+        # `foo` needs the types of `bar` so it can't be inferred, either
+        self.assertEqual(
+            {foo: 'Bad inference', bar: 'Bad inference'},
+            common_type.resolve_local_return_types(module),
+        )
+        self.assertIsNone(common_type.get_resolved_return_types(bar))
+
+    def test_reuse_at_lower_depth(self):
+        '''Re-use types that were found at a higher depth if they fit in a lower depth.'''
+        module = astroid.parse(textwrap.dedent(
+            '''
+            def foo():
+                return bar()
+
+            def bar():
+                return 8
+            '''))
+        foo, bar = module.body
+        common_type._get_local_return_types(bar)
+        self._replace_types(bar, 'remembered')
+
+        self.assertEqual('remembered', common_type._get_local_return_types(foo))
+
+
+class FollowTestCase(common.CommonTestCase):
+
+    '''Test how deep functions are followed to find their return-types.'''
+
+    code = \
+        '''
+        def foo():
+            {curs}
+            return bar()
+
+        def bar():
+            return fizz()
+
+        def fizz():
+            return 8
+        '''
+
+    def test_recursive_function(self):
+        '''Get the return-type of a function that calls itself.'''
+        code = \
+            '''
+            def foo():
+                {curs}
+                if some_value:
+                    return foo()
+                return 8
+            '''
+
+        expected_output = '{1:int!f}: {2!f}.'
+
+        self.compare(expected_output, code)
+
+    def test_mutually_recursive_functions(self):
+        '''Get the return-type of functions that call each other.'''
+        code = \
+            '''
+            def foo():
+                {curs}
+                if some_value:
+                    return bar()
+                return True
+
+            def bar():
+                if some_value:
+                    return foo()
+                return False
+            '''
+
+        expected_output = '{1:bool!f}: {2!f}.'
+
+        self.compare(expected_output, code)
+
+    def test_mutually_recursive_order(self):
+        '''Get the same return-type for each function that calls the other.'''
+        code = \
+            '''
+            def foo():
+                if some_value:
+                    return bar()
+                return True
+
+            def bar():
+                {curs}
+                if some_value:
+                    return foo()
+                return 'something'
+            '''
+
+        expected_output = '{1:bool or str!f}: {2!f}.'
+
+        self.compare(expected_output, code)
+
+    def test_yields_recursive_functions(self):
+        '''Yield the return-type of functions that call each other.'''
+        code = \
+            '''
+            def foo():
+                {curs}
+                yield bar()
+
+            def bar():
+                if some_value:
+                    return fizz()
+                return True
+
+            def fizz():
+                if some_value:
+                    return bar()
+                return 'something'
+            '''
+
+        expected_output = '{1:bool or str!f}: {2!f}.'
+
+        self.compare(expected_output, code)
+
+    def test_only_recursive(self):
+        '''Mark a function that only returns its own result.'''
+        code = \
+            '''
+            def foo():
+                {curs}
+                return foo()
+            '''
+
+        expected_output = '{1:<recursive>!f}: {2!f}.'
+
+        self.compare(expected_output, code)
+
+    def test_default_depth(self):
+        '''Follow every function when they don't go too deep.'''
+        self.compare('{1:int!f}: {2!f}.', self.code)
+
+    def test_depth(self):
+        '''Stop following functions once the depth is reached.'''
+        os.environ['AUTO_DOCSTRING_TYPE_FOLLOW_DEPTH'] = '1'
+
+        self.compare('{1:<fizz>!f}: {2!f}.', self.code)
+
+    def test_no_follow(self):
+        '''Don't follow any function if the depth is 0.'''
+        os.environ['AUTO_DOCSTRING_TYPE_FOLLOW_DEPTH'] = '0'
+
+        self.compare('{1:<bar>!f}: {2!f}.', self.code)
+
+    def test_legacy_setting(self):
+        '''Don't follow any function if the older, on / off setting is off.'''
+        os.environ['AUTO_DOCSTRING_TYPE_FOLLOW'] = '0'
+
+        self.compare('{1:<bar>!f}: {2!f}.', self.code)
+
 # TODO : Finish this
 #     def test_classmethod(self):
 #         code = \
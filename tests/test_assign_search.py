@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''Make sure that assigned variables are found by their names.'''
+
+# IMPORT STANDARD LIBRARIES
+import textwrap
+import weakref
+import gc
+
+# IMPORT THIRD-PARTY LIBRARIES
+import astroid
+
+# IMPORT AUTO-DOCSTING LIBRARIES
+from auto_docstring.parsing import assign_search
+
+# IMPORT LOCAL LIBRARIES
+from . import common
+
+
+class FindNodeTypeTestCase(common.CommonTestCase):
+
+    '''Test :func:`auto_docstring.parsing.assign_search.find_node_type`.'''
+
+    def setUp(self):
+        '''Create a function that assigns a few variables.'''
+        super(FindNodeTypeTestCase, self).setUp()
+        self.function = astroid.parse(textwrap.dedent(
+            '''
+            def foo(bar, fizz):
+                value = bar
+                value = bar or fizz
+                self.thing = bar and fizz
+                first, second = bar
+                return value
+            ''')).body[0]
+
+    def test_last_assignment(self):
+        '''Use the last assignment of a name.'''
+        self.assertEqual(bool, assign_search.find_node_type(self.function, 'value'))
+
+    def test_attribute(self):
+        '''Find assignments to attributes by their full name.'''
+        self.assertEqual(bool, assign_search.find_node_type(self.function, 'self.thing'))
+
+    def test_missing(self):
+        '''Raise an error if the name was never assigned.'''
+        with self.assertRaises(RuntimeError):
+            assign_search.find_node_type(self.function, 'missing')
+
+    def test_index(self):
+        '''Group every assignment by its name.'''
+        index = assign_search.get_assignment_index(self.function)
+
+        self.assertEqual(2, len(index['value']))
+        self.assertEqual(1, len(index['(first, second)']))
+        self.assertEqual(index, assign_search.get_assignment_index(self.function))
+
+    def test_garbage_collected(self):
+        '''Don't keep a function alive just because its assignments were found.'''
+        assign_search.get_assignment_index(self.function)
+        function = weakref.ref(self.function)
+        del self.function
+        gc.collect()
+
+        self.assertIsNone(function())
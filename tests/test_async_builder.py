@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''Make sure that docstrings can be created in worker threads.'''
+
+# IMPORT STANDARD LIBRARIES
+import textwrap
+import threading
+
+# IMPORT AUTO-DOCSTING LIBRARIES
+from auto_docstring.config import budget
+from auto_docstring import docstring_builder
+from auto_docstring import async_builder
+
+# IMPORT LOCAL LIBRARIES
+from . import common
+
+
+class AsyncBuilderTestCase(common.CommonTestCase):
+
+    '''Test :class:`auto_docstring.async_builder.AsyncDocstringBuilder`.'''
+
+    def setUp(self):
+        '''Create a single-threaded builder.'''
+        super(AsyncBuilderTestCase, self).setUp()
+        self.code = textwrap.dedent(
+            '''
+            def foo(bar):
+
+                return 8
+            ''')
+        self.builder = async_builder.AsyncDocstringBuilder(max_workers=1)
+
+    def tearDown(self):
+        '''Stop the builder.'''
+        super(AsyncBuilderTestCase, self).tearDown()
+        self.builder.shutdown()
+
+    def _block(self):
+        '''threading.Event: Keep the only worker thread busy until the event is set.'''
+        blocker = threading.Event()
+        self.builder._submit(blocker.wait, None)  # pylint: disable=protected-access
+
+        return blocker
+
+    def test_same_output(self):
+        '''Create the same docstring as the blocking function.'''
+        future = self.builder.create_ultisnips_docstring(self.code, row=2, style='google')
+
+        self.assertEqual(
+            docstring_builder.create_ultisnips_docstring(self.code, row=2, style='google'),
+            future.result(),
+        )
+        self.assertTrue(future.done())
+        self.assertFalse(future.cancelled())
+
+    def test_superseded(self):
+        '''Cancel an older request once the same buffer makes a newer request.'''
+        blocker = self._block()
+
+        older = self.builder.create_docstring(self.code, row=2, buffer='foo.py')
+        newer = self.builder.create_docstring(self.code, row=2, buffer='foo.py')
+        blocker.set()
+
+        with self.assertRaises(budget.Cancelled):
+            older.result()
+
+        self.assertTrue(older.cancelled())
+        self.assertEqual(docstring_builder.create_docstring(self.code, row=2), newer.result())
+
+    def test_other_buffers(self):
+        '''Never cancel the requests of a different buffer.'''
+        first = self.builder.create_docstring(self.code, row=2, buffer='foo.py')
+        second = self.builder.create_docstring(self.code, row=2, buffer='bar.py')
+
+        self.assertEqual(first.result(), second.result())
+
+    def test_cancel(self):
+        '''Stop a request using its buffer name.'''
+        blocker = self._block()
+
+        request = self.builder.create_docstring(self.code, row=2, buffer='foo.py')
+
+        self.assertTrue(self.builder.cancel('foo.py'))
+        blocker.set()
+
+        with self.assertRaises(budget.Cancelled):
+            request.result()
+
+        self.assertFalse(self.builder.cancel('foo.py'))
+
+    def test_cancel_running(self):
+        '''Stop a request that already started at its next stage.'''
+        started = threading.Event()
+        release = threading.Event()
+
+        def _run():
+            started.set()
+            release.wait()
+            budget.check_cancelled()
+
+            return 'Not cancelled'
+
+        request = self.builder._submit(_run, 'foo.py')  # pylint: disable=protected-access
+        started.wait()
+
+        self.assertTrue(request.cancel())
+        release.set()
+
+        with self.assertRaises(budget.Cancelled):
+            request.result()
+
+    def test_finished(self):
+        '''Do not cancel a request that already finished.'''
+        request = self.builder.create_docstring(self.code, row=2)
+        request.result()
+
+        self.assertFalse(request.cancel())
+        self.assertFalse(request.cancelled())
+
+    def test_error(self):
+        '''Raise the error of a request once its result is requested.'''
+        request = self.builder.create_docstring(self.code, row=2, style='not_a_style')
+
+        with self.assertRaises(Exception):
+            request.result()
+
+        self.assertTrue(request.done())
+
+    def test_timeout(self):
+        '''Stop waiting for a request that takes too long.'''
+        blocker = self._block()
+        request = self.builder.create_docstring(self.code, row=2)
+
+        with self.assertRaises(async_builder.Timeout):
+            request.result(timeout=0.01)
+
+        blocker.set()
+
+        self.assertEqual(docstring_builder.create_docstring(self.code, row=2), request.result())
+
+    def test_done_callback(self):
+        '''Call every callback once the request is done, even if it was added late.'''
+        blocker = self._block()
+        request = self.builder.create_docstring(self.code, row=2)
+        called = threading.Event()
+        done = []
+
+        def _add(future):
+            done.append(future)
+            called.set()
+
+        request.add_done_callback(_add)
+        self.assertEqual([], done)
+
+        blocker.set()
+        called.wait()
+        request.add_done_callback(done.append)
+
+        self.assertEqual([request, request], done)
+
+    def test_shutdown(self):
+        '''Refuse new requests once the builder is shut down.'''
+        self.builder.shutdown()
+
+        with self.assertRaises(RuntimeError):
+            self.builder.create_docstring(self.code, row=2)
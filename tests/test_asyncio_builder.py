@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''Make sure that docstrings can be awaited from an asyncio event loop.'''
+
+# IMPORT STANDARD LIBRARIES
+import textwrap
+import threading
+import unittest
+import sys
+
+# IMPORT AUTO-DOCSTING LIBRARIES
+from auto_docstring import docstring_builder
+from auto_docstring import async_builder
+
+# IMPORT LOCAL LIBRARIES
+from . import common
+
+if sys.version_info >= (3, 5):
+    import asyncio
+
+    from auto_docstring import asyncio_builder
+
+
+@unittest.skipIf(sys.version_info < (3, 5), 'asyncio requires Python 3.5+')
+class AsyncioBuilderTestCase(common.CommonTestCase):
+
+    '''Test :mod:`auto_docstring.asyncio_builder`.'''
+
+    def setUp(self):
+        '''Create an event loop and a single-threaded builder.'''
+        super(AsyncioBuilderTestCase, self).setUp()
+        self.code = textwrap.dedent(
+            '''
+            def foo():
+
+                return 8
+            ''')
+        self.loop = asyncio.new_event_loop()
+        self.builder = async_builder.AsyncDocstringBuilder(max_workers=1)
+
+    def tearDown(self):
+        '''Stop the builder and the event loop.'''
+        super(AsyncioBuilderTestCase, self).tearDown()
+        self.builder.shutdown()
+        self.loop.close()
+
+    def test_same_output(self):
+        '''Create the same docstring as the blocking function.'''
+        output = self.loop.run_until_complete(
+            asyncio_builder.create_docstring(self.code, row=2, loop=self.loop))
+
+        self.assertEqual(docstring_builder.create_docstring(self.code, row=2), output)
+
+    def test_superseded(self):
+        '''Cancel the awaited future once the same buffer makes a newer request.'''
+        blocker = threading.Event()
+        self.builder._submit(blocker.wait, None)  # pylint: disable=protected-access
+
+        older = asyncio_builder.wrap_future(
+            self.builder.create_docstring(self.code, row=2, buffer='foo.py'), loop=self.loop)
+        newer = asyncio_builder.wrap_future(
+            self.builder.create_docstring(self.code, row=2, buffer='foo.py'), loop=self.loop)
+        blocker.set()
+
+        older, newer = self.loop.run_until_complete(
+            asyncio.gather(older, newer, return_exceptions=True))
+
+        self.assertIsInstance(older, asyncio.CancelledError)
+        self.assertEqual(docstring_builder.create_docstring(self.code, row=2), newer)
+
+    def test_cancel_awaited(self):
+        '''Stop the work in its thread once the caller stops waiting for it.'''
+        blocker = threading.Event()
+        self.builder._submit(blocker.wait, None)  # pylint: disable=protected-access
+
+        request = self.builder.create_docstring(self.code, row=2)
+        awaited = asyncio_builder.wrap_future(request, loop=self.loop)
+
+        awaited.cancel()
+
+        # Run the callbacks of the cancelled future
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+        blocker.set()
+
+        self.assertTrue(request.cancelled())
@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''Test the command-line tool that adds docstrings to whole projects.'''
+
+# IMPORT STANDARD LIBRARIES
+import tempfile
+import textwrap
+import json
+import os
+
+# IMPORT THIRD-PARTY LIBRARIES
+import astroid
+import six
+
+# IMPORT AUTO-DOCSTING LIBRARIES
+from auto_docstring.blocks.google import common_type
+from auto_docstring.parsing import call_graph
+from auto_docstring import backfill
+
+# IMPORT LOCAL LIBRARIES
+from . import common
+
+
+class BackfillTestCase(common.CommonTestCase):
+
+    '''Create docstrings for every function in a folder.'''
+
+    def setUp(self):
+        '''Create a folder with a Python file that needs docstrings.'''
+        super(BackfillTestCase, self).setUp()
+        self.root = tempfile.mkdtemp()
+        self.files_folders.add(self.root)
+
+        code = textwrap.dedent(
+            '''\
+            def foo(bar):
+                return 8
+
+
+            def fizz():
+                \'\'\'Some docstring.\'\'\'
+                return 'buzz'
+
+
+            def one_line(): pass
+            ''')
+
+        with open(os.path.join(self.root, 'module.py'), 'w') as handler:
+            handler.write(code)
+
+        with open(os.path.join(self.root, 'ignored.txt'), 'w') as handler:
+            handler.write(code)
+
+    def _backfill(self, output_format, jobs=1):
+        '''str: Run the tool and get its output. By default, run in the current process.'''
+        stream = six.StringIO()
+        backfill.backfill([self.root], output_format=output_format, jobs=jobs, stream=stream)
+        return stream.getvalue()
+
+    def test_json(self):
+        '''Only functions with no docstring get one.'''
+        lines = [json.loads(line) for line in self._backfill('json').splitlines()]
+
+        self.assertEqual(['foo'], [line['function'] for line in lines])
+        self.assertEqual(
+            '"""{1!f}.\n\nArgs:\n    bar ({2!f}): {3!f}.\n\nReturns:\n    {4:int!f}: {5!f}.\n\n"""',
+            lines[0]['docstring'],
+        )
+
+    def test_diff(self):
+        '''Add the docstring below the function definition, with its indentation.'''
+        diff = self._backfill('diff')
+
+        self.assertIn(' def foo(bar):\n+    """{1!f}.\n+\n+    Args:\n', diff)
+        self.assertEqual(1, diff.count('@@ '))
+
+    def test_diff_header(self):
+        '''Count only the real lines of a file that ends with a newline.'''
+        with open(os.path.join(self.root, 'module.py'), 'w') as handler:
+            handler.write('def foo(bar):\n    return 8\n')
+
+        diff = self._backfill('diff')
+
+        self.assertIn('\n@@ -1,2 +1,11 @@\n', diff)
+        self.assertTrue(diff.endswith('+    """\n     return 8\n'))
+
+    def test_diff_no_final_newline(self):
+        '''Mark the last line of a file that doesn't end with a newline.'''
+        with open(os.path.join(self.root, 'module.py'), 'w') as handler:
+            handler.write('def foo(bar):\n    return 8')
+
+        diff = self._backfill('diff')
+
+        self.assertIn('\n@@ -1,2 +1,11 @@\n', diff)
+        self.assertTrue(diff.endswith('\n     return 8\n\\ No newline at end of file\n'))
+
+    def test_jobs(self):
+        '''Spread files across a pool of processes and keep their order.'''
+        folder = os.path.join(self.root, 'package')
+        os.makedirs(folder)
+
+        for name in ('first', 'second'):
+            with open(os.path.join(folder, name + '.py'), 'w') as handler:
+                handler.write('def {name}(value):\n    return str(value)\n'.format(name=name))
+
+        lines = [json.loads(line) for line in self._backfill('json', jobs=2).splitlines()]
+
+        self.assertEqual(['foo', 'first', 'second'], [line['function'] for line in lines])
+        self.assertEqual(
+            '"""{1!f}.\n\nArgs:\n    value ({2!f}): {3!f}.\n\n'
+            'Returns:\n    {4:str!f}: {5!f}.\n\n"""',
+            lines[1]['docstring'],
+        )
+        self.assertEqual(lines, [json.loads(line) for line in self._backfill('json').splitlines()])
+
+    def test_resolve_error(self):
+        '''Report a file whose return-types cannot be resolved instead of stopping.'''
+        def _fail(*args, **kwargs):
+            raise RuntimeError('Bad call graph')
+
+        self.addCleanup(
+            setattr,
+            call_graph,
+            'get_strongly_connected_components',
+            call_graph.get_strongly_connected_components,
+        )
+        call_graph.get_strongly_connected_components = _fail
+
+        lines = [json.loads(line) for line in self._backfill('json').splitlines()]
+
+        self.assertEqual(
+            [{'path': os.path.join(self.root, 'module.py'), 'error': 'Bad call graph'}],
+            lines,
+        )
+
+    def test_resolve_function_error(self):
+        '''Record the functions whose return-types cannot be inferred and keep going.'''
+        def _fail(*args, **kwargs):
+            raise astroid.InferenceError('Bad inference')
+
+        self.addCleanup(setattr, common_type, '_follow', common_type._follow)
+        common_type._follow = _fail
+
+        lines = [json.loads(line) for line in self._backfill('json').splitlines()]
+
+        self.assertEqual(['foo'], [line['function'] for line in lines])
+        self.assertEqual('Bad inference', lines[0]['resolve_error'])
+        self.assertEqual(
+            '"""{1!f}.\n\nArgs:\n    bar ({2!f}): {3!f}.\n\nReturns:\n    {4:int!f}: {5!f}.\n\n"""',
+            lines[0]['docstring'],
+        )
+
+    def test_invalid_format(self):
+        '''Fail early if the output format does not exist.'''
+        with self.assertRaises(ValueError):
+            self._backfill('xml')
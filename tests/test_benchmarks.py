@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''Test the summaries and baseline comparisons of the benchmark suite.'''
+
+# IMPORT STANDARD LIBRARIES
+import tempfile
+import unittest
+import shutil
+import json
+import sys
+import ast
+import os
+
+# IMPORT THIRD-PARTY LIBRARIES
+import astroid
+import six
+
+# IMPORT AUTO-DOCSTING LIBRARIES
+from auto_docstring.benchmarks import synthetic
+from auto_docstring.benchmarks import visitors
+from auto_docstring.benchmarks import run
+from auto_docstring.parsing import visit
+
+
+class BenchmarkTestCase(unittest.TestCase):
+
+    '''Test :mod:`auto_docstring.benchmarks.run`.'''
+
+    def test_summarize(self):
+        '''Get percentiles and throughput from a list of latencies.'''
+        summary = run.summarize([0.4, 0.1, 0.2, 0.3, 0.5], errors=2)
+
+        self.assertEqual(5, summary['calls'])
+        self.assertEqual(2, summary['errors'])
+        self.assertEqual(0.3, summary['p50'])
+        self.assertEqual(0.5, summary['max'])
+        self.assertAlmostEqual(5 / 1.5, summary['throughput'])
+
+    def test_compare(self):
+        '''Only report results that are slower than the tolerance allows.'''
+        baseline = {
+            'google/create_docstring': {'p50': 1.0, 'p90': 2.0, 'throughput': 1.0},
+            'numpy/create_docstring': {'p50': 1.0, 'p90': 2.0, 'throughput': 1.0},
+        }
+        results = {
+            'google/create_docstring': {'p50': 1.1, 'p90': 2.1, 'throughput': 0.9},
+            'numpy/create_docstring': {'p50': 1.5, 'p90': 2.0, 'throughput': 1.0},
+            'sphinx/create_docstring': {'p50': 9.0, 'p90': 9.0, 'throughput': 0.1},
+        }
+
+        regressions = run.compare(results, baseline, tolerance=0.2)
+
+        self.assertEqual(1, len(regressions))
+        self.assertTrue(regressions[0].startswith('numpy/create_docstring p50'))
+
+    def test_compare_throughput(self):
+        '''Report a throughput that dropped more than its own tolerance allows.'''
+        baseline = {
+            'google/create_docstring': {'p50': 1.0, 'p90': 2.0, 'throughput': 10.0},
+            'numpy/create_docstring': {'p50': 1.0, 'p90': 2.0, 'throughput': 10.0},
+        }
+        results = {
+            'google/create_docstring': {'p50': 1.0, 'p90': 2.0, 'throughput': 8.0},
+            'numpy/create_docstring': {'p50': 1.0, 'p90': 2.0, 'throughput': 6.0},
+        }
+
+        regressions = run.compare(results, baseline, tolerance=0.2, throughput_tolerance=0.3)
+
+        self.assertEqual(
+            ['numpy/create_docstring throughput: 6.0 calls/sec is lower than the baseline '
+             '10.0 calls/sec'],
+            regressions,
+        )
+        self.assertEqual(
+            2, len(run.compare(results, baseline, tolerance=0.2, throughput_tolerance=0.1)))
+
+    def test_compare_errors(self):
+        '''Report failed calls even if what did run was fast.'''
+        baseline = {'google/create_docstring': {'p50': 1.0, 'p90': 2.0, 'throughput': 0.0}}
+        results = {
+            'google/create_docstring': run.summarize([], errors=3),
+            'numpy/create_docstring': run.summarize([0.1], errors=1),
+        }
+
+        regressions = run.compare(results, baseline, tolerance=0.2)
+
+        self.assertEqual(
+            ['google/create_docstring: 3 calls failed', 'numpy/create_docstring: 1 calls failed'],
+            regressions,
+        )
+
+    def test_missing_baseline(self):
+        '''Fail if there is no baseline to compare against.'''
+        path = os.path.join(tempfile.mkdtemp(), 'baseline.json')
+        stderr = sys.stderr
+        sys.stderr = six.StringIO()
+
+        try:
+            code = run.main(['--baseline', path])
+            message = sys.stderr.getvalue()
+        finally:
+            sys.stderr = stderr
+            shutil.rmtree(os.path.dirname(path))
+
+        self.assertEqual(1, code)
+        self.assertIn('No baseline found', message)
+
+    def test_baseline(self):
+        '''Ship a baseline that has every benchmark.'''
+        with open(run._DEFAULT_BASELINE, 'r') as handler:  # pylint: disable=protected-access
+            baseline = json.load(handler)
+
+        expected = sorted(['{style}/{name}'.format(style=style, name=name)
+                           for style in run.STYLES for name in run.FUNCTIONS] + [run.IMPORT_KEY])
+        self.assertEqual(expected, sorted(baseline))
+
+    def test_measure_import(self):
+        '''Time the import of the package in new processes.'''
+        summary = run.measure_import(repeat=2)
+
+        self.assertEqual(2, summary['calls'])
+        self.assertEqual(0, summary['errors'])
+        self.assertGreater(summary['p50'], 0)
+        self.assertEqual('import/auto_docstring', run.IMPORT_KEY)
+
+    def test_synthetic(self):
+        '''Create valid code with the requested number of definitions.'''
+        module = ast.parse(synthetic.make_module(40))
+        definitions = [node for node in module.body
+                       if isinstance(node, (ast.FunctionDef, ast.ClassDef))]
+
+        self.assertEqual(40, len(definitions))
+
+
+class VisitorBenchmarkTestCase(unittest.TestCase):
+
+    '''Test :mod:`auto_docstring.benchmarks.visitors`.'''
+
+    def test_same_info(self):
+        '''Gather the same information with either way of visiting.'''
+        module = astroid.parse(synthetic.make_module(20))
+
+        accept = visitors.AcceptVisitor()
+        accept.dispatch(module)
+        dispatch = visit.Visitor()
+        dispatch.dispatch(module)
+
+        self.assertEqual(dict(accept.functions), dict(dispatch.functions))
+
+    def test_run(self):
+        '''Time both ways of visiting, for every size.'''
+        results = visitors.run(sizes=(5, 10), repeat=1)
+
+        self.assertEqual([5, 10], sorted(results))
+
+        for summary in results.values():
+            self.assertEqual(['accept', 'dispatch', 'speedup'], sorted(summary))
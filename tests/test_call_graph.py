@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''Make sure that the functions which call each other are ordered correctly.'''
+
+# IMPORT STANDARD LIBRARIES
+import textwrap
+
+# IMPORT THIRD-PARTY LIBRARIES
+import astroid
+
+# IMPORT AUTO-DOCSTING LIBRARIES
+from auto_docstring.parsing import call_graph
+
+# IMPORT LOCAL LIBRARIES
+from . import common
+
+
+class ComponentsTestCase(common.CommonTestCase):
+
+    '''Test :func:`auto_docstring.parsing.call_graph.get_strongly_connected_components`.'''
+
+    def test_chain(self):
+        '''Give each called node before the node that calls it.'''
+        graph = {'foo': ['bar'], 'bar': ['fizz'], 'fizz': []}
+
+        self.assertEqual(
+            [['fizz'], ['bar'], ['foo']],
+            call_graph.get_strongly_connected_components(graph),
+        )
+
+    def test_cycle(self):
+        '''Group nodes that point to each other.'''
+        graph = {'foo': ['bar'], 'bar': ['fizz', 'buzz'], 'fizz': ['bar'], 'buzz': ['buzz']}
+        components = call_graph.get_strongly_connected_components(graph)
+
+        self.assertEqual(
+            [['buzz'], ['bar', 'fizz'], ['foo']],
+            [sorted(group) for group in components],
+        )
+
+    def test_missing(self):
+        '''Ignore nodes that aren't in the graph.'''
+        graph = {'foo': ['some_other_node']}
+
+        self.assertEqual([['foo']], call_graph.get_strongly_connected_components(graph))
+
+    def test_long_chain(self):
+        '''Order a chain that is longer than Python's recursion limit.'''
+        count = 5000
+        graph = {index: [index + 1] for index in range(count)}
+        graph[count] = []
+
+        components = call_graph.get_strongly_connected_components(graph)
+
+        self.assertEqual([[index] for index in reversed(range(count + 1))], components)
+
+
+class CallGraphTestCase(common.CommonTestCase):
+
+    '''Test :func:`auto_docstring.parsing.call_graph.get_call_graph`.'''
+
+    def test_return_calls(self):
+        '''Only follow the calls that make a function's return values.'''
+        module = astroid.parse(textwrap.dedent(
+            '''
+            def foo():
+                fizz()
+                return [bar(), bar()]
+
+            def bar():
+                return lambda: foo()
+
+            def fizz():
+                return os.path.join(bar())
+            '''))
+        foo, bar, fizz = module.body
+        functions = {function.name: function for function in module.body}
+        graph = call_graph.get_call_graph(functions, lambda node: node.name)
+
+        self.assertEqual([foo, bar, fizz], list(graph))
+        self.assertEqual([bar], graph[foo])
+        self.assertEqual([], graph[bar])
+        self.assertEqual([bar], graph[fizz])
+
+    def test_yield_calls(self):
+        '''Only follow the calls that make a generator's yielded values.'''
+        module = astroid.parse(textwrap.dedent(
+            '''
+            def foo():
+                yield bar()
+                fizz()
+
+                def inner():
+                    yield fizz()
+            '''))
+        functions = {name: name for name in ('bar', 'fizz')}
+        calls = call_graph.get_yield_calls(module.body[0])
+
+        self.assertEqual(['bar'], call_graph.get_callees(calls, functions, lambda node: node.name))
@@ -5,6 +5,10 @@
 import textwrap
 import os
 
+# IMPORT AUTO-DOCSTING LIBRARIES
+from auto_docstring.config import environment
+from auto_docstring import docstring_builder
+
 # IMPORT LOCAL LIBRARIES
 from . import common
 
@@ -456,3 +460,64 @@ class MarkupTestCase(ConfigCommonTestCase):
             '''
 
         self.compare(new_tags_output, self.simple_code)
+
+
+class SnapshotTestCase(ConfigCommonTestCase):
+
+    '''Test :class:`auto_docstring.config.environment.Config`.'''
+
+    def test_frozen(self):
+        '''Stop a resolved config from being changed.'''
+        config = environment.get_config()
+
+        with self.assertRaises(AttributeError):
+            config.foo = 'bar'
+
+    def test_resolved_once(self):
+        '''Keep the settings that were resolved, even if the environment changes.'''
+        os.environ['AUTO_DOCSTRING_INDENT'] = '  '
+        os.environ['AUTO_DOCSTRING_BLOCK_ORDER'] = 'google:returns,args:'
+        config = environment.get_config()
+
+        os.environ['AUTO_DOCSTRING_INDENT'] = '\t'
+        os.environ['AUTO_DOCSTRING_BLOCK_ORDER'] = 'args'
+
+        with environment.use_config(config):
+            self.assertEqual('  ', environment.get_default_indent())
+            self.assertEqual(('returns', 'args'), environment.get_block_order('google'))
+            self.assertEqual(('parameters', 'raises', 'returns'),
+                             environment.get_block_order('numpy'))
+
+            # Settings which were never resolved still use their defaults
+            self.assertEqual('"""', environment.get_docstring_delimiter())
+
+        self.assertEqual('\t', environment.get_default_indent())
+        self.assertEqual(('args', ), environment.get_block_order('google'))
+
+    def test_explicit(self):
+        '''Draw a docstring with a config that was given, instead of the environment.'''
+        code = textwrap.dedent(
+            '''
+            def foo(arg1):
+
+                return 8
+            ''')
+
+        os.environ['AUTO_DOCSTRING_BLOCK_ORDER'] = 'args'
+        os.environ['AUTO_DOCSTRING_INDENT'] = '  '
+        config = environment.get_config()
+        os.environ.clear()
+
+        expected_output = textwrap.dedent(
+            '''\
+            {1!f}.
+
+            Args:
+              arg1 ({2!f}): {3!f}.
+
+            ''')
+
+        self.assertEqual(
+            expected_output,
+            docstring_builder.create_docstring(code, row=2, style='google', config=config),
+        )
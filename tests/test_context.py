@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''Make sure that contexts keep their settings away from each other.'''
+
+# IMPORT STANDARD LIBRARIES
+import textwrap
+import threading
+
+# IMPORT AUTO-DOCSTING LIBRARIES
+from auto_docstring.config import environment
+from auto_docstring.config import context
+from auto_docstring.defaults import registry
+from auto_docstring import docstring_builder
+import auto_docstring
+
+# IMPORT LOCAL LIBRARIES
+from . import common
+
+
+class ContextTestCase(common.CommonTestCase):
+
+    '''Test :mod:`auto_docstring.config.context`.'''
+
+    def setUp(self):
+        '''Create some code whose docstring depends on the registry.'''
+        super(ContextTestCase, self).setUp()
+        self.code = textwrap.dedent(
+            '''
+            import os
+
+            def foo(bar):
+
+                return os.getcwd()
+            ''')
+
+    def test_copy(self):
+        '''Start a new context with the settings of the current context.'''
+        project = auto_docstring.create_context()
+
+        self.assertEqual(environment.get_style_names(), sorted(project.styles))
+
+        with project.activate():
+            self.assertIs(project, context.get_current_context())
+            self.assertEqual(
+                ['epydoc', 'google', 'numpy', 'sphinx'], environment.get_style_names())
+
+        self.assertIs(context.get_default_context(), context.get_current_context())
+
+    def test_registry(self):
+        '''Only use a registered default value in the context that registered it.'''
+        import os
+
+        project = auto_docstring.create_context()
+
+        with project.activate():
+            auto_docstring.register(os.getcwd, returns='str')
+            self.assertEqual('str', registry.get_default(os.getcwd)(None))
+
+        self.assertIsNone(registry.get_default(os.getcwd))
+        self.assertNotEqual(
+            project.generation, context.get_default_context().generation)
+
+    def test_presets(self):
+        '''Load the preset default values into every new context.'''
+        import os
+
+        project = context.Context()
+
+        with project.activate():
+            self.assertIsNotNone(registry.get_default(os.getenv))
+
+    def test_create_docstring(self):
+        '''Create docstrings for two contexts with different settings.'''
+        import os
+
+        project = auto_docstring.create_context()
+
+        with project.activate():
+            auto_docstring.register(os.getcwd, returns='str')
+            environment.register_config_entry('indent', lambda: '  ')
+
+        expected = textwrap.dedent(
+            '''\
+            {1!f}.
+
+            Args:
+              bar ({2!f}): {3!f}.
+
+            Returns:
+              {4:str!f}: {5!f}.
+
+            ''')
+
+        self.assertEqual(
+            expected,
+            docstring_builder.create_docstring(self.code, row=4, style='google', context=project),
+        )
+
+        expected = textwrap.dedent(
+            '''\
+            {1!f}.
+
+            Args:
+                bar ({2!f}): {3!f}.
+
+            Returns:
+                {4:<os.getcwd>!f}: {5!f}.
+
+            ''')
+
+        self.assertEqual(
+            expected, docstring_builder.create_docstring(self.code, row=4, style='google'))
+
+    def test_threads(self):
+        '''Create docstrings in many threads, each with its own context.'''
+        results = dict()
+        errors = []
+
+        def create(delimiter):
+            try:
+                project = auto_docstring.create_context()
+
+                with project.activate():
+                    environment.register_config_entry('delimiter', lambda: delimiter)
+
+                for _ in range(5):
+                    results.setdefault(delimiter, set()).add(
+                        docstring_builder.create_docstring(
+                            self.code, row=4, style='google', wrap=True, context=project))
+            except Exception as error:  # pylint: disable=broad-except
+                errors.append(error)
+
+        threads = [threading.Thread(target=create, args=(delimiter, ))
+                   for delimiter in ('"""', "'''")]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([], errors)
+        self.assertEqual(sorted(['"""', "'''"]), sorted(results))
+
+        for delimiter, docstrings in results.items():
+            self.assertEqual(1, len(docstrings))
+            docstring = docstrings.pop()
+            self.assertTrue(docstring.startswith(delimiter))
+            self.assertTrue(docstring.endswith(delimiter))
@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''Make sure that a docstring's time budget skips types instead of blocking.'''
+
+# IMPORT STANDARD LIBRARIES
+import threading
+import textwrap
+import os
+
+# IMPORT AUTO-DOCSTING LIBRARIES
+from auto_docstring import docstring_builder
+from auto_docstring.config import common as config_common
+from auto_docstring.config import budget
+from auto_docstring import profiler
+
+# IMPORT LOCAL LIBRARIES
+from . import common
+
+
+class BudgetTestCase(common.CommonTestCase):
+
+    '''Test :mod:`auto_docstring.config.budget`.'''
+
+    def test_no_limit(self):
+        '''Never run out of time if no time budget is given.'''
+        with budget.limit(None):
+            self.assertFalse(budget.expired())
+            budget.check()
+
+    def test_expired(self):
+        '''Stop once the time budget has run out.'''
+        with budget.limit(0):
+            self.assertTrue(budget.expired())
+
+            with self.assertRaises(budget.DeadlineExceeded):
+                budget.check()
+
+        self.assertFalse(budget.expired())
+
+
+class DeadlineTestCase(common.CommonTestCase):
+
+    '''Create docstrings whose time budget has already run out.'''
+
+    def setUp(self):
+        '''Create some code whose types need to be inferred.'''
+        super(DeadlineTestCase, self).setUp()
+        self.code = textwrap.dedent(
+            '''
+            import textwrap
+            import os
+
+            def foo(bar=8, fizz=os.getcwd()):
+
+                return textwrap.dedent(fizz)
+            ''')
+
+    def test_deadline(self):
+        '''Leave any inferred type empty once the time budget runs out.'''
+        expected = textwrap.dedent(
+            '''\
+            $1.
+
+            Args:
+                bar (${2:int}, optional): $3.
+                fizz ($4, optional): $5.
+
+            Returns:
+                $6: $7.
+
+            ''')
+
+        self.assertEqual(
+            expected,
+            docstring_builder.create_ultisnips_docstring(
+                self.code, row=5, style='google', deadline=0),
+        )
+
+    def test_deadline_environment(self):
+        '''Read the time budget from the user's environment.'''
+        os.environ['AUTO_DOCSTRING_TIME_BUDGET'] = '0'
+
+        self.assertEqual(
+            docstring_builder.create_docstring(self.code, row=5, style='sphinx', deadline=0),
+            docstring_builder.create_docstring(self.code, row=5, style='sphinx'),
+        )
+
+
+class CancelTestCase(common.CommonTestCase):
+
+    '''Stop the whole docstring once its event is set.'''
+
+    def setUp(self):
+        '''Create some code whose types need to be inferred and an event that is already set.'''
+        super(CancelTestCase, self).setUp()
+        self.code = textwrap.dedent(
+            '''
+            import os
+
+            def foo(bar=8, fizz=os.getcwd()):
+
+                return os.path.join(fizz, bar)
+            ''')
+        self.event = threading.Event()
+        self.event.set()
+
+    def tearDown(self):
+        '''Stop recording stages.'''
+        super(CancelTestCase, self).tearDown()
+        profiler.disable()
+
+    def test_check(self):
+        '''Raise an exception that blocks don't mistake for a skipped type.'''
+        with budget.limit(event=self.event):
+            self.assertTrue(budget.expired())
+
+            with self.assertRaises(budget.Cancelled):
+                budget.check()
+
+    def test_skip_stages(self):
+        '''Don't parse, draw or numberify a docstring that was already cancelled.'''
+        profiler.enable()
+
+        with budget.limit(event=self.event):
+            with self.assertRaises(budget.Cancelled):
+                docstring_builder.create_ultisnips_docstring(self.code, row=4, style='google')
+
+        self.assertEqual(dict(), profiler.get_stats())
+
+    def test_stop_drawing(self):
+        '''Stop drawing at the first type instead of skipping every type.'''
+        session = docstring_builder.DocstringSession()
+        node = session.get_node(self.code, 4)
+        info = session.get_function_info(self.code, node)
+        style = config_common.create_code_style('google')
+
+        with budget.limit(event=self.event):
+            with self.assertRaises(budget.Cancelled):
+                style.draw(info)
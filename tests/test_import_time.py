@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''Make sure that importing auto_docstring stays fast.
+
+Wall-clock time depends too much on the machine to test directly, so
+these tests check that the slow modules aren't imported, instead. The time
+itself is compared against a baseline by :mod:`auto_docstring.benchmarks.run`.
+
+'''
+
+# IMPORT STANDARD LIBRARIES
+import subprocess
+import unittest
+import json
+import sys
+import os
+
+# IMPORT AUTO-DOCSTING LIBRARIES
+import auto_docstring
+
+
+_SCRIPT = '''\
+import json
+import sys
+
+import auto_docstring
+
+sys.stdout.write(json.dumps({'modules': sorted(sys.modules)}))
+'''
+
+
+class ImportTimeTestCase(unittest.TestCase):
+
+    '''Import auto_docstring in a new process and check what it imported.'''
+
+    @classmethod
+    def setUpClass(cls):
+        '''Import auto_docstring once, in a new Python process.'''
+        root = os.path.dirname(os.path.dirname(os.path.abspath(auto_docstring.__file__)))
+        environment = {'PYTHONPATH': os.pathsep.join([root] + sys.path)}
+
+        output = subprocess.check_output([sys.executable, '-c', _SCRIPT], env=environment)
+        cls.results = json.loads(output.decode('utf-8'))
+
+    def test_lazy_modules(self):
+        '''Do not import styles, blocks, presets or astroid until they are used.'''
+        prefix = auto_docstring.__name__ + '.'
+        lazy_modules = ('styles.', 'blocks.', 'defaults.presets.', 'docstring_builder')
+
+        for name in self.results['modules']:
+            self.assertNotIn(name, ('astroid', 'pyparsing'))
+
+            if name.startswith(prefix):
+                self.assertFalse(name[len(prefix):].startswith(lazy_modules), name)
+
+    def test_registered_styles(self):
+        '''Register every built-in style, by name.'''
+        self.assertEqual(
+            ['epydoc', 'google', 'numpy', 'sphinx'],
+            sorted(auto_docstring.get_all_style_info()),
+        )
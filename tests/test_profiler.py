@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''Make sure that each stage of creating a docstring can be timed.'''
+
+# IMPORT STANDARD LIBRARIES
+import textwrap
+import json
+import os
+
+# IMPORT AUTO-DOCSTING LIBRARIES
+from auto_docstring import docstring_builder
+from auto_docstring import profiler
+
+# IMPORT LOCAL LIBRARIES
+from . import common
+
+
+class ProfilerTestCase(common.CommonTestCase):
+
+    '''Record the stages of :func:`auto_docstring.docstring_builder.create_docstring`.'''
+
+    def setUp(self):
+        '''Create some code to make docstrings for.'''
+        super(ProfilerTestCase, self).setUp()
+        self.code = textwrap.dedent(
+            '''
+            def foo(bar):
+
+                return 8
+            ''')
+
+    def tearDown(self):
+        '''Stop recording stages.'''
+        super(ProfilerTestCase, self).tearDown()
+        profiler.disable()
+        profiler.clear()
+
+    def test_disabled(self):
+        '''Do not record anything unless the profiler is enabled.'''
+        profiler.clear()
+        docstring_builder.create_docstring(self.code, row=2)
+
+        self.assertEqual(dict(), profiler.get_stats())
+
+    def test_stages(self):
+        '''Record every stage and block.'''
+        # Otherwise, the second call re-uses the first call's docstring
+        os.environ['AUTO_DOCSTRING_RESULT_CACHE_SIZE'] = '0'
+
+        profiler.enable()
+        docstring_builder.create_ultisnips_docstring(self.code, row=2)
+        docstring_builder.create_ultisnips_docstring(self.code, row=2)
+
+        stats = profiler.get_stats()
+
+        for name in ('parse', 'get_info', 'get_closest_docstring_node', 'draw',
+                     'draw.google.args', 'draw.google.returns', 'numberify',
+                     'convert_to_ultisnips'):
+            self.assertEqual(2, stats[name]['calls'], name)
+
+    def test_dump_json(self):
+        '''Write the recorded stages as JSON.'''
+        profiler.enable()
+        docstring_builder.create_docstring(self.code, row=2)
+
+        self.assertEqual(profiler.get_stats(), json.loads(profiler.dump_json()))
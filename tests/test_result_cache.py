@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''Make sure that generated docstrings are re-used whenever it is safe to.'''
+
+# IMPORT STANDARD LIBRARIES
+import textwrap
+import weakref
+import os
+import gc
+
+# IMPORT AUTO-DOCSTING LIBRARIES
+from auto_docstring import docstring_builder
+from auto_docstring import result_cache
+import auto_docstring
+
+# IMPORT LOCAL LIBRARIES
+from . import common
+
+
+class ResultCacheTestCase(common.CommonTestCase):
+
+    '''Test :class:`auto_docstring.result_cache.ResultCache`.'''
+
+    def test_lru(self):
+        '''Remove the item that was used the longest time ago.'''
+        cache = result_cache.ResultCache(max_size=2)
+        cache.add('foo', 'a')
+        cache.add('bar', 'b')
+        cache.get('foo')
+        cache.add('fizz', 'c')
+
+        self.assertEqual('a', cache.get('foo'))
+        self.assertIsNone(cache.get('bar'))
+        self.assertEqual('c', cache.get('fizz'))
+        self.assertEqual(
+            {'hits': 3, 'misses': 1, 'size': 2, 'max_size': 2},
+            cache.get_stats(),
+        )
+
+    def test_resize(self):
+        '''Remove the oldest items once the cache gets smaller.'''
+        cache = result_cache.ResultCache(max_size=3)
+        cache.add('foo', 'a')
+        cache.add('bar', 'b')
+        cache.resize(1)
+
+        self.assertEqual(1, len(cache))
+        self.assertEqual('b', cache.get('bar'))
+
+
+class DocstringCacheTestCase(common.CommonTestCase):
+
+    '''Re-use the docstrings of :func:`auto_docstring.docstring_builder.create_docstring`.'''
+
+    def setUp(self):
+        '''Create some code whose types need to be inferred.'''
+        super(DocstringCacheTestCase, self).setUp()
+        self.code = textwrap.dedent(
+            '''
+            import os
+
+            def get_name(value):
+                return value + 'suffix'
+
+            def foo(bar, fizz=8):
+
+                return os.path.join(get_name(bar), 'name')
+            ''')
+        self.row = 7
+        self.cache = result_cache.get_default_cache()
+
+    def test_repeat(self):
+        '''Create the same docstring twice but only draw it once.'''
+        first = docstring_builder.create_docstring(self.code, row=self.row)
+        second = docstring_builder.create_docstring(self.code, row=self.row)
+
+        self.assertEqual(first, second)
+        self.assertEqual(1, self.cache.hits)
+        self.assertEqual(1, self.cache.misses)
+
+    def test_unrelated_change(self):
+        '''Re-use a docstring even if code that the function doesn't use changes.'''
+        docstring_builder.create_docstring(self.code, row=self.row)
+        code = 'import textwrap\n\n' + self.code
+        docstring_builder.create_docstring(code, row=self.row + 2)
+
+        self.assertEqual(1, self.cache.hits)
+
+    def test_dependency_change(self):
+        '''Create a new docstring if a function that is used has changed.'''
+        docstring_builder.create_docstring(self.code, row=self.row)
+        code = self.code.replace("return value + 'suffix'", 'return 8')
+        docstring_builder.create_docstring(code, row=self.row)
+
+        self.assertEqual(0, self.cache.hits)
+
+    def test_import_change(self):
+        '''Create a new docstring if an import that is used has changed.'''
+        docstring_builder.create_docstring(self.code, row=self.row)
+        code = self.code.replace('import os', 'import os.path as os')
+        docstring_builder.create_docstring(code, row=self.row)
+
+        self.assertEqual(0, self.cache.hits)
+
+    def test_style_change(self):
+        '''Create a new docstring for every style.'''
+        docstring_builder.create_docstring(self.code, row=self.row, style='google')
+        docstring_builder.create_docstring(self.code, row=self.row, style='sphinx')
+
+        self.assertEqual(0, self.cache.hits)
+
+    def test_config_change(self):
+        '''Create a new docstring once the user's settings change.'''
+        docstring_builder.create_docstring(self.code, row=self.row)
+        os.environ['AUTO_DOCSTRING_INDENT'] = '  '
+        docstring_builder.create_docstring(self.code, row=self.row)
+
+        self.assertEqual(0, self.cache.hits)
+
+    def test_registry_change(self):
+        '''Create a new docstring once a default value is registered.'''
+        docstring_builder.create_docstring(self.code, row=self.row)
+        auto_docstring.register('some_function', returns='str')
+        docstring_builder.create_docstring(self.code, row=self.row)
+
+        self.assertEqual(0, self.cache.hits)
+
+    def test_disabled(self):
+        '''Never use the cache if its size is 0.'''
+        os.environ['AUTO_DOCSTRING_RESULT_CACHE_SIZE'] = '0'
+        docstring_builder.create_docstring(self.code, row=self.row)
+        docstring_builder.create_docstring(self.code, row=self.row)
+
+        self.assertEqual(0, self.cache.hits)
+        self.assertEqual(0, self.cache.misses)
+
+    def test_deadline(self):
+        '''Never keep a docstring whose time budget ran out.'''
+        docstring_builder.create_docstring(self.code, row=self.row, deadline=0)
+
+        self.assertEqual(0, len(self.cache))
+
+    def test_garbage_collected(self):
+        '''Don't keep a parsed module alive once its docstring has been cached.'''
+        session = docstring_builder.DocstringSession()
+        docstring_builder.create_docstring(self.code, row=self.row, session=session)
+        module = weakref.ref(session.get_module(self.code))
+        del session
+        gc.collect()
+
+        self.assertEqual(1, len(self.cache))
+        self.assertIsNone(module())
@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''Test the long-running process that answers docstring requests.'''
+
+# IMPORT STANDARD LIBRARIES
+import textwrap
+import json
+
+# IMPORT THIRD-PARTY LIBRARIES
+import six
+
+# IMPORT AUTO-DOCSTING LIBRARIES
+from auto_docstring import server
+
+# IMPORT LOCAL LIBRARIES
+from . import common
+
+
+class ServerTestCase(common.CommonTestCase):
+
+    '''Send JSON-RPC requests to :class:`auto_docstring.server.DocstringServer`.'''
+
+    def setUp(self):
+        '''Create a server to send requests to.'''
+        super(ServerTestCase, self).setUp()
+        self.server = server.DocstringServer()
+        self.code = textwrap.dedent(
+            '''
+            def foo(bar):
+
+                pass
+            ''')
+
+    def _request(self, method, identifier=1, **params):
+        '''dict[str]: Send one request to the server and get its response.'''
+        request = {'jsonrpc': '2.0', 'id': identifier, 'method': method, 'params': params}
+        return json.loads(self.server.handle_line(json.dumps(request)))
+
+    def test_create_docstring(self):
+        '''Create a docstring and report how long it took.'''
+        response = self._request('create_docstring', code=self.code, row=2, buffer='foo.py')
+
+        self.assertEqual(1, response['id'])
+        self.assertEqual(
+            '{1!f}.\n\nArgs:\n    bar ({2!f}): {3!f}.\n\n',
+            response['result']['docstring'],
+        )
+        self.assertGreaterEqual(response['result']['elapsed'], 0)
+
+    def test_create_ultisnips_docstring(self):
+        '''Create an UltiSnips docstring.'''
+        response = self._request('create_ultisnips_docstring', code=self.code, row=2)
+
+        self.assertEqual('$1.\n\nArgs:\n    bar ($2): $3.\n\n', response['result']['docstring'])
+
+    def test_stats(self):
+        '''Count every request, by its method.'''
+        self._request('create_docstring', code=self.code, row=2, buffer='foo.py')
+        self._request('create_docstring', code=self.code, row=2, buffer='foo.py')
+
+        result = self._request('stats')['result']
+
+        self.assertEqual(2, result['methods']['create_docstring']['calls'])
+        self.assertEqual(['foo.py'], result['buffers'])
+
+    def test_errors(self):
+        '''Report invalid requests as JSON-RPC errors.'''
+        self.assertEqual(-32601, self._request('does_not_exist')['error']['code'])
+        self.assertEqual(-32602, self._request('create_docstring')['error']['code'])
+        self.assertEqual(-32700, json.loads(self.server.handle_line('{'))['error']['code'])
+        self.assertEqual(
+            -32602,
+            self._request('create_docstring', code=self.code, row=2, column=4)['error']['code'],
+        )
+
+    def test_invalid_params(self):
+        '''Reject params that are neither an object nor an array.'''
+        for params in ('some text', 8, None, True):
+            request = {'jsonrpc': '2.0', 'id': 1, 'method': 'stats', 'params': params}
+            response = json.loads(self.server.handle_line(json.dumps(request)))
+
+            self.assertEqual(-32602, response['error']['code'])
+
+        # Two characters would fit "code" and "row" if the text was used as an array
+        request = {'jsonrpc': '2.0', 'id': 1, 'method': 'create_docstring', 'params': 'ab'}
+        response = json.loads(self.server.handle_line(json.dumps(request)))
+        self.assertEqual(-32602, response['error']['code'])
+
+        request = {'jsonrpc': '2.0', 'id': 1, 'method': 'stats', 'params': []}
+        self.assertIn('result', json.loads(self.server.handle_line(json.dumps(request))))
+
+    def test_notification_errors(self):
+        '''Never answer a notification, even if it fails.'''
+        requests = [
+            {'jsonrpc': '2.0', 'method': 'does_not_exist'},
+            {'jsonrpc': '2.0', 'method': 'stats', 'params': 'some text'},
+            {'jsonrpc': '2.0', 'method': 'create_docstring', 'params': {'column': 4}},
+        ]
+
+        for request in requests:
+            self.assertEqual('', self.server.handle_line(json.dumps(request)))
+
+    def test_internal_type_error(self):
+        '''Report a TypeError from inside of a method as an internal error, not a bad request.'''
+        def _fail(code, row):
+            '''Fail the way a bug in the docstring pipeline would.'''
+            raise TypeError('Something went wrong while creating "{code}".'.format(code=code))
+
+        self.server._methods['create_docstring'] = _fail  # pylint: disable=protected-access
+
+        response = self._request('create_docstring', code=self.code, row=2)
+
+        self.assertEqual(-32603, response['error']['code'])
+
+    def test_stream(self):
+        '''Answer every line until the server is shut down.'''
+        requests = [
+            {'jsonrpc': '2.0', 'id': 1, 'method': 'create_docstring', 'params': {'code': self.code, 'row': 2}},
+            {'jsonrpc': '2.0', 'method': 'stats'},
+            {'jsonrpc': '2.0', 'id': 2, 'method': 'shutdown'},
+            {'jsonrpc': '2.0', 'id': 3, 'method': 'stats'},
+        ]
+        reader = six.StringIO('\n'.join(json.dumps(request) for request in requests) + '\n')
+        writer = six.StringIO()
+
+        self.server.serve_stream(reader, writer)
+
+        responses = [json.loads(line) for line in writer.getvalue().splitlines()]
+        self.assertEqual([1, 2], [response['id'] for response in responses])
@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''Make sure that parsed code is re-used between docstring requests.'''
+
+# IMPORT STANDARD LIBRARIES
+import textwrap
+import os
+
+# IMPORT AUTO-DOCSTING LIBRARIES
+from auto_docstring import docstring_builder
+from auto_docstring.parsing import syntax
+
+# IMPORT LOCAL LIBRARIES
+from . import common
+
+
+class _MultipleFunctionTestCase(common.CommonTestCase):
+
+    '''A test case whose code contains more than one function.'''
+
+    def setUp(self):
+        '''Create some code that contains more than one function.'''
+        super(_MultipleFunctionTestCase, self).setUp()
+        self.code = textwrap.dedent(
+            '''
+            def foo(bar):
+
+                return 8
+
+            def fizz():
+
+                return 'buzz'
+            ''')
+
+
+class SessionTestCase(_MultipleFunctionTestCase):
+
+    '''Test :class:`auto_docstring.docstring_builder.DocstringSession`.'''
+
+    def test_reuse_module(self):
+        '''Parse the code once and use it for every row.'''
+        session = docstring_builder.DocstringSession()
+        module = session.get_module(self.code)
+
+        docstring_builder.create_docstring(self.code, row=2, session=session)
+        docstring_builder.create_docstring(self.code, row=6, session=session)
+
+        self.assertIs(module, session.get_module(self.code))
+
+    def test_changed_code(self):
+        '''Parse the code again once its text has changed.'''
+        session = docstring_builder.DocstringSession()
+        module = session.get_module(self.code)
+
+        self.assertIsNot(module, session.get_module(self.code + '\n'))
+
+    def test_same_output(self):
+        '''Create the same docstrings with or without a session.'''
+        session = docstring_builder.DocstringSession()
+
+        for row in (2, 6, 2):
+            self.assertEqual(
+                docstring_builder.create_docstring(self.code, row=row),
+                docstring_builder.create_docstring(self.code, row=row, session=session),
+            )
+
+
+class FastPathTestCase(common.CommonTestCase):
+
+    '''Make sure that only the functions that use other names need the whole module.'''
+
+    def setUp(self):
+        '''Create code with self-contained functions and functions that use the module.'''
+        super(FastPathTestCase, self).setUp()
+        self.code = textwrap.dedent(
+            '''\
+            import os
+
+            def foo(bar, fizz=8):
+                if not bar:
+                    raise ValueError('No bar was given')
+
+                buzz = [fizz, 'thing']
+                return buzz
+
+            def get_path():
+                return os.path.join('foo', 'bar')
+
+            class Thing(object):
+                def method(self):
+                    return self.value
+
+                @staticmethod
+                def static(value=None):
+                    return {'value': value}
+            ''')
+
+    def _get_path(self, row):
+        '''str: Create a docstring at `row` and find out how its function was found.'''
+        session = docstring_builder.DocstringSession()
+        docstring_builder.create_docstring(self.code, row=row, session=session)
+
+        return session.last_path
+
+    def test_self_contained(self):
+        '''Build only the function if it uses nothing else from its module.'''
+        self.assertEqual(syntax.AST_PATH, self._get_path(4))
+        self.assertEqual(syntax.AST_PATH, self._get_path(18))
+
+    def test_module_names(self):
+        '''Build the whole module if a function uses an import, or `self`.'''
+        self.assertEqual(syntax.ASTROID_PATH, self._get_path(11))
+        self.assertEqual(syntax.ASTROID_PATH, self._get_path(14))
+
+    def test_replaced_builtin(self):
+        '''Build the whole module if it replaces a builtin that a function uses.'''
+        self.code += '\nValueError = TypeError\n'
+
+        self.assertEqual(syntax.ASTROID_PATH, self._get_path(4))
+
+    def test_same_output(self):
+        '''Create the same docstrings whether or not the fast path is allowed.'''
+        rows = (4, 11, 14, 18)
+        expected = docstring_builder.create_docstrings(self.code, rows=rows)
+
+        os.environ['AUTO_DOCSTRING_FAST_PATH'] = '0'
+
+        self.assertEqual(expected, docstring_builder.create_docstrings(self.code, rows=rows))
+
+    def test_disabled(self):
+        '''Always build the whole module if the fast path isn't allowed.'''
+        os.environ['AUTO_DOCSTRING_FAST_PATH'] = '0'
+
+        self.assertEqual(syntax.ASTROID_PATH, self._get_path(4))
+
+
+class BatchTestCase(_MultipleFunctionTestCase):
+
+    '''Test :func:`auto_docstring.docstring_builder.create_docstrings`.'''
+
+    def test_rows(self):
+        '''Create one docstring per-row, in the same order as the rows.'''
+        rows = (6, 2)
+        expected_output = [docstring_builder.create_docstring(self.code, row=row)
+                           for row in rows]
+
+        self.assertEqual(
+            expected_output,
+            docstring_builder.create_docstrings(self.code, rows=rows),
+        )
+
+    def test_no_rows(self):
+        '''Create nothing if no rows are given.'''
+        self.assertEqual([], docstring_builder.create_docstrings(self.code, rows=[]))
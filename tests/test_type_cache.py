@@ -0,0 +1,196 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''Make sure that the types of imported objects are stored between processes.'''
+
+# IMPORT STANDARD LIBRARIES
+import textwrap
+import tempfile
+import sqlite3
+import sys
+import os
+
+# IMPORT AUTO-DOCSTING LIBRARIES
+from auto_docstring import docstring_builder
+from auto_docstring import type_cache
+import auto_docstring
+
+# IMPORT LOCAL LIBRARIES
+from . import common
+
+
+class TypeCacheTestCase(common.CommonTestCase):
+
+    '''Test :mod:`auto_docstring.type_cache`.'''
+
+    def setUp(self):
+        '''Create a temporary cache file and a module to store types for.'''
+        super(TypeCacheTestCase, self).setUp()
+        self.directory = tempfile.mkdtemp()
+        self.files_folders.add(self.directory)
+        self.cache_path = os.path.join(self.directory, 'types.sqlite')
+        os.environ['AUTO_DOCSTRING_TYPE_CACHE'] = self.cache_path
+
+        self.module_path = os.path.join(self.directory, 'some_module.py')
+        with open(self.module_path, 'w') as handler:
+            handler.write('def foo():\n    pass\n')
+
+        sys.path.insert(0, self.directory)
+
+    def tearDown(self):
+        '''Close the cache file before it is deleted.'''
+        type_cache.close()
+        super(TypeCacheTestCase, self).tearDown()
+
+    def test_disabled(self):
+        '''Store nothing if no cache file was set.'''
+        del os.environ['AUTO_DOCSTRING_TYPE_CACHE']
+        type_cache.add('some_module', 'foo', 'str')
+
+        self.assertIs(type_cache.MISSING, type_cache.get('some_module', 'foo'))
+
+    def test_store(self):
+        '''Store a type and an object which has no type.'''
+        type_cache.add('some_module', 'foo', 'str')
+        type_cache.add('some_module', 'bar', None)
+
+        self.assertEqual('str', type_cache.get('some_module', 'foo'))
+        self.assertIsNone(type_cache.get('some_module', 'bar'))
+        self.assertIs(type_cache.MISSING, type_cache.get('some_module', 'fizz'))
+
+    def test_kinds(self):
+        '''Store a registered default and an inferred type of the same object, separately.'''
+        type_cache.add('some_module', 'foo', None)
+        type_cache.add('some_module', 'foo', 'str', kind=type_cache.INFERRED)
+
+        self.assertIsNone(type_cache.get('some_module', 'foo'))
+        self.assertEqual('str', type_cache.get('some_module', 'foo', kind=type_cache.INFERRED))
+
+    def test_new_process(self):
+        '''Read types that were stored by an earlier connection.'''
+        type_cache.add('some_module', 'foo', 'str')
+        type_cache.close()
+
+        self.assertEqual('str', type_cache.get('some_module', 'foo'))
+
+    def test_module_changed(self):
+        '''Ignore the stored types of a module once the module changes.'''
+        type_cache.add('some_module', 'foo', 'str')
+
+        with open(self.module_path, 'a') as handler:
+            handler.write('\n\ndef bar():\n    pass\n')
+
+        self.assertIs(type_cache.MISSING, type_cache.get('some_module', 'foo'))
+
+    def test_registry_changed(self):
+        '''Ignore the stored types once different default values are registered.'''
+        type_cache.add('some_module', 'foo', 'str')
+        auto_docstring.register('some_other_module.bar', returns='int')
+
+        self.assertIs(type_cache.MISSING, type_cache.get('some_module', 'foo'))
+
+    def test_size(self):
+        '''Remove the least-recently used types once the cache is full.'''
+        os.environ['AUTO_DOCSTRING_TYPE_CACHE_SIZE'] = '2'
+
+        for name in ('foo', 'bar', 'fizz'):
+            type_cache.add('some_module', name, 'str')
+
+        found = [name for name in ('foo', 'bar', 'fizz')
+                 if type_cache.get('some_module', name) is not type_cache.MISSING]
+
+        self.assertEqual(2, len(found))
+
+    def test_batched_access(self):
+        '''Only write the time that a type was read once a batch of reads is done.'''
+        type_cache.add('some_module', 'foo', 'str')
+        other = sqlite3.connect(self.cache_path)
+
+        try:
+            written = other.execute('SELECT accessed FROM types').fetchone()[0]
+            type_cache.get('some_module', 'foo')
+
+            self.assertEqual(written, other.execute('SELECT accessed FROM types').fetchone()[0])
+
+            type_cache.close()
+
+            self.assertLess(written, other.execute('SELECT accessed FROM types').fetchone()[0])
+        finally:
+            other.close()
+
+    def test_old_file(self):
+        '''Replace a cache file that was written by an older version.'''
+        connection = sqlite3.connect(self.cache_path)
+        connection.execute('CREATE TABLE types (file_path TEXT, name TEXT, type TEXT)')
+        connection.commit()
+        connection.close()
+
+        type_cache.add('some_module', 'foo', 'str')
+
+        self.assertEqual('str', type_cache.get('some_module', 'foo'))
+
+    def test_unknown_module(self):
+        '''Store nothing for objects whose module can't be found.'''
+        type_cache.add('not_a_real_module', 'foo', 'str')
+
+        self.assertIs(type_cache.MISSING, type_cache.get('not_a_real_module', 'foo'))
+
+    def test_create_docstring(self):
+        '''Store the type of a registered, imported object while making a docstring.'''
+        import some_module  # pylint: disable=import-error
+
+        auto_docstring.register(some_module.foo, returns='str')
+        code = textwrap.dedent(
+            '''
+            import some_module
+
+            def fizz():
+
+                return some_module.foo()
+            ''')
+
+        docstring_builder.create_docstring(code, row=4)
+
+        self.assertEqual('str', type_cache.get('some_module', 'foo'))
+
+    def test_inferred(self):
+        '''Store the inferred type of an imported object and re-use it.'''
+        with open(self.module_path, 'a') as handler:
+            handler.write('\n\nVALUE = "text"\n')
+
+        os.environ['AUTO_DOCSTRING_RESULT_CACHE_SIZE'] = '0'
+        code = textwrap.dedent(
+            '''
+            from some_module import VALUE
+
+            def fizz():
+
+                return VALUE
+            ''')
+
+        docstring_builder.create_docstring(code, row=4)
+
+        self.assertEqual('str', type_cache.get('some_module', 'VALUE', kind=type_cache.INFERRED))
+
+        type_cache.add('some_module', 'VALUE', 'bytes', kind=type_cache.INFERRED)
+
+        self.assertEqual('{1:bytes!f}: {2!f}.', docstring_builder.create_docstring(code, row=4))
+
+    def test_inferred_local_change(self):
+        '''Never use a stored type for a name which the current module re-assigns.'''
+        with open(self.module_path, 'a') as handler:
+            handler.write('\n\nVALUE = "text"\n')
+
+        type_cache.add('some_module', 'VALUE', 'bytes', kind=type_cache.INFERRED)
+        code = textwrap.dedent(
+            '''
+            from some_module import VALUE
+
+            VALUE = 8
+
+            def fizz():
+
+                return VALUE
+            ''')
+
+        self.assertEqual('{1:int!f}: {2!f}.', docstring_builder.create_docstring(code, row=6))
@@ -0,0 +1,291 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''Make sure that the function at a row is found, even if functions are nested.'''
+
+# IMPORT STANDARD LIBRARIES
+import textwrap
+import inspect
+import sys
+import re
+
+# IMPORT THIRD-PARTY LIBRARIES
+import astroid
+import six
+
+# IMPORT AUTO-DOCSTING LIBRARIES
+from auto_docstring.parsing import visit
+from auto_docstring.styles import google
+from auto_docstring import docstring_builder
+
+# IMPORT LOCAL LIBRARIES
+from . import common
+
+
+class _NestedFunctionTestCase(common.CommonTestCase):
+
+    '''A test case whose code contains nested functions and methods.'''
+
+    def setUp(self):
+        '''Create some code with nested functions and methods.'''
+        super(_NestedFunctionTestCase, self).setUp()
+        self.code = textwrap.dedent(
+            '''
+            def foo():
+                def bar():
+                    return 8
+
+                return bar()
+
+            class Fizz(object):
+                def buzz(self):
+                    def inner():
+                        pass
+
+                    return inner
+
+                def other(self):
+                    pass
+            ''')
+
+        self.module = astroid.parse(self.code)
+        self.info = visit.get_info(self.module)
+        self.functions = {
+            function.name: function for function in self.info['functions']}
+
+
+class FunctionIndexTestCase(_NestedFunctionTestCase):
+
+    '''Test :class:`auto_docstring.parsing.visit.FunctionIndex`.'''
+
+    def _get_name(self, row):
+        '''str: Get the name of the function found for `row`.'''
+        return visit.get_closest_docstring_node(row, self.info).name
+
+    def test_outer_function(self):
+        '''Find the outer function once the row is past a nested function.'''
+        self.assertEqual('foo', self._get_name(2))
+        self.assertEqual('bar', self._get_name(3))
+        self.assertEqual('foo', self._get_name(4))
+        self.assertEqual('foo', self._get_name(6))
+
+    def test_methods(self):
+        '''Find methods and the functions nested inside of them.'''
+        self.assertEqual('buzz', self._get_name(9))
+        self.assertEqual('inner', self._get_name(10))
+        self.assertEqual('buzz', self._get_name(13))
+        self.assertEqual('other', self._get_name(15))
+
+    def test_outside_functions(self):
+        '''Use the closest function above a row that no function contains.'''
+        self.assertIsNone(visit.get_closest_docstring_node(1, self.info))
+        self.assertEqual('foo', self._get_name(7))
+
+    def test_no_index(self):
+        '''Find functions even if the info has no index.'''
+        info = {'functions': self.info['functions']}
+
+        self.assertEqual('foo', visit.get_closest_docstring_node(6, info).name)
+
+    def test_nested_docstring(self):
+        '''Create the docstring of an outer function, after its nested function.'''
+        code = \
+            '''
+            def foo(arg):
+                def bar():
+                    return 8
+                {curs}
+                return 'value'
+            '''
+
+        expected_output = \
+            '''\
+            {1!f}.
+
+            Args:
+                arg ({2!f}): {3!f}.
+
+            Returns:
+                {4:str!f}: {5!f}.
+
+            '''
+
+        self.compare(expected_output, code)
+
+
+class TargetedVisitTestCase(_NestedFunctionTestCase):
+
+    '''Gather information for only the function at a row.'''
+
+    def test_same_function(self):
+        '''Find the same function as the full index, for every row inside a function.'''
+        for row in (2, 3, 4, 5, 9, 10, 11, 12, 15):
+            self.assertIs(
+                visit.get_closest_docstring_node(row, self.info),
+                visit.get_function_at_row(self.module, row),
+            )
+
+    def test_outside_functions(self):
+        '''Find nothing if no function contains the row.'''
+        for row in (1, 6, 7, 13, 16):
+            self.assertIsNone(visit.get_function_at_row(self.module, row))
+
+    def test_same_info(self):
+        '''Gather the same information as a visit of the whole module.'''
+        for name in ('foo', 'bar', 'buzz', 'inner', 'other'):
+            function = self.functions[name]
+
+            self.assertEqual(self.info['functions'][function], visit.get_function_info(function))
+
+    def test_session(self):
+        '''Only visit the functions that docstrings are created for.'''
+        session = docstring_builder.DocstringSession()
+        node = session.get_node(self.code, 3)
+
+        self.assertEqual('bar', node.name)
+        self.assertTrue(session.get_function_info(self.code, node).returns)
+        self.assertIsNone(session._info)  # pylint: disable=protected-access
+
+
+class FunctionInfoTestCase(common.CommonTestCase):
+
+    '''Test :class:`auto_docstring.parsing.visit.FunctionInfo`.'''
+
+    def setUp(self):
+        '''Gather the information of a function with every kind of block.'''
+        super(FunctionInfoTestCase, self).setUp()
+        module = astroid.parse(textwrap.dedent(
+            '''
+            def foo(bar, fizz=8, *args, **kwargs):
+                if not bar:
+                    raise ValueError('No bar was given')
+
+                return [fizz]
+            '''))
+        self.function = module.body[0]
+        self.info = visit.get_function_info(self.function)
+
+    def test_fields(self):
+        '''Store each part of the function.'''
+        self.assertEqual(('bar', ), self.info.args)
+        self.assertEqual(['fizz'], [name for name, _ in self.info.defaults])
+        self.assertEqual('args', self.info.vararg)
+        self.assertEqual('kwargs', self.info.kwarg)
+        self.assertEqual(1, len(self.info.returns))
+        self.assertEqual(1, len(self.info.raises))
+        self.assertEqual(tuple(), self.info.yields)
+        self.assertIs(self.function.parent, self.info.parent)
+
+    def test_immutable(self):
+        '''Stop the information from being changed.'''
+        with self.assertRaises(AttributeError):
+            self.info.args = ('fizz', )
+
+        with self.assertRaises(AttributeError):
+            self.info.lines = []  # pylint: disable=assigning-non-slot
+
+    def test_mapping(self):
+        '''Read the information like the dict that it used to be.'''
+        self.assertIsInstance(self.info, six.moves.collections_abc.Mapping)
+        self.assertEqual(self.info.args, self.info['args'])
+        self.assertEqual('args', self.info.get('vararg'))
+        self.assertEqual([], self.info.get('lines', []))
+        self.assertNotIn('lines', self.info)
+        self.assertEqual(list(visit.FunctionInfo.__slots__), self.info.keys())
+        self.assertEqual(dict(self.info.items()), dict(self.info))
+        self.assertFalse(hasattr(self.info, '__dict__'))
+
+        with self.assertRaises(KeyError):
+            self.info['lines']  # pylint: disable=pointless-statement
+
+    def _draw(self):
+        '''list[str]: Draw the info, without the unique number of each marker.'''
+        return [re.sub(r'\{\d+:', '{', line) for line in google.GoogleStyle.draw(self.info)]
+
+    def test_draw_many_times(self):
+        '''Draw the same information more than once and get the same lines.'''
+        expected = self._draw()
+
+        self.assertIn('Returns:', expected)
+        self.assertEqual(expected, self._draw())
+        self.assertEqual(self.info, visit.get_function_info(self.function))
+
+
+class ReturnYieldTestCase(common.CommonTestCase):
+
+    '''Make sure that returns which only make a function into a generator are skipped.'''
+
+    @staticmethod
+    def _get_info(code):
+        ''':class:`auto_docstring.parsing.visit.FunctionInfo`: Visit the first function in `code`.'''
+        function = astroid.parse(textwrap.dedent(code)).body[0]
+
+        return visit.get_function_info(function)
+
+    def test_empty_generator(self):
+        '''Skip a return and yield that only exist to make a generator.'''
+        info = self._get_info(
+            '''
+            def foo():
+                return
+                yield
+            ''')
+
+        self.assertEqual(tuple(), info.returns)
+        self.assertEqual(tuple(), info.yields)
+
+    def test_separate_blocks(self):
+        '''Keep returns and yields that are in different blocks.'''
+        info = self._get_info(
+            '''
+            def foo(bar):
+                if bar:
+                    return 8
+                else:
+                    yield 'fizz'
+            ''')
+
+        self.assertEqual(1, len(info.returns))
+        self.assertEqual(1, len(info.yields))
+
+    def test_many_returns(self):
+        '''Keep every return of a long function body.'''
+        count = 500
+        lines = ['def foo():'] + ['    return {index}'.format(index=index)
+                                  for index in range(count)]
+        info = self._get_info('\n'.join(lines))
+
+        self.assertEqual(count, len(info.returns))
+
+
+class DeepCodeTestCase(common.CommonTestCase):
+
+    '''Visit code that is nested deeper than the stack could allow for recursion.'''
+
+    def test_elif_chain(self):
+        '''Find every return in a long chain of elif statements.'''
+        count = 200
+        lines = ['def foo(value):', '    if value == 0:', '        return 0']
+
+        for index in range(1, count):
+            lines.append('    elif value == {index}:'.format(index=index))
+            lines.append('        return {index}'.format(index=index))
+
+        module = astroid.parse('\n'.join(lines))
+        function = module.body[0]
+        full_info = visit.get_info(module)
+
+        # Only leave enough room for a few frames, no matter how deep the code is
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(len(inspect.stack(0)) + 50)
+
+        try:
+            info = visit.get_function_info(function)
+            visitor = visit.Visitor()
+            visitor.dispatch(module)
+        finally:
+            sys.setrecursionlimit(limit)
+
+        self.assertEqual(count, len(info.returns))
+        self.assertEqual(info, full_info['functions'][function])
+        self.assertEqual(info, visitor.functions[function])
@@ -0,0 +1,311 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''An opt-in, on-disk cache of the types of imported objects.
+
+Finding the type of an imported object means importing its module, which
+can be slow. This module stores each found type in a single SQLite file so
+that a new Python process can re-use types found by earlier processes.
+
+To enable the cache, set the path of the cache file:
+
+```
+export AUTO_DOCSTRING_TYPE_CACHE = "~/.cache/auto_docstring/types.sqlite"
+```
+
+Each type is stored with:
+
+- The path, modification time and size of the module that defines the object.
+  If the module changes, its stored types are ignored and replaced.
+- A hash of every registered default value (see :mod:`auto_docstring.defaults.registry`).
+  If different default values are registered, other types are found.
+
+Two kinds of types are stored:
+
+- :data:`REGISTERED` - The default value that was registered for the object, if any.
+- :data:`INFERRED` - The type that astroid inferred for an object that was
+  imported with "from module import name".
+
+The time that each type was last read is written in batches, instead of
+once per-read, so that reading a type doesn't wait for the disk.
+
+Note:
+    Only types which do not depend on where the object is used are stored.
+    Objects that are registered with a callable function are never stored.
+
+'''
+
+# IMPORT STANDARD LIBRARIES
+import threading
+import sqlite3
+import atexit
+import time
+import sys
+import os
+
+# IMPORT LOCAL LIBRARIES
+from .defaults import registry
+from .config import environment
+
+
+_CONNECTION = None
+_LOCK = threading.Lock()
+MISSING = object()
+
+REGISTERED = 'registered'
+INFERRED = 'inferred'
+
+# A type that was checked but nothing was found for it
+_NO_TYPE = ''
+
+# Cache files with a different version are made again, from scratch
+_SCHEMA_VERSION = 2
+
+# Each read type and the time it was read, which haven't been written yet
+_ACCESSED = dict()
+_ACCESSED_BATCH_SIZE = 100
+
+
+def _find_module_file(module_path):
+    '''Find the source file of a module, without importing it.
+
+    Args:
+        module_path (str): The dot-separated name of the module. e.g. "os.path".
+
+    Returns:
+        str: The absolute path to the module's source file or nothing,
+             if the module isn't a plain Python file on `sys.path`.
+
+    '''
+    parts = module_path.split('.')
+
+    for root in sys.path:
+        directory = os.path.abspath(root or os.curdir)
+
+        for part in parts[:-1]:
+            directory = os.path.join(directory, part)
+
+            if not os.path.isfile(os.path.join(directory, '__init__.py')):
+                break
+        else:
+            for path in (os.path.join(directory, parts[-1] + '.py'),
+                         os.path.join(directory, parts[-1], '__init__.py')):
+                if os.path.isfile(path):
+                    return path
+
+    return ''
+
+
+def _get_file_signature(path):
+    '''str: Describe the current state of the file at `path`.'''
+    stat = os.stat(path)
+    return '{mtime!r}:{size}'.format(mtime=stat.st_mtime, size=stat.st_size)
+
+
+def _get_connection():
+    '''Open the cache file that the user has set, if any.
+
+    Returns:
+        `sqlite3.Connection` or NoneType: The open cache file.
+
+    '''
+    global _CONNECTION  # pylint: disable=global-statement
+
+    path = environment.get_type_cache_path()
+
+    if not path:
+        return None
+
+    path = os.path.abspath(os.path.expanduser(path))
+
+    if _CONNECTION is not None and _CONNECTION[0] == path:
+        return _CONNECTION[1]
+
+    close()
+
+    directory = os.path.dirname(path)
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+
+    connection = sqlite3.connect(path, check_same_thread=False)
+
+    if connection.execute('PRAGMA user_version').fetchone()[0] != _SCHEMA_VERSION:
+        connection.execute('DROP TABLE IF EXISTS types')
+        connection.execute('PRAGMA user_version = {version}'.format(version=_SCHEMA_VERSION))
+
+    connection.execute(
+        'CREATE TABLE IF NOT EXISTS types ('
+        'file_path TEXT, '
+        'name TEXT, '
+        'registry TEXT, '
+        'kind TEXT, '
+        'signature TEXT, '
+        'type TEXT, '
+        'accessed REAL, '
+        'PRIMARY KEY (file_path, name, registry, kind))'
+    )
+    connection.commit()
+
+    _CONNECTION = (path, connection)
+
+    return connection
+
+
+def is_enabled():
+    '''bool: If the user has set a cache file.'''
+    return bool(environment.get_type_cache_path())
+
+
+def _write_accessed(connection):
+    '''Write the time that each type was last read to the cache file, without committing.'''
+    if not _ACCESSED:
+        return
+
+    connection.executemany(
+        'UPDATE types SET accessed = ? '
+        'WHERE file_path = ? AND name = ? AND registry = ? AND kind = ?',
+        [(accessed, ) + key for key, accessed in _ACCESSED.items()],
+    )
+    _ACCESSED.clear()
+
+
+def close():
+    '''Close the cache file, if it is open.'''
+    global _CONNECTION  # pylint: disable=global-statement
+
+    if _CONNECTION is None:
+        return
+
+    connection = _CONNECTION[1]
+    _CONNECTION = None
+
+    try:
+        _write_accessed(connection)
+        connection.commit()
+    finally:
+        connection.close()
+
+
+def get(module_path, name, kind=REGISTERED):
+    '''Find the stored type of an imported object.
+
+    Args:
+        module_path (str): The dot-separated name of the module that defines the object.
+        name (str): The name of the object in the module.
+        kind (:obj:`str`, optional): :data:`REGISTERED` or :data:`INFERRED`.
+
+    Returns:
+        str or NoneType or object:
+            The stored type or None, if it was stored that the object has no type.
+            If nothing is stored (or the cache is disabled), return :data:`MISSING`.
+
+    '''
+    with _LOCK:
+        connection = _get_connection()
+
+        if connection is None:
+            return MISSING
+
+        path = _find_module_file(module_path)
+
+        if not path:
+            return MISSING
+
+        key = (path, name, registry.get_signature(), kind)
+        row = connection.execute(
+            'SELECT signature, type FROM types '
+            'WHERE file_path = ? AND name = ? AND registry = ? AND kind = ?',
+            key,
+        ).fetchone()
+
+        if row is None:
+            return MISSING
+
+        signature, type_ = row
+
+        if signature != _get_file_signature(path):
+            # The module changed since this type was stored so it can't be used
+            _ACCESSED.pop(key, None)
+            connection.execute(
+                'DELETE FROM types WHERE file_path = ? AND name = ? AND registry = ? AND kind = ?',
+                key,
+            )
+            connection.commit()
+
+            return MISSING
+
+        _ACCESSED[key] = time.time()
+
+        if len(_ACCESSED) >= _ACCESSED_BATCH_SIZE:
+            _write_accessed(connection)
+            connection.commit()
+
+        if type_ == _NO_TYPE:
+            return None
+
+        return type_
+
+
+def add(module_path, name, type_, kind=REGISTERED):
+    '''Store the type of an imported object.
+
+    Once the cache is bigger than its max size, the least-recently used
+    types are removed.
+
+    Args:
+        module_path (str): The dot-separated name of the module that defines the object.
+        name (str): The name of the object in the module.
+        type_ (str or NoneType): The type of the object or None, if it has no type.
+        kind (:obj:`str`, optional): :data:`REGISTERED` or :data:`INFERRED`.
+
+    '''
+    with _LOCK:
+        connection = _get_connection()
+
+        if connection is None:
+            return
+
+        path = _find_module_file(module_path)
+
+        if not path:
+            return
+
+        if type_ is None:
+            type_ = _NO_TYPE
+
+        key = (path, name, registry.get_signature(), kind)
+        _ACCESSED.pop(key, None)
+        connection.execute(
+            'INSERT OR REPLACE INTO types VALUES (?, ?, ?, ?, ?, ?, ?)',
+            key + (_get_file_signature(path), type_, time.time()),
+        )
+
+        # The least-recently used types can only be found once every read is written
+        _write_accessed(connection)
+
+        size = connection.execute('SELECT COUNT(*) FROM types').fetchone()[0]
+        extra = size - environment.get_type_cache_size()
+
+        if extra > 0:
+            connection.execute(
+                'DELETE FROM types WHERE rowid IN '
+                '(SELECT rowid FROM types ORDER BY accessed ASC LIMIT ?)',
+                (extra, ),
+            )
+
+        connection.commit()
+
+
+def clear():
+    '''Remove every stored type.'''
+    with _LOCK:
+        connection = _get_connection()
+
+        if connection is not None:
+            _ACCESSED.clear()
+            connection.execute('DELETE FROM types')
+            connection.commit()
+
+
+atexit.register(close)
+